@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Compare the cost of computing the path of every element of wide storyboards
+with etree._ElementTree.getpath and with the memoized ScenarioIndex.get_path
+
+Run from the repository root:
+
+    python -m benchmarks.element_paths
+"""
+
+import time
+
+from lxml import etree
+
+from qc_openscenario.checks import utils
+
+
+def build_storyboard(event_count: int) -> etree._ElementTree:
+    root = etree.Element("OpenSCENARIO")
+    maneuver = etree.SubElement(
+        etree.SubElement(
+            etree.SubElement(
+                etree.SubElement(etree.SubElement(root, "Storyboard"), "Story"),
+                "Act",
+            ),
+            "ManeuverGroup",
+        ),
+        "Maneuver",
+    )
+    for i in range(event_count):
+        event = etree.SubElement(maneuver, "Event", name=f"Event{i}")
+        action = etree.SubElement(event, "Action", name=f"Action{i}")
+        etree.SubElement(action, "PrivateAction")
+
+    return root.getroottree()
+
+
+def main():
+    print(f"{'elements':>10} {'getpath (s)':>12} {'get_path (s)':>13}")
+    for event_count in (2_000, 4_000, 8_000, 16_000):
+        tree = build_storyboard(event_count)
+        elements = list(tree.getroot().iter())
+
+        start = time.perf_counter()
+        for element in elements:
+            tree.getpath(element)
+        getpath_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = utils.build_scenario_index(tree)
+        for element in elements:
+            index.get_path(element)
+        get_path_time = time.perf_counter() - start
+
+        print(f"{len(elements):>10} {getpath_time:>12.3f} {get_path_time:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Show that the unique_element_names_on_same_level check stays linear in the
+number of elements, up to storyboards of 500k elements
+
+Run from the repository root:
+
+    python -m benchmarks.unique_element_names
+"""
+
+import time
+
+from lxml import etree
+
+from qc_openscenario.checks import utils
+from qc_openscenario.checks.reference_checker import unique_element_names_on_same_level
+
+# One out of DUPLICATE_PERIOD events reuses the name of the previous one
+DUPLICATE_PERIOD = 1_000
+
+
+def build_storyboard(event_count: int) -> etree._ElementTree:
+    root = etree.Element("OpenSCENARIO")
+    story = etree.SubElement(etree.SubElement(root, "Storyboard"), "Story", name="S")
+    # Events are split among maneuvers so that both wide and deep levels are checked
+    maneuver = None
+    for i in range(event_count):
+        if i % 10_000 == 0:
+            act = etree.SubElement(story, "Act", name=f"Act{i}")
+            group = etree.SubElement(act, "ManeuverGroup", name="Group")
+            maneuver = etree.SubElement(group, "Maneuver", name="Maneuver")
+        name = f"Event{i - 1 if i % DUPLICATE_PERIOD == 1 else i}"
+        event = etree.SubElement(maneuver, "Event", name=name)
+        action = etree.SubElement(event, "Action", name="Action")
+        etree.SubElement(action, "PrivateAction")
+
+    return root.getroottree()
+
+
+def main():
+    print(f"{'elements':>10} {'duplicates':>11} {'time (s)':>9} {'us/element':>11}")
+    for event_count in (20_000, 40_000, 80_000, 166_667):
+        tree = build_storyboard(event_count)
+        element_count = sum(1 for _ in tree.getroot().iter())
+        index = utils.build_scenario_index(tree)
+
+        start = time.perf_counter()
+        duplicates = unique_element_names_on_same_level.are_names_unique_at_each_level(
+            index, tree.getroot()
+        )
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{element_count:>10} {len(duplicates):>11} {elapsed:>9.3f}"
+            f" {elapsed / element_count * 1e6:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
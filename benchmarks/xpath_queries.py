@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Compare the XPath query of the valid_parameter_declaration_in_catalogs
+checker compiled on every call by element.xpath with the precompiled one of
+qc_openscenario.checks.queries, on catalog files with many catalogs
+
+Each catalog is queried as the checker does: its parameter declarations are
+found, then the nodes using a parameter are selected.
+
+Run from the repository root:
+
+    python -m benchmarks.xpath_queries
+"""
+
+import time
+
+from lxml import etree
+
+from qc_openscenario.checks import queries
+
+ENTRIES_PER_CATALOG = 10
+
+
+def build_catalog_file(catalog_count: int) -> etree._ElementTree:
+    root = etree.Element("OpenSCENARIO")
+    definition = etree.SubElement(root, "CatalogDefinition")
+    for i in range(catalog_count):
+        catalog = etree.SubElement(definition, "Catalog", name=f"Catalog{i}")
+        for j in range(ENTRIES_PER_CATALOG):
+            vehicle = etree.SubElement(catalog, "Vehicle", name=f"Vehicle{j}")
+            declarations = etree.SubElement(vehicle, "ParameterDeclarations")
+            etree.SubElement(
+                declarations,
+                "ParameterDeclaration",
+                name="MaxSpeed",
+                parameterType="double",
+                value="70",
+            )
+            etree.SubElement(
+                etree.SubElement(vehicle, "Performance"),
+                "Dynamics",
+                maxSpeed="$MaxSpeed",
+                maxAcceleration="$MaxAcceleration",
+            )
+
+    return root.getroottree()
+
+
+def query_with_strings(catalogs):
+    for catalog in catalogs:
+        catalog.find(".//ParameterDeclarations")
+        catalog.xpath('.//*[@*[starts-with(., "$")]]')
+
+
+def query_with_queries(catalogs):
+    for catalog in catalogs:
+        catalog.find(".//ParameterDeclarations")
+        queries.NODES_WITH_PARAMETER_ATTRIBUTES(catalog)
+
+
+def main():
+    print(f"{'catalogs':>10} {'strings (s)':>12} {'compiled (s)':>13}")
+    for catalog_count in (1_000, 2_000, 4_000, 8_000):
+        tree = build_catalog_file(catalog_count)
+        catalogs = tree.getroot().findall(".//Catalog")
+
+        start = time.perf_counter()
+        query_with_strings(catalogs)
+        strings_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        query_with_queries(catalogs)
+        compiled_time = time.perf_counter() - start
+
+        print(f"{len(catalogs):>10} {strings_time:>12.3f} {compiled_time:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
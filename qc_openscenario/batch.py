@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Check many input files with one command, on a pool of worker processes
+
+Usage: qc_openscenario batch INPUTS [-c CONFIG_PATH] (-o OUTPUT_DIR | -m MERGED_REPORT) [-j JOBS]
+
+Each worker process imports the bundle and compiles the schemas once, then
+checks input files until none is left.
+"""
+
+import argparse
+import collections
+import glob
+import logging
+import os
+import sys
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+from lxml import etree
+
+from qc_baselib import Configuration
+
+from qc_openscenario import constants
+from qc_openscenario import main as bundle_main
+
+# File extensions of the input files looked up in directories
+INPUT_FILE_EXTENSIONS = (".xosc", ".xosc.gz", ".xosc.xz", ".xosc.bz2")
+REPORT_FILE_EXTENSION = ".xqar"
+
+# Configuration of the worker process, loaded once by _initialize_worker
+_worker_config: Optional[Configuration] = None
+
+
+def args_entrypoint(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="qc_openscenario batch",
+        description="Check many OpenScenario (.xosc) files on a pool of processes.",
+    )
+
+    parser.add_argument(
+        "inputs",
+        help="Directory searched recursively for input files, glob pattern, or text file listing one input file per line.",
+    )
+    parser.add_argument(
+        "-c",
+        "--config_path",
+        help="Configuration applied to every input file. Its InputFile and resultFile are ignored.",
+    )
+
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "-o",
+        "--output_dir",
+        help="Directory receiving one report per input file, following the layout of the inputs.",
+    )
+    group.add_argument(
+        "-m", "--merged_report", help="Single report gathering all the input files."
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes. Defaults to the number of CPUs.",
+    )
+
+    return parser.parse_args(argv)
+
+
+def find_input_files(inputs: str) -> List[str]:
+    """Get the input files designated by a directory, a glob pattern or a list file
+
+    Returns:
+        List[str]: the input file paths, sorted
+    """
+    if os.path.isdir(inputs):
+        input_files = [
+            os.path.join(directory, file_name)
+            for directory, _, file_names in os.walk(inputs)
+            for file_name in file_names
+            if file_name.endswith(INPUT_FILE_EXTENSIONS)
+        ]
+    elif os.path.isfile(inputs) and not inputs.endswith(INPUT_FILE_EXTENSIONS):
+        with open(inputs, "r") as list_file:
+            input_files = [line.strip() for line in list_file if line.strip()]
+    else:
+        input_files = glob.glob(inputs, recursive=True)
+
+    return sorted(input_files)
+
+
+def get_report_paths(input_files: List[str], output_dir: str) -> List[str]:
+    """Place the report of each input file in output_dir, keeping the directory layout of the inputs
+
+    Reports are named after the full name of their input file, e.g.
+    a.xosc.xqar and a.xosc.gz.xqar, so that no two input files share a report.
+    """
+    if len(input_files) == 0:
+        return []
+
+    base_dir = os.path.commonpath(
+        [os.path.dirname(os.path.abspath(x)) for x in input_files]
+    )
+    return [
+        os.path.join(
+            output_dir,
+            os.path.relpath(os.path.abspath(input_file), base_dir)
+            + REPORT_FILE_EXTENSION,
+        )
+        for input_file in input_files
+    ]
+
+
+def _initialize_worker(config_path: Optional[str]) -> None:
+    global _worker_config
+
+    _worker_config = Configuration()
+    if config_path is not None:
+        _worker_config.load_from_file(xml_file_path=config_path)
+    else:
+        _worker_config.register_checker_bundle(
+            checker_bundle_name=constants.BUNDLE_NAME
+        )
+
+    bundle_main.preload_schemas(_worker_config)
+
+
+def _check_file(input_file: str, report_path: str) -> Tuple[str, int, Optional[bool]]:
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    issue_count, cached = bundle_main.write_report(
+        bundle_main.with_input_file(_worker_config, input_file), report_path
+    )
+
+    return input_file, issue_count, cached
+
+
+def merge_reports(report_paths: List[str], merged_report_path: str) -> None:
+    """Gather the checker bundles of several reports in a single report
+
+    Issue ids are renumbered so that they stay unique in the merged report.
+    """
+    merged_root = None
+    for report_path in report_paths:
+        root = etree.parse(report_path).getroot()
+        if merged_root is None:
+            merged_root = root
+        else:
+            merged_root.extend(root.iterchildren("CheckerBundle"))
+
+    if merged_root is None:
+        return
+
+    for issue_id, issue in enumerate(merged_root.iter("Issue")):
+        issue.set("issueId", str(issue_id))
+
+    merged_root.getroottree().write(
+        merged_report_path,
+        pretty_print=True,
+        xml_declaration=True,
+        standalone=False,
+        encoding="UTF-8",
+    )
+
+
+def check_files(
+    input_files: List[str],
+    report_paths: List[str],
+    config_path: Optional[str],
+    jobs: int,
+) -> Tuple[int, List[str]]:
+    """Check the input files on jobs worker processes, writing the report of each
+
+    The failure of the check of an input file is logged and does not stop the
+    checks of the other input files.
+
+    Returns:
+        Tuple[int, List[str]]: the total number of issues found, and the input
+            files whose check failed, without report
+    """
+    # Largest files first, so that no long check is left alone at the end
+    work = sorted(
+        zip(input_files, report_paths),
+        key=lambda x: os.path.getsize(x[0]) if os.path.exists(x[0]) else 0,
+        reverse=True,
+    )
+
+    issue_count = 0
+    failed_input_files = set()
+    # Hits and misses of the result cache, if enabled
+    cache_counts = collections.Counter()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_initialize_worker, initargs=(config_path,)
+    ) as executor:
+        futures = {
+            executor.submit(_check_file, input_file, report_path): input_file
+            for input_file, report_path in work
+        }
+        for checked_count, future in enumerate(as_completed(futures), start=1):
+            try:
+                input_file, file_issue_count, cached = future.result()
+            except Exception:
+                failed_input_files.add(futures[future])
+                logging.exception(
+                    f"[{checked_count}/{len(futures)}] {futures[future]}: check failed"
+                )
+                continue
+            issue_count += file_issue_count
+            if cached is not None:
+                cache_counts[cached] += 1
+            logging.info(
+                f"[{checked_count}/{len(futures)}] {input_file}: {file_issue_count} issue(s)"
+                + (" (cached)" if cached else "")
+            )
+
+    if cache_counts:
+        logging.info(
+            f"Result cache: {cache_counts[True]} hit(s), {cache_counts[False]} miss(es)"
+        )
+
+    # In input order, whatever the order of the checks
+    return issue_count, [x for x in input_files if x in failed_input_files]
+
+
+def main(argv: List[str]) -> None:
+    args = args_entrypoint(argv)
+
+    input_files = find_input_files(args.inputs)
+    logging.info(f"Checking {len(input_files)} input file(s)")
+
+    if args.output_dir is not None:
+        report_paths = get_report_paths(input_files, args.output_dir)
+        issue_count, failed_input_files = check_files(
+            input_files, report_paths, args.config_path, args.jobs
+        )
+    else:
+        with tempfile.TemporaryDirectory() as report_dir:
+            report_paths = [
+                os.path.join(report_dir, f"{i}{REPORT_FILE_EXTENSION}")
+                for i in range(len(input_files))
+            ]
+            issue_count, failed_input_files = check_files(
+                input_files, report_paths, args.config_path, args.jobs
+            )
+            # In input order, whatever the order of the checks
+            failed = set(failed_input_files)
+            merge_reports(
+                [
+                    report_path
+                    for input_file, report_path in zip(input_files, report_paths)
+                    if input_file not in failed
+                ],
+                args.merged_report,
+            )
+
+    logging.info(f"Done, {issue_count} issue(s) found")
+    if failed_input_files:
+        logging.error(
+            f"{len(failed_input_files)} input file(s) could not be checked: "
+            + ", ".join(failed_input_files)
+        )
+        sys.exit(1)
@@ -9,3 +9,5 @@ from . import basic_checker as basic_checker
 from . import reference_checker as reference_checker
 from . import models as models
 from . import utils as utils
+from . import expressions as expressions
+from . import queries as queries
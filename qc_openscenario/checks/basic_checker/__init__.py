@@ -4,7 +4,17 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from . import valid_xml_document as valid_xml_document
-from . import root_tag_is_openscenario as root_tag_is_openscenario
-from . import fileheader_is_present as fileheader_is_present
-from . import version_is_defined as version_is_defined
+from qc_openscenario.checks import registry
+
+# Basic checkers run on any document, whatever its version
+REQUIRED_DEFINITION_SETTING = False
+
+# Checker modules by checker id, in execution order, imported on first access
+CHECKER_MODULES = {
+    "check_asam_xosc_xml_valid_xml_document": "valid_xml_document",
+    "check_asam_xosc_xml_root_tag_is_openscenario": "root_tag_is_openscenario",
+    "check_asam_xosc_xml_fileheader_is_present": "fileheader_is_present",
+    "check_asam_xosc_xml_version_is_defined": "version_is_defined",
+}
+
+__getattr__ = registry.lazy_checker_modules(__name__, CHECKER_MODULES)
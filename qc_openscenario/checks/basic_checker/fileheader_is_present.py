@@ -5,6 +5,9 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import logging
+
+from lxml import etree
+
 from qc_baselib import IssueSeverity
 
 from qc_openscenario import constants
@@ -24,6 +27,11 @@ CHECKER_PRECONDITIONS = {
 RULE_UID = "asam.net:xosc:1.0.0:xml.fileheader_is_present"
 
 
+def retain_in_stream(element: etree._Element) -> bool:
+    """Keep FileHeader when streaming, its presence below the root is all this check reads"""
+    return element.tag == "FileHeader"
+
+
 def check_rule(checker_data: models.CheckerData) -> None:
     """
     Below the root element a tag with FileHeader must be defined.
@@ -5,6 +5,9 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import logging
+
+from lxml import etree
+
 from qc_baselib import IssueSeverity
 
 from qc_openscenario import constants
@@ -18,6 +21,11 @@ CHECKER_PRECONDITIONS = {valid_xml_document.CHECKER_ID}
 RULE_UID = "asam.net:xosc:1.0.0:xml.root_tag_is_openscenario"
 
 
+def retain_in_stream(element: etree._Element) -> bool:
+    """Only the root element is read, which is always kept by the streaming loader"""
+    return False
+
+
 def check_rule(checker_data: models.CheckerData) -> None:
     """
     The root element of a valid XML document must be OpenSCENARIO
@@ -6,6 +6,8 @@
 
 import logging
 
+from typing import Optional
+
 from lxml import etree
 
 from qc_baselib import IssueSeverity
@@ -18,17 +20,26 @@ CHECKER_PRECONDITIONS = set()
 RULE_UID = "asam.net:xosc:1.0.0:xml.valid_xml_document"
 
 
-def _is_xml_doc(file_path: str) -> tuple[bool, tuple[int, int]]:
-    try:
-        with open(file_path, "rb") as file:
-            xml_content = file.read()
-            etree.fromstring(xml_content)
-            logging.info("- It is an xml document.")
+def retain_in_stream(element: etree._Element) -> bool:
+    """Well-formedness is verified by the streaming parser itself, no element is needed"""
+    return False
+
+
+def _is_xml_doc(parse_error: Optional[Exception]) -> tuple[bool, tuple[int, int]]:
+    # The input file is parsed once in main.run_checks, only its outcome is inspected here
+    if parse_error is None:
+        logging.info("- It is an xml document.")
         return True, None
-    except etree.XMLSyntaxError as e:
-        logging.error(f"- Error: {e}")
-        logging.error(f"- Error occurred at line {e.lineno}, column {e.offset}")
-        return False, (e.lineno, e.offset)
+
+    if not isinstance(parse_error, etree.XMLSyntaxError):
+        # The file could not be read at all, report it as a checker error
+        raise parse_error
+
+    logging.error(f"- Error: {parse_error}")
+    logging.error(
+        f"- Error occurred at line {parse_error.lineno}, column {parse_error.offset}"
+    )
+    return False, (parse_error.lineno, parse_error.offset)
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -40,7 +51,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing valid_xml_document check")
 
-    is_valid, error_location = _is_xml_doc(checker_data.xml_file_path)
+    is_valid, error_location = _is_xml_doc(checker_data.input_file_xml_error)
 
     if not is_valid:
         issue_id = checker_data.result.register_issue(
@@ -6,6 +6,8 @@
 
 import logging
 
+from lxml import etree
+
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
@@ -27,6 +29,11 @@ CHECKER_PRECONDITIONS = {
 RULE_UID = "asam.net:xosc:1.0.0:xml.version_is_defined"
 
 
+def retain_in_stream(element: etree._Element) -> bool:
+    """Keep FileHeader when streaming to read its version attributes"""
+    return element.tag == "FileHeader"
+
+
 def is_unsigned_short(value: int) -> bool:
     """Helper function to check if a value is within the xsd:unsignedShort range (0-65535)."""
     try:
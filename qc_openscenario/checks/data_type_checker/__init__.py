@@ -4,8 +4,13 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from . import allowed_operators as allowed_operators
-from . import (
-    non_negative_transition_time_in_light_state_action as non_negative_transition_time_in_light_state_action,
-)
-from . import positive_duration_in_phase as positive_duration_in_phase
+from qc_openscenario.checks import registry
+
+# Checker modules by checker id, in execution order, imported on first access
+CHECKER_MODULES = {
+    "check_asam_xosc_data_type_allowed_operators": "allowed_operators",
+    "check_asam_xosc_data_type_non_negative_transition_time_in_light_state_action": "non_negative_transition_time_in_light_state_action",
+    "check_asam_xosc_positive_duration_in_phase": "positive_duration_in_phase",
+}
+
+__getattr__ = registry.lazy_checker_modules(__name__, CHECKER_MODULES)
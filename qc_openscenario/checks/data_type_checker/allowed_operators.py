@@ -7,92 +7,48 @@
 import logging
 
 from dataclasses import dataclass
-from typing import Union, Optional
+from typing import Iterator
 
 from lxml import etree
 
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
-from qc_openscenario.checks import utils, models
+from qc_openscenario.checks import expressions, models
 
 from qc_openscenario import basic_preconditions
 
-import re
-import enum
 
 CHECKER_ID = "check_asam_xosc_data_type_allowed_operators"
 CHECKER_DESCRIPTION = "Expressions in OpenSCENARIO must only use the allowed operands."
 CHECKER_PRECONDITIONS = basic_preconditions.CHECKER_PRECONDITIONS
 RULE_UID = "asam.net:xosc:1.2.0:data_type.allowed_operators"
 
-ALLOWED_OPERANDS = set()
-ALLOWED_OPERANDS.add("-")
-ALLOWED_OPERANDS.add("round")
-ALLOWED_OPERANDS.add("floor")
-ALLOWED_OPERANDS.add("ceil")
-ALLOWED_OPERANDS.add("sqrt")
-ALLOWED_OPERANDS.add("pow")
-ALLOWED_OPERANDS.add("*")
-ALLOWED_OPERANDS.add("/")
-ALLOWED_OPERANDS.add("%")
-ALLOWED_OPERANDS.add("+")
-ALLOWED_OPERANDS.add("not")
-ALLOWED_OPERANDS.add("and")
-ALLOWED_OPERANDS.add("or")
-
-
-class ExpressionMember(enum.IntEnum):
-    INVALID = 0
-    VARIABLE = 1
-    OPERATOR = 2
-    NUMBER = 3
-    PARENTHESIS = 4
-
-
-@dataclass
-class QueueNode:
-    element: etree._ElementTree
-    xpath: Optional[str]
-
 
 @dataclass
 class AttributeInfo:
+    element: etree._Element
     name: str
     value: str
-    xpath: str
-
-
-def get_all_attributes(tree: etree._ElementTree, root: etree._Element):
-    attributes = []
-    stack = [
-        QueueNode(root, tree.getpath(root))
-    ]  # Initialize stack with the root element
 
-    while stack:
-        current_node = stack.pop()
-        current_element = current_node.element
-        current_xpath = current_node.xpath
 
-        # Process attributes of the current element
-        for attr, value in current_element.attrib.items():
-            attributes.append(AttributeInfo(attr, value, current_xpath))
+def iter_expression_attributes(
+    index: models.ScenarioIndex,
+) -> Iterator[AttributeInfo]:
+    """Yield the attributes that may hold an expression, in document order
 
-        # Push children to the stack for further processing
-        stack.extend(
-            reversed(
-                [QueueNode(x, tree.getpath(x)) for x in current_element.getchildren()]
-            )
-        )
-
-    return attributes
+    Only the attribute values starting with "$" are looked at. They are
+    collected once by utils.build_scenario_index, so neither the other
+    attributes nor their paths are ever materialized.
+    """
+    for (element, name), attribute in index.resolved_attributes.items():
+        if attribute.attribute_type != models.AttributeType.PARAMETER:
+            yield AttributeInfo(element, name, attribute.raw_value)
 
 
-def filter_expressions(attribute):
-    return (
-        attribute.value.startswith("$")
-        and utils.get_attribute_type(attribute.value) != models.AttributeType.PARAMETER
-    )
+def retain_in_stream(element: etree._Element) -> bool:
+    """Keep the nodes with a "$" attribute value when streaming, only those may hold expressions"""
+    return any(value.startswith("$") for value in element.attrib.values())
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -113,57 +69,28 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing allowed_operators check")
 
-    tree = checker_data.input_file_xml_root
-    root = tree.getroot()
-    attributes = get_all_attributes(tree, root)
-    filtered_attributes = list(filter(filter_expressions, attributes))
-
-    logging.debug(f"attributes: {attributes}")
-    logging.debug(f"filtered_attributes: {filtered_attributes}")
-
-    for attribute in filtered_attributes:
-        # Remove starting "${" and trailing "}"
-        expression_candidate = attribute.value[2:-1]
-        logging.debug(f"expression_candidate: {expression_candidate}")
-
-        # Tokenize the expression using regular expressions
-        token_pattern = r"\$[A-Za-z_]\w*|\d+\.\d+|\d+|[\+\-\*/\^%()**//\{\}]|\w+"
-        tokens = re.findall(token_pattern, expression_candidate)
-
-        token_type = None
-        logging.debug(f"tokens: {tokens}")
-        for token in tokens:
-            if token.startswith("$"):
-                token_type = ExpressionMember.VARIABLE
-            elif token in ALLOWED_OPERANDS:
-                token_type = ExpressionMember.OPERATOR
-            elif re.match(r"\d+\.\d+", token) or token.isdigit():
-                token_type = ExpressionMember.NUMBER
-            elif token in ["(", ")"]:
-                token_type = ExpressionMember.PARENTHESIS
-            else:
-                token_type = ExpressionMember.INVALID
-
-            logging.debug(f"token {token} - type {token_type}")
-            if token_type is None:
-                continue
-
-            has_issue = token_type == ExpressionMember.INVALID
-            if has_issue:
-                logging.debug(f"Invalid operand {token}")
-                xpath = attribute.xpath
-
-                issue_id = checker_data.result.register_issue(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    description="Invalid operand used within expression",
-                    level=IssueSeverity.ERROR,
-                    rule_uid=RULE_UID,
-                )
-                checker_data.result.add_xml_location(
-                    checker_bundle_name=constants.BUNDLE_NAME,
-                    checker_id=CHECKER_ID,
-                    issue_id=issue_id,
-                    xpath=xpath,
-                    description=f"Invalid operand {token} used",
-                )
+    for attribute in iter_expression_attributes(checker_data.scenario_index):
+        # Parse results are shared by all the occurrences of the same expression
+        expression = expressions.parse_expression(attribute.value)
+        logging.debug(f"expression_candidate: {expression.text}")
+        logging.debug(f"tokens: {expression.tokens}")
+
+        for token in expression.invalid_tokens:
+            logging.debug(f"Invalid operand {token}")
+            # Paths are only computed for the offending attributes
+            xpath = checker_data.scenario_index.get_path(attribute.element)
+
+            issue_id = checker_data.result.register_issue(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                description="Invalid operand used within expression",
+                level=IssueSeverity.ERROR,
+                rule_uid=RULE_UID,
+            )
+            checker_data.result.add_xml_location(
+                checker_bundle_name=constants.BUNDLE_NAME,
+                checker_id=CHECKER_ID,
+                issue_id=issue_id,
+                xpath=xpath,
+                description=f"Invalid operand {token} used",
+            )
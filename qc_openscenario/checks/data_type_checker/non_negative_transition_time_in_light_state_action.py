@@ -6,6 +6,8 @@
 
 import logging
 
+from lxml import etree
+
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
@@ -23,6 +25,11 @@ RULE_UID = (
 )
 
 
+def retain_in_stream(element: etree._Element) -> bool:
+    """Keep LightStateAction nodes when streaming to check their transitionTime"""
+    return element.tag == "LightStateAction"
+
+
 def check_rule(checker_data: models.CheckerData) -> None:
     """
     Rule ID: asam.net:xosc:1.2.0:data_type.non_negative_transition_time_in_light_state_action
@@ -40,38 +47,29 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing non_negative_transition_time_in_light_state_action check")
 
-    root = checker_data.input_file_xml_root
-
-    light_state_nodes = root.findall(".//LightStateAction")
+    light_state_nodes = checker_data.scenario_index.find_all("LightStateAction")
 
     for light_state_node in light_state_nodes:
-        current_transition_time = light_state_node.get("transitionTime")
-        if current_transition_time is None:
+        transition_time = checker_data.scenario_index.get_resolved_attribute(
+            light_state_node, "transitionTime"
+        )
+        if transition_time is None:
             continue
 
-        current_transition_type = utils.get_attribute_type(current_transition_time)
+        current_transition_type = transition_time.attribute_type
         logging.debug(f"current_transition_type: {current_transition_type}")
-        if current_transition_type == models.AttributeType.EXPRESSION:
+        # Parameters and expressions are resolved once for all the checkers.
+        # If a parameter is not found or an expression cannot be evaluated, the value is None
+        current_transition_time = transition_time.value
+        # Boolean expressions have no sign either
+        if current_transition_time is None or (
+            transition_time.attribute_type == models.AttributeType.EXPRESSION
+            and not utils.is_xsd_double(current_transition_time)
+        ):
             logging.debug(
-                f"Skipping transitionTime with value {current_transition_time} since sign cannot be evaluated "
+                f"Skipping transitionTime with value {transition_time.raw_value} since sign cannot be evaluated "
             )
             continue
-        if current_transition_type == models.AttributeType.PARAMETER:
-            current_transition_param_name = current_transition_time[1:]
-            current_transition_param_value = utils.get_parameter_value_from_node(
-                root, light_state_node, current_transition_param_name
-            )
-            logging.debug(
-                f"current_transition_param_name: {current_transition_param_name}"
-            )
-            logging.debug(
-                f"current_transition_param_name: {current_transition_param_name}"
-            )
-            # Parameter value is assigned to the current_transition_time to search
-            # If parameter is not found, None is assigned to current_transition_time
-            if current_transition_param_value is None:
-                continue
-            current_transition_time = current_transition_param_value
         # Case of incomplete expression to skip
         if (
             current_transition_type == models.AttributeType.VALUE
@@ -103,7 +101,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
         has_issue = current_numeric_value < 0
 
         if has_issue:
-            xpath = root.getpath(light_state_node)
+            xpath = checker_data.scenario_index.get_path(light_state_node)
 
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
@@ -6,6 +6,8 @@
 
 import logging
 
+from lxml import etree
+
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
@@ -19,6 +21,11 @@ CHECKER_PRECONDITIONS = basic_preconditions.CHECKER_PRECONDITIONS
 RULE_UID = "asam.net:xosc:1.2.0:data_type.positive_duration_in_phase"
 
 
+def retain_in_stream(element: etree._Element) -> bool:
+    """Keep Phase nodes when streaming, their duration is the only value checked"""
+    return element.tag == "Phase"
+
+
 def check_rule(checker_data: models.CheckerData) -> None:
     """
     Rule ID: asam.net:xosc:1.2.0:data_type.positive_duration_in_phase
@@ -36,36 +43,28 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing positive_duration_in_phase check")
 
-    root = checker_data.input_file_xml_root
-
-    phase_nodes = root.findall(".//Phase")
+    phase_nodes = checker_data.scenario_index.find_all("Phase")
 
     for phase_node in phase_nodes:
-        current_duration = phase_node.get("duration")
-        logging.debug(f"current_duration: {current_duration}")
-        current_duration_type = utils.get_attribute_type(current_duration)
-
-        if current_duration is None:
+        duration = checker_data.scenario_index.get_resolved_attribute(
+            phase_node, "duration"
+        )
+        if duration is None:
             continue
-        if current_duration_type == models.AttributeType.EXPRESSION:
+
+        logging.debug(f"current_duration: {duration.raw_value}")
+        # Parameters and expressions are resolved once for all the checkers.
+        # If a parameter is not found or an expression cannot be evaluated, the value is None
+        current_duration = duration.value
+        # Boolean expressions have no sign either
+        if current_duration is None or (
+            duration.attribute_type == models.AttributeType.EXPRESSION
+            and not utils.is_xsd_double(current_duration)
+        ):
             logging.debug(
-                f"Skipping duration with value {current_duration} since sign cannot be evaluated "
+                f"Skipping duration with value {duration.raw_value} since sign cannot be evaluated "
             )
             continue
-        if current_duration_type == models.AttributeType.PARAMETER:
-            current_duration_param_name = current_duration[1:]
-            current_duration_param_value = utils.get_parameter_value_from_node(
-                root, phase_node, current_duration_param_name
-            )
-            logging.debug(f"current_duration_param_name: {current_duration_param_name}")
-            logging.debug(
-                f"current_duration_param_value: {current_duration_param_value}"
-            )
-            # Parameter value is assigned to the current_duration to search
-            # If parameter is not found, None is assigned to current_duration
-            if current_duration_param_value is None:
-                continue
-            current_duration = current_duration_param_value
 
         if not utils.is_xsd_double(current_duration):
             checker_data.result.set_checker_status(
@@ -90,7 +89,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
         has_issue = current_numeric_value < 0
 
         if has_issue:
-            xpath = root.getpath(phase_node)
+            xpath = checker_data.scenario_index.get_path(phase_node)
 
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
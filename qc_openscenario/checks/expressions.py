@@ -0,0 +1,379 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import enum
+import functools
+import math
+import re
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple, Union
+
+FUNCTIONS = {"round", "floor", "ceil", "sqrt", "pow"}
+LOGICAL_OPERATORS = {"not", "and", "or"}
+ARITHMETIC_OPERATORS = {"-", "+", "*", "/", "%"}
+ALLOWED_OPERANDS = FUNCTIONS | LOGICAL_OPERATORS | ARITHMETIC_OPERATORS
+
+# Parse results kept for the expression texts seen last
+EXPRESSION_CACHE_SIZE = 4096
+# Nested parameter values evaluated at most, to stop on circular definitions
+MAX_PARAMETER_DEPTH = 32
+
+# Numbers have no exponent, "1e5" is the number 1 followed by the invalid word
+# "e5". Characters that are no part of a number, a parameter, a word or an
+# allowed symbol make one invalid token per run, so that an operator such as
+# "==" or "<=" is a single invalid token
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>\d+\.?\d*|\.\d+)"
+    r"|(?P<variable>\$[A-Za-z_]\w*)"
+    r"|(?P<word>\w+)"
+    r"|(?P<symbol>[-+*/%(),])"
+    r"|(?P<invalid>[^\w\s$.+\-*/%(),]+|\S)"
+    r")"
+)
+
+
+class TokenType(enum.IntEnum):
+    INVALID = 0
+    VARIABLE = 1
+    OPERATOR = 2
+    NUMBER = 3
+    PARENTHESIS = 4
+    SEPARATOR = 5
+
+
+@dataclass(frozen=True)
+class Token:
+    type: TokenType
+    text: str
+
+
+@dataclass(frozen=True)
+class Number:
+    value: float
+
+
+@dataclass(frozen=True)
+class Variable:
+    # Parameter name, without the leading "$"
+    name: str
+
+
+@dataclass(frozen=True)
+class UnaryOperation:
+    operator: str
+    operand: "Node"
+
+
+@dataclass(frozen=True)
+class BinaryOperation:
+    operator: str
+    left: "Node"
+    right: "Node"
+
+
+@dataclass(frozen=True)
+class FunctionCall:
+    function: str
+    arguments: Tuple["Node", ...]
+
+
+Node = Union[Number, Variable, UnaryOperation, BinaryOperation, FunctionCall]
+
+
+@dataclass(frozen=True)
+class Expression:
+    # Expression text, without the enclosing "${" and "}"
+    text: str
+    tokens: Tuple[Token, ...]
+    # None if the expression cannot be parsed, see error
+    ast: Optional[Node]
+    error: Optional[str]
+
+    @property
+    def invalid_tokens(self) -> List[str]:
+        """Get the tokens that are neither numbers, parameters nor allowed operators, in order"""
+        return [x.text for x in self.tokens if x.type == TokenType.INVALID]
+
+
+Value = Union[float, bool]
+
+
+class ExpressionSyntaxError(ValueError):
+    pass
+
+
+class ExpressionEvaluationError(ValueError):
+    pass
+
+
+def tokenize(text: str) -> Tuple[Token, ...]:
+    """Split an expression text into classified tokens
+
+    Args:
+        text (str): the expression text, without the enclosing "${" and "}"
+
+    Returns:
+        Tuple[Token, ...]: the tokens, unknown words and characters being INVALID tokens
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        token_text = match.group(kind)
+        if kind == "number":
+            token_type = TokenType.NUMBER
+        elif kind == "variable":
+            token_type = TokenType.VARIABLE
+        elif kind == "word":
+            token_type = (
+                TokenType.OPERATOR
+                if token_text in ALLOWED_OPERANDS
+                else TokenType.INVALID
+            )
+        elif token_text in ("(", ")"):
+            token_type = TokenType.PARENTHESIS
+        elif token_text == ",":
+            token_type = TokenType.SEPARATOR
+        elif kind == "symbol":
+            token_type = TokenType.OPERATOR
+        else:
+            token_type = TokenType.INVALID
+        tokens.append(Token(token_type, token_text))
+
+    return tuple(tokens)
+
+
+class _Parser:
+    """Recursive descent parser of the OpenSCENARIO expression grammar
+
+    From the lowest to the highest precedence: or, and, not, + -, * / %,
+    unary -, then numbers, parameters, function calls and parentheses.
+    """
+
+    def __init__(self, tokens: Tuple[Token, ...]):
+        self.tokens = tokens
+        self.position = 0
+
+    def parse(self) -> Node:
+        if any(x.type == TokenType.INVALID for x in self.tokens):
+            raise ExpressionSyntaxError("Invalid tokens in expression")
+        node = self._or()
+        if self.position < len(self.tokens):
+            raise ExpressionSyntaxError(
+                f"Unexpected token {self.tokens[self.position].text}"
+            )
+        return node
+
+    def _peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position].text
+        return None
+
+    def _next(self) -> Token:
+        if self.position >= len(self.tokens):
+            raise ExpressionSyntaxError("Unexpected end of expression")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _expect(self, text: str) -> None:
+        token = self._next()
+        if token.text != text:
+            raise ExpressionSyntaxError(f"Expected {text} instead of {token.text}")
+
+    def _binary(self, operators: set, operand) -> Node:
+        node = operand()
+        while self._peek() in operators:
+            operator = self._next().text
+            node = BinaryOperation(operator, node, operand())
+        return node
+
+    def _or(self) -> Node:
+        return self._binary({"or"}, self._and)
+
+    def _and(self) -> Node:
+        return self._binary({"and"}, self._not)
+
+    def _not(self) -> Node:
+        if self._peek() == "not":
+            self._next()
+            return UnaryOperation("not", self._not())
+        return self._sum()
+
+    def _sum(self) -> Node:
+        return self._binary({"+", "-"}, self._product)
+
+    def _product(self) -> Node:
+        return self._binary({"*", "/", "%"}, self._unary)
+
+    def _unary(self) -> Node:
+        if self._peek() == "-":
+            self._next()
+            return UnaryOperation("-", self._unary())
+        return self._primary()
+
+    def _primary(self) -> Node:
+        token = self._next()
+        if token.type == TokenType.NUMBER:
+            return Number(float(token.text))
+        if token.type == TokenType.VARIABLE:
+            return Variable(token.text[1:])
+        if token.text == "(":
+            node = self._or()
+            self._expect(")")
+            return node
+        if token.text in FUNCTIONS:
+            self._expect("(")
+            arguments = [self._or()]
+            while self._peek() == ",":
+                self._next()
+                arguments.append(self._or())
+            self._expect(")")
+            return FunctionCall(token.text, tuple(arguments))
+
+        raise ExpressionSyntaxError(f"Unexpected token {token.text}")
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def parse_expression(attribute_value: str) -> Expression:
+    """Parse the expression written in an attribute value like "${...}"
+
+    Results are memoized by attribute value, the returned object must not be modified.
+
+    Args:
+        attribute_value (str): the attribute value, starting with "${" and ending with "}"
+
+    Returns:
+        Expression: the tokens and the syntax tree of the expression
+    """
+    # Remove starting "${" and trailing "}"
+    text = attribute_value[2:-1]
+    tokens = tokenize(text)
+    try:
+        return Expression(
+            text=text, tokens=tokens, ast=_Parser(tokens).parse(), error=None
+        )
+    except ExpressionSyntaxError as e:
+        return Expression(text=text, tokens=tokens, ast=None, error=str(e))
+    except RecursionError:
+        return Expression(
+            text=text, tokens=tokens, ast=None, error="Expression nested too deeply"
+        )
+
+
+def _round(value: float) -> float:
+    # Half away from zero, unlike the banker's rounding of the round builtin
+    return math.copysign(math.floor(abs(value) + 0.5), value)
+
+
+def _sqrt(value: float) -> float:
+    if value < 0:
+        raise ExpressionEvaluationError(f"Square root of negative value {value}")
+    return math.sqrt(value)
+
+
+_FUNCTION_IMPLEMENTATIONS = {
+    "round": (1, _round),
+    "floor": (1, lambda x: float(math.floor(x))),
+    "ceil": (1, lambda x: float(math.ceil(x))),
+    "sqrt": (1, _sqrt),
+    "pow": (2, math.pow),
+}
+
+
+def _parse_parameter_value(
+    value: Optional[str], lookup: Callable[[str], Optional[str]], depth: int
+) -> Value:
+    if value is None:
+        raise ExpressionEvaluationError("Parameter not declared")
+    value = value.strip()
+    if value in ("true", "false"):
+        return value == "true"
+    if value.startswith("${"):
+        expression = parse_expression(value)
+        if expression.ast is None:
+            raise ExpressionEvaluationError(expression.error)
+        return _evaluate(expression.ast, lookup, depth + 1)
+    if value.startswith("$"):
+        if depth >= MAX_PARAMETER_DEPTH:
+            raise ExpressionEvaluationError("Circular parameter definition")
+        return _parse_parameter_value(lookup(value[1:]), lookup, depth + 1)
+    try:
+        return float(value)
+    except ValueError:
+        raise ExpressionEvaluationError(f"Parameter value {value} is not a number")
+
+
+def _evaluate(node: Node, lookup: Callable[[str], Optional[str]], depth: int) -> Value:
+    if depth > MAX_PARAMETER_DEPTH:
+        raise ExpressionEvaluationError("Circular parameter definition")
+
+    if isinstance(node, Number):
+        return node.value
+    if isinstance(node, Variable):
+        return _parse_parameter_value(lookup(node.name), lookup, depth)
+    if isinstance(node, UnaryOperation):
+        operand = _evaluate(node.operand, lookup, depth)
+        if node.operator == "not":
+            return not operand
+        return -operand
+    if isinstance(node, BinaryOperation):
+        left = _evaluate(node.left, lookup, depth)
+        # and / or short-circuit like in the grammar definition
+        if node.operator == "and":
+            return bool(left) and bool(_evaluate(node.right, lookup, depth))
+        if node.operator == "or":
+            return bool(left) or bool(_evaluate(node.right, lookup, depth))
+        right = _evaluate(node.right, lookup, depth)
+        if node.operator == "+":
+            return left + right
+        if node.operator == "-":
+            return left - right
+        if node.operator == "*":
+            return left * right
+        if right == 0:
+            raise ExpressionEvaluationError("Division by zero")
+        if node.operator == "/":
+            return left / right
+        return math.fmod(left, right)
+
+    arity, function = _FUNCTION_IMPLEMENTATIONS[node.function]
+    if len(node.arguments) != arity:
+        raise ExpressionEvaluationError(
+            f"{node.function} expects {arity} arguments, {len(node.arguments)} given"
+        )
+    return function(*(_evaluate(x, lookup, depth) for x in node.arguments))
+
+
+def evaluate_expression(
+    attribute_value: str, lookup: Callable[[str], Optional[str]]
+) -> Optional[Value]:
+    """Evaluate the expression written in an attribute value like "${...}"
+
+    Only the operations of the OpenSCENARIO expression grammar are supported,
+    no Python code is ever executed.
+
+    Args:
+        attribute_value (str): the attribute value, starting with "${" and ending with "}"
+        lookup (Callable[[str], Optional[str]]): gives the declared value of a parameter
+            from its name, None if it is not declared
+
+    Returns:
+        Optional[Value]: the number or boolean value of the expression.
+            None if the expression is invalid, refers to an undeclared or non numeric
+            parameter, or its value is undefined (e.g. a division by zero)
+    """
+    expression = parse_expression(attribute_value)
+    if expression.ast is None:
+        return None
+
+    try:
+        return _evaluate(expression.ast, lookup, 0)
+    except (ExpressionEvaluationError, ArithmeticError, RecursionError, ValueError):
+        # ValueError is raised by the math functions out of their domain, e.g.
+        # pow(-8, 0.5) or floor of NaN
+        return None
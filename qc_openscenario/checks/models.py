@@ -4,25 +4,255 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from dataclasses import dataclass
+import bisect
+
+from dataclasses import dataclass, field
 from lxml import etree
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
 from qc_baselib import Configuration, Result
+from qc_openscenario.checks import expressions
+from qc_openscenario.resident_cache import ResidentCache
+
+
+class AttributeType(Enum):
+    VALUE = 0
+    EXPRESSION = 1
+    PARAMETER = 2
+
+
+@dataclass
+class ResolvedAttribute:
+    attribute_type: AttributeType
+    # Value written in the document
+    raw_value: str
+    # Value after parameter resolution. None if it cannot be resolved
+    value: Optional[str]
+
+
+@dataclass
+class RoadNetworkSummary:
+    signal_ids: Set[str]
+    controller_ids: Set[str]
+    road_ids: Set[str]
+    # (road id, lane id) pairs, lane ids are only unique within a road
+    lane_ids: Set[Tuple[str, str]]
+
+
+# Compared by identity, scopes are used as memoization keys
+@dataclass(eq=False)
+class ParameterScope:
+    """Parameters declared by one element, chained to the scope of its closest declaring ancestor"""
+
+    parameters: Dict[str, Optional[str]]
+    parent: Optional["ParameterScope"]
+
+    def lookup(self, parameter_name: str) -> Optional[str]:
+        """Get the value of the closest declaration of parameter_name. None if not declared"""
+        scope = self
+        while scope is not None:
+            if parameter_name in scope.parameters:
+                return scope.parameters[parameter_name]
+            scope = scope.parent
+
+        return None
+
+
+@dataclass
+class ScenarioIndex:
+    """Lookup tables over the input document, built in one traversal by utils.build_scenario_index
+
+    Every element list is in document order.
+    """
+
+    # Position of each element in document order
+    element_order: Dict[etree._Element, int]
+    # Position of the last descendant of each element, indexed by element position
+    subtree_end: List[int]
+    elements_by_tag: Dict[str, List[etree._Element]]
+    elements_by_attribute: Dict[str, List[etree._Element]]
+    # Children of the root Entities node. None if there is no such node
+    entities: Optional[List[etree._Element]]
+    # Storyboard elements (Story, Act, ManeuverGroup, ...) by name
+    storyboard_elements: Dict[str, List[etree._Element]]
+    # Declared parameter values by declaring element, first declaration wins
+    parameter_declarations: Dict[etree._Element, Dict[str, Optional[str]]]
+    # Scope of each element holding ParameterDeclarations
+    parameter_scopes: Dict[etree._Element, ParameterScope]
+
+    # Memoized element paths, filled by get_path
+    element_paths: Dict[etree._Element, str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Attributes whose value starts with "$", resolved by utils.build_scenario_index
+    resolved_attributes: Dict[Tuple[etree._Element, str], ResolvedAttribute] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Memoized closest parameter scope of the elements, filled by get_parameter_scope
+    element_scopes: Dict[etree._Element, Optional[ParameterScope]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Memoized expression values, keyed by attribute value and parameter scope
+    expression_values: Dict[
+        Tuple[str, Optional[ParameterScope]], Optional[expressions.Value]
+    ] = field(default_factory=dict, init=False, repr=False)
+
+    def get_path(self, element: etree._Element) -> str:
+        """Get the xpath of the element, as computed by etree._ElementTree.getpath
+
+        The path of an element is derived from the one of its parent, and the
+        paths of all the children of a parent are computed together, so the
+        overall cost grows linearly with the number of elements.
+        """
+        path = self.element_paths.get(element)
+        if path is not None:
+            return path
+
+        # Walk up to the closest ancestor with a known path, then back down
+        missing = [element]
+        parent = element.getparent()
+        while parent is not None and parent not in self.element_paths:
+            missing.append(parent)
+            parent = parent.getparent()
+        if parent is None:
+            root = missing.pop()
+            self.element_paths[root] = f"/{root.tag}"
+            parent = root
+
+        for child in reversed(missing):
+            self._set_children_paths(parent)
+            parent = child
+
+        return self.element_paths[element]
+
+    def _set_children_paths(self, parent: etree._Element) -> None:
+        parent_path = self.element_paths[parent]
+        # Comments and processing instructions are left out
+        children = list(parent.iterchildren(etree.Element))
+        tag_counts = {}
+        for child in children:
+            tag_counts[child.tag] = tag_counts.get(child.tag, 0) + 1
+
+        tag_positions = {}
+        for child in children:
+            if tag_counts[child.tag] == 1:
+                self.element_paths[child] = f"{parent_path}/{child.tag}"
+            else:
+                tag_positions[child.tag] = tag_positions.get(child.tag, 0) + 1
+                self.element_paths[child] = (
+                    f"{parent_path}/{child.tag}[{tag_positions[child.tag]}]"
+                )
+
+    def get_parameter_scope(self, element: etree._Element) -> Optional[ParameterScope]:
+        """Get the scope of the closest element declaring parameters among element and its ancestors"""
+        visited = []
+        current = element
+        scope = None
+        while current is not None:
+            if current in self.element_scopes:
+                scope = self.element_scopes[current]
+                break
+            scope = self.parameter_scopes.get(current)
+            if scope is not None:
+                break
+            visited.append(current)
+            current = current.getparent()
+
+        for visited_element in visited:
+            self.element_scopes[visited_element] = scope
+
+        return scope
+
+    def get_parameter_value(
+        self, element: etree._Element, parameter_name: str
+    ) -> Optional[str]:
+        """Get the value of parameter_name as visible from element, see utils.get_parameter_value_from_node
+
+        Returns:
+            Optional[str]: the value of the closest declaration. None if the parameter is not declared
+        """
+        scope = self.get_parameter_scope(element)
+        if scope is None:
+            return None
+
+        return scope.lookup(parameter_name)
+
+    def evaluate_expression(
+        self, element: etree._Element, attribute_value: str
+    ) -> Optional[expressions.Value]:
+        """Evaluate the expression attribute_value with the parameters visible from element
+
+        Returns:
+            Optional[expressions.Value]: see expressions.evaluate_expression
+        """
+        scope = self.get_parameter_scope(element)
+        key = (attribute_value, scope)
+        if key not in self.expression_values:
+            lookup = scope.lookup if scope is not None else lambda name: None
+            self.expression_values[key] = expressions.evaluate_expression(
+                attribute_value, lookup
+            )
+
+        return self.expression_values[key]
+
+    def get_resolved_attribute(
+        self, element: etree._Element, attribute_name: str
+    ) -> Optional[ResolvedAttribute]:
+        """Get the attribute of element after parameter resolution. None if element has no such attribute"""
+        resolved_attribute = self.resolved_attributes.get((element, attribute_name))
+        if resolved_attribute is not None:
+            return resolved_attribute
+
+        value = element.get(attribute_name)
+        if value is None:
+            return None
+
+        return ResolvedAttribute(
+            attribute_type=AttributeType.VALUE, raw_value=value, value=value
+        )
+
+    def find_all(
+        self, tag: str, within: Optional[etree._Element] = None
+    ) -> List[etree._Element]:
+        """Get the elements with the given tag, only the descendants of within if given"""
+        return self._descendants(self.elements_by_tag.get(tag, []), within)
+
+    def find_all_with_attribute(
+        self, attribute_name: str, within: Optional[etree._Element] = None
+    ) -> List[etree._Element]:
+        """Get the elements holding the given attribute, only the descendants of within if given"""
+        return self._descendants(
+            self.elements_by_attribute.get(attribute_name, []), within
+        )
+
+    def _descendants(
+        self, elements: List[etree._Element], within: Optional[etree._Element]
+    ) -> List[etree._Element]:
+        if within is None:
+            return elements
+
+        # Descendants of within are contiguous in document order
+        start = self.element_order[within]
+        first = bisect.bisect_right(elements, start, key=self.element_order.__getitem__)
+        last = bisect.bisect_right(
+            elements, self.subtree_end[start], key=self.element_order.__getitem__
+        )
+        return elements[first:last]
 
 
 @dataclass
 class CheckerData:
     xml_file_path: str
     input_file_xml_root: Optional[etree._ElementTree]
+    input_file_xml_error: Optional[Exception]
     config: Configuration
     result: Result
     schema_version: Optional[str]
-    xodr_root: Optional[etree._ElementTree]
-
-
-class AttributeType(Enum):
-    VALUE = 0
-    EXPRESSION = 1
-    PARAMETER = 2
+    scenario_index: Optional[ScenarioIndex]
+    xodr_file_path: Optional[str]
+    xodr_summary: Optional[RoadNetworkSummary]
+    # None means that every checker of the bundle runs
+    enabled_checker_ids: Optional[Set[str]]
+    # Parsed files kept between runs by a long-lived process. None to parse every file
+    resident_cache: Optional[ResidentCache] = None
@@ -4,6 +4,11 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from . import (
-    valid_parameter_declaration_in_catalogs as valid_parameter_declaration_in_catalogs,
-)
+from qc_openscenario.checks import registry
+
+# Checker modules by checker id, in execution order, imported on first access
+CHECKER_MODULES = {
+    "check_asam_xosc_parameters_valid_parameter_declaration_in_catalogs": "valid_parameter_declaration_in_catalogs",
+}
+
+__getattr__ = registry.lazy_checker_modules(__name__, CHECKER_MODULES)
@@ -10,7 +10,7 @@ import logging
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
-from qc_openscenario.checks import utils, models
+from qc_openscenario.checks import queries, utils, models
 
 from qc_openscenario import basic_preconditions
 
@@ -38,9 +38,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing valid_parameter_declaration_in_catalogs check")
 
-    root = checker_data.input_file_xml_root
-
-    catalogs_node = root.findall(".//Catalog")
+    catalogs_node = checker_data.scenario_index.find_all("Catalog")
     if catalogs_node is None:
         logging.error("Cannot find Catalog nodes in provided XOSC file. Skipping check")
 
@@ -77,19 +75,19 @@ def check_rule(checker_data: models.CheckerData) -> None:
                 ):
                     defined_parameters_with_default.add(current_name)
 
-        # Expression selecting when a node attribute value starts with $, indicating a parameter usage
-        xpath_expr = './/*[@*[starts-with(., "$")]]'
-
         logging.debug(
             f"defined_parameters_with_default: {defined_parameters_with_default}"
         )
-        nodes_with_parameters_attributes = catalog_node.xpath(xpath_expr)
+        # Nodes with an attribute value starting with $, indicating a parameter usage
+        nodes_with_parameters_attributes = queries.NODES_WITH_PARAMETER_ATTRIBUTES(
+            catalog_node
+        )
         logging.debug(
             f"nodes_with_parameters_attributes: {nodes_with_parameters_attributes}"
         )
 
         for node_with_parameter_attribute in nodes_with_parameters_attributes:
-            xpath = root.getpath(node_with_parameter_attribute)
+            xpath = checker_data.scenario_index.get_path(node_with_parameter_attribute)
 
             for attr_name, attr_value in node_with_parameter_attribute.attrib.items():
                 if (
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""XPath queries used by the checkers, compiled once at import
+
+Calling element.xpath with a string compiles the expression on every call.
+The compiled etree.XPath objects below are called with the context element
+instead, e.g. queries.PARAMETER_DECLARATIONS(element).
+
+Element lookups over the whole document should rather go through
+models.ScenarioIndex, which is built in a single traversal.
+"""
+
+from lxml import etree
+
+# ParameterDeclaration children of the context element
+PARAMETER_DECLARATIONS = etree.XPath("./ParameterDeclarations/ParameterDeclaration")
+
+# Descendants of the context element with an attribute value starting with "$",
+# i.e. a parameter usage or an expression
+NODES_WITH_PARAMETER_ATTRIBUTES = etree.XPath('.//*[@*[starts-with(., "$")]]')
@@ -4,21 +4,18 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-from . import (
-    uniquely_resolvable_entity_references as uniquely_resolvable_entity_references,
-)
-from . import (
-    resolvable_signal_id_in_traffic_signal_state_action as resolvable_signal_id_in_traffic_signal_state_action,
-)
-from . import (
-    resolvable_traffic_signal_controller_by_traffic_signal_controller_ref as resolvable_traffic_signal_controller_by_traffic_signal_controller_ref,
-)
-from . import (
-    valid_actor_reference_in_private_actions as valid_actor_reference_in_private_actions,
-)
-from . import resolvable_entity_references as resolvable_entity_references
-from . import resolvable_variable_reference as resolvable_variable_reference
-from . import (
-    resolvable_storyboard_element_reference as resolvable_storyboard_element_reference,
-)
-from . import unique_element_names_on_same_level as unique_element_names_on_same_level
+from qc_openscenario.checks import registry
+
+# Checker modules by checker id, in execution order, imported on first access
+CHECKER_MODULES = {
+    "check_asam_xosc_reference_control_uniquely_resolvable_entity_references": "uniquely_resolvable_entity_references",
+    "check_asam_xosc_reference_control_resolvable_signal_id_in_traffic_signal_state_action": "resolvable_signal_id_in_traffic_signal_state_action",
+    "check_asam_xosc_reference_control_resolvable_traffic_signal_controller_by_traffic_signal_controller_ref": "resolvable_traffic_signal_controller_by_traffic_signal_controller_ref",
+    "check_asam_xosc_reference_control_valid_actor_reference_in_private_actions": "valid_actor_reference_in_private_actions",
+    "check_asam_xosc_reference_control_resolvable_entity_references": "resolvable_entity_references",
+    "check_asam_xosc_reference_control_resolvable_variable_reference": "resolvable_variable_reference",
+    "check_asam_xosc_reference_control_resolvable_storyboard_element_reference": "resolvable_storyboard_element_reference",
+    "check_asam_xosc_reference_control_unique_element_names_on_same_level": "unique_element_names_on_same_level",
+}
+
+__getattr__ = registry.lazy_checker_modules(__name__, CHECKER_MODULES)
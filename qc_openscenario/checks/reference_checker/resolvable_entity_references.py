@@ -9,7 +9,7 @@ import logging
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
-from qc_openscenario.checks import utils, models
+from qc_openscenario.checks import models
 from qc_openscenario import basic_preconditions
 
 CHECKER_ID = "check_asam_xosc_reference_control_resolvable_entity_references"
@@ -36,9 +36,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     logging.info("Executing resolvable_entity_references check")
 
     root = checker_data.input_file_xml_root
+    index = checker_data.scenario_index
 
-    entities_node = root.find("Entities")
-    if entities_node is None:
+    if index.entities is None:
         checker_data.result.set_checker_status(
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
@@ -54,7 +54,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
         return
 
     defined_entities = set()
-    for entity_node in list(entities_node):
+    for entity_node in index.entities:
         current_name = entity_node.get("name")
         if current_name is not None:
             defined_entities.add(current_name)
@@ -76,7 +76,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
 
         return
 
-    nodes_with_entity_ref = storyboard_node.xpath(".//*[@entityRef]")
+    nodes_with_entity_ref = index.find_all_with_attribute(
+        "entityRef", within=storyboard_node
+    )
 
     for node_with_entity_ref in nodes_with_entity_ref:
         current_entity_ref = node_with_entity_ref.get("entityRef")
@@ -86,27 +88,24 @@ def check_rule(checker_data: models.CheckerData) -> None:
 
         has_issue = False
 
-        # Check if entityRef points to a declared param
-        if (
-            utils.get_attribute_type(current_entity_ref)
-            == models.AttributeType.PARAMETER
-        ):
-            current_entity_param_name = current_entity_ref[1:]
-            current_entity_param_value = utils.get_parameter_value_from_node(
-                root, node_with_entity_ref, current_entity_param_name
-            )
-            logging.debug(f"current_entity_param_name: {current_entity_param_name}")
-            logging.debug(f"current_entity_param_value: {current_entity_param_value}")
-            # Parameter value is assigned to the current_entity_ref to search
-            # If parameter is not found, None is assigned to current_entity_ref
-            current_entity_ref = current_entity_param_value
+        # Parameters are resolved once for all the checkers.
+        # If the reference cannot be resolved, None is assigned to current_entity_ref
+        entity_ref = index.get_resolved_attribute(node_with_entity_ref, "entityRef")
+        current_entity_ref = entity_ref.value
+        logging.debug(f"current_entity_ref: {current_entity_ref}")
 
         has_issue = (
             current_entity_ref is None or current_entity_ref not in defined_entities
         )
 
         if has_issue:
-            xpath = root.getpath(node_with_entity_ref)
+            xpath = index.get_path(node_with_entity_ref)
+            # Unresolved references and expressions are reported as written
+            if (
+                current_entity_ref is None
+                or entity_ref.attribute_type == models.AttributeType.EXPRESSION
+            ):
+                current_entity_ref = entity_ref.raw_value
 
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
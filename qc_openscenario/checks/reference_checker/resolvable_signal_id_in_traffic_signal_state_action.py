@@ -16,6 +16,8 @@ CHECKER_ID = "check_asam_xosc_reference_control_resolvable_signal_id_in_traffic_
 CHECKER_DESCRIPTION = "TrafficSignalStateAction:name -> Signal ID must exist within the given road network."
 CHECKER_PRECONDITIONS = basic_preconditions.CHECKER_PRECONDITIONS
 RULE_UID = "asam.net:xosc:1.2.0:reference_control.resolvable_signal_id_in_traffic_signal_state_action"
+# Outcome depends on the road network, the check runs again when only the xodr file changes
+READS_ROAD_NETWORK = True
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -35,9 +37,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing resolvable_signal_id_in_traffic_signal_state_action check")
 
-    root = checker_data.input_file_xml_root
-
-    if checker_data.xodr_root is None:
+    if checker_data.xodr_summary is None:
         checker_data.result.set_checker_status(
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
@@ -52,36 +52,17 @@ def check_rule(checker_data: models.CheckerData) -> None:
 
         return
 
-    xodr_signal_list = checker_data.xodr_root.findall(".//signal")
-
-    if xodr_signal_list is None:
-        checker_data.result.set_checker_status(
-            checker_bundle_name=constants.BUNDLE_NAME,
-            checker_id=CHECKER_ID,
-            status=StatusType.SKIPPED,
-        )
-
-        checker_data.result.add_checker_summary(
-            constants.BUNDLE_NAME,
-            CHECKER_ID,
-            "Cannot read signals from xodr file. Skip the check.",
-        )
-
-        return
-
-    xodr_signal_ids = set()
-    for xodr_signal in xodr_signal_list:
-        signal_id = xodr_signal.get("id")
-        if signal_id is not None:
-            xodr_signal_ids.add(signal_id)
+    xodr_signal_ids = checker_data.xodr_summary.signal_ids
 
-    xosc_traffic_lights = root.findall(".//TrafficSignalStateAction")
+    xosc_traffic_lights = checker_data.scenario_index.find_all(
+        "TrafficSignalStateAction"
+    )
 
     for xosc_traffic_light in xosc_traffic_lights:
         current_name = xosc_traffic_light.get("name")
 
         if current_name is not None and current_name not in xodr_signal_ids:
-            xpath = root.getpath(xosc_traffic_light)
+            xpath = checker_data.scenario_index.get_path(xosc_traffic_light)
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
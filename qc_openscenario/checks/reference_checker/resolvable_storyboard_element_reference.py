@@ -9,7 +9,7 @@ import logging
 from qc_baselib import IssueSeverity, StatusType
 
 from qc_openscenario import constants
-from qc_openscenario.checks import utils, models
+from qc_openscenario.checks import models
 
 from qc_openscenario import basic_preconditions
 
@@ -20,8 +20,6 @@ RULE_UID = (
     "asam.net:xosc:1.2.0:reference_control.resolvable_storyboard_element_reference"
 )
 
-STORYBOARD_ELEMENTS = ["Act", "Action", "Event", "Maneuver", "ManeuverGroup", " Story"]
-
 
 def check_rule(checker_data: models.CheckerData) -> None:
     """
@@ -42,6 +40,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
     logging.info("Executing resolvable_storyboard_element_reference check")
 
     root = checker_data.input_file_xml_root
+    index = checker_data.scenario_index
 
     storyboard_node = root.find("Storyboard")
     if storyboard_node is None:
@@ -58,43 +57,21 @@ def check_rule(checker_data: models.CheckerData) -> None:
         )
         return
 
-    xpath_expr = "|".join([f"//{node}" for node in STORYBOARD_ELEMENTS])
-    storyboard_elements = storyboard_node.xpath(xpath_expr)
-    if storyboard_elements is None:
-        checker_data.result.set_checker_status(
-            checker_bundle_name=constants.BUNDLE_NAME,
-            checker_id=CHECKER_ID,
-            status=StatusType.SKIPPED,
-        )
-
-        checker_data.result.add_checker_summary(
-            constants.BUNDLE_NAME,
-            CHECKER_ID,
-            "Cannot find Storyboard elements node in the provided XOSC file. Skip the check.",
-        )
-
-        return
-
     storyboard_element_type = {}
     storyboard_element_occurrences = {}
     # Store storyboard elements along with
     # - their type (for type matching)
     # - number of occurrences (for unique resolution)
-    for storyboard_element in list(storyboard_elements):
-        current_name = storyboard_element.get("name")
-        current_type = storyboard_element.tag
-        if current_name is not None:
-            if current_name not in storyboard_element_occurrences:
-                storyboard_element_occurrences[current_name] = 1
-            else:
-                storyboard_element_occurrences[current_name] += 1
-
-            storyboard_element_type[current_name] = current_type
+    for current_name, storyboard_elements in index.storyboard_elements.items():
+        storyboard_element_occurrences[current_name] = len(storyboard_elements)
+        storyboard_element_type[current_name] = storyboard_elements[-1].tag
 
     logging.debug(f"storyboard_element_type_dict: {storyboard_element_type}")
     logging.debug(f"storyboard_element_occurrences: {storyboard_element_occurrences}")
 
-    nodes_with_storyboard_el_ref = storyboard_node.xpath(".//*[@storyboardElementRef]")
+    nodes_with_storyboard_el_ref = index.find_all_with_attribute(
+        "storyboardElementRef", within=storyboard_node
+    )
 
     for node_with_storyboard_el_ref in nodes_with_storyboard_el_ref:
         current_storyboard_el_ref = node_with_storyboard_el_ref.get(
@@ -106,20 +83,13 @@ def check_rule(checker_data: models.CheckerData) -> None:
         logging.debug(f"current_storyboard_el_ref: {current_storyboard_el_ref}")
         logging.debug(f"current_storyboard_type: {current_storyboard_type}")
 
-        # Check if entityRef points to a declared param
-        if (
-            utils.get_attribute_type(current_storyboard_el_ref)
-            == models.AttributeType.PARAMETER
-        ):
-            current_entity_param_name = current_storyboard_el_ref[1:]
-            current_entity_param_value = utils.get_parameter_value_from_node(
-                root, node_with_storyboard_el_ref, current_entity_param_name
-            )
-            logging.debug(f"current_st_el_param_name: {current_entity_param_name}")
-            logging.debug(f"current_st_el_param_value: {current_entity_param_value}")
-            # Parameter value is assigned to the current_storyboard_el_ref to search
-            # If parameter is not found, None is assigned to current_storyboard_el_ref
-            current_storyboard_el_ref = current_entity_param_value
+        # Parameters are resolved once for all the checkers.
+        # If the reference cannot be resolved, None is assigned to current_storyboard_el_ref
+        storyboard_el_ref = index.get_resolved_attribute(
+            node_with_storyboard_el_ref, "storyboardElementRef"
+        )
+        current_storyboard_el_ref = storyboard_el_ref.value
+        logging.debug(f"resolved storyboard_el_ref: {current_storyboard_el_ref}")
 
         is_valid = (
             # Is found or its parameter can be resolved
@@ -134,7 +104,13 @@ def check_rule(checker_data: models.CheckerData) -> None:
         )
 
         if not is_valid:
-            xpath = root.getpath(node_with_storyboard_el_ref)
+            xpath = index.get_path(node_with_storyboard_el_ref)
+            # Unresolved references and expressions are reported as written
+            if (
+                current_storyboard_el_ref is None
+                or storyboard_el_ref.attribute_type == models.AttributeType.EXPRESSION
+            ):
+                current_storyboard_el_ref = storyboard_el_ref.raw_value
 
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
@@ -57,7 +57,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
         return
 
     # ts = traffic signal
-    ts_controllers = road_network.findall(".//TrafficSignalController")
+    ts_controllers = checker_data.scenario_index.find_all(
+        "TrafficSignalController", within=road_network
+    )
     if ts_controllers is None:
         checker_data.result.set_checker_status(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -79,12 +81,14 @@ def check_rule(checker_data: models.CheckerData) -> None:
         if current_name is not None:
             ts_controller_names.add(current_name)
 
-    ts_controller_actions = root.findall(".//TrafficSignalControllerAction")
+    ts_controller_actions = checker_data.scenario_index.find_all(
+        "TrafficSignalControllerAction"
+    )
 
     for ts_controller in ts_controller_actions:
         current_name = ts_controller.get("trafficSignalControllerRef")
         if current_name is not None and current_name not in ts_controller_names:
-            xpath = root.getpath(ts_controller)
+            xpath = checker_data.scenario_index.get_path(ts_controller)
 
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
@@ -71,12 +71,14 @@ def check_rule(checker_data: models.CheckerData) -> None:
 
         return
 
-    nodes_with_variable_ref = storyboard_node.xpath(".//*[@variableRef]")
+    nodes_with_variable_ref = checker_data.scenario_index.find_all_with_attribute(
+        "variableRef", within=storyboard_node
+    )
 
     for node_with_variable_ref in nodes_with_variable_ref:
         current_name = node_with_variable_ref.get("variableRef")
         if current_name is not None and current_name not in defined_param_variables:
-            xpath = root.getpath(node_with_variable_ref)
+            xpath = checker_data.scenario_index.get_path(node_with_variable_ref)
 
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
@@ -7,8 +7,6 @@
 import logging
 
 from dataclasses import dataclass
-from typing import Optional
-
 from lxml import etree
 
 from qc_baselib import IssueSeverity
@@ -17,7 +15,7 @@ from qc_openscenario import constants
 from qc_openscenario.checks import models
 
 from qc_openscenario import basic_preconditions
-from collections import deque, defaultdict
+from collections import deque
 
 CHECKER_ID = "check_asam_xosc_reference_control_unique_element_names_on_same_level"
 CHECKER_DESCRIPTION = "Element names at each level shall be unique at that level."
@@ -25,43 +23,36 @@ CHECKER_PRECONDITIONS = basic_preconditions.CHECKER_PRECONDITIONS
 RULE_UID = "asam.net:xosc:1.2.0:reference_control.unique_element_names_on_same_level"
 
 
-@dataclass
-class QueueNode:
-    element: etree._ElementTree
-    parent_xpath: Optional[str]
-
-
 @dataclass
 class DuplicateOccurrence:
     name: str
     xpath: str
 
 
-def are_names_unique_at_each_level(tree: etree._ElementTree, root: etree._Element):
-    # Initialize a queue for breadth-first traversal
-    queue = deque([QueueNode(root, None)])
-    levels_dict = defaultdict(set)
+def are_names_unique_at_each_level(index: models.ScenarioIndex, root: etree._Element):
+    # Breadth-first traversal, names are compared among the children of each parent
+    queue = deque([root])
 
     duplicates = []
 
     while queue:
-        queue_node = queue.popleft()
-
-        current_element = queue_node.element
-        current_name = current_element.get("name")
-        parent_xpath = queue_node.parent_xpath
-        current_xpath = tree.getpath(current_element)
-        # Check if the element has a 'name' attribute
-        if current_name is not None:
-            # Check for duplicate names at the current level
-            if current_name in levels_dict[parent_xpath]:
-                logging.debug(f"Duplicated name found : {current_name}")
-                duplicates.append(DuplicateOccurrence(current_name, current_xpath))
-            levels_dict[parent_xpath].add(current_name)
-
-        # Add children to the stack with incremented level
-        for child in current_element.getchildren():
-            queue.append(QueueNode(child, current_xpath))
+        parent = queue.popleft()
+        sibling_names = set()
+
+        # Comments and processing instructions have no name
+        for child in parent.iterchildren(etree.Element):
+            queue.append(child)
+
+            child_name = child.get("name")
+            if child_name is None:
+                continue
+            if child_name in sibling_names:
+                logging.debug(f"Duplicated name found : {child_name}")
+                # Paths are only computed for the duplicates
+                duplicates.append(
+                    DuplicateOccurrence(child_name, index.get_path(child))
+                )
+            sibling_names.add(child_name)
 
     return duplicates
 
@@ -88,7 +79,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     logging.info("Executing unique_element_names_on_same_level check")
 
     tree = checker_data.input_file_xml_root
-    duplicates_found = are_names_unique_at_each_level(tree, tree.getroot())
+    duplicates_found = are_names_unique_at_each_level(
+        checker_data.scenario_index, tree.getroot()
+    )
 
     for duplicate in duplicates_found:
         issue_id = checker_data.result.register_issue(
@@ -32,8 +32,8 @@ def get_catalogs(root: etree._ElementTree) -> List[etree._ElementTree]:
     return catalogs
 
 
-def get_xpath(root: etree._ElementTree, element: etree._ElementTree) -> str:
-    return root.getpath(element)
+def get_xpath(index: models.ScenarioIndex, element: etree._ElementTree) -> str:
+    return index.get_path(element)
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -45,13 +45,11 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing uniquely_resolvable_entity_references check")
 
-    root = checker_data.input_file_xml_root
-
     # List to store problematic nodes
     errors = []
 
     # Iterate over each 'Catalog' node
-    for catalog_node in root.findall(".//Catalog"):
+    for catalog_node in checker_data.scenario_index.find_all("Catalog"):
         # Dictionary to track child nodes by 'name' attribute
         child_names = {}
 
@@ -69,8 +67,12 @@ def check_rule(checker_data: models.CheckerData) -> None:
                         {
                             "name": name_attr,
                             "tag": child_node.tag,
-                            "first_xpath": get_xpath(root, child_names[name_attr]),
-                            "duplicate_xpath": get_xpath(root, child_node),
+                            "first_xpath": get_xpath(
+                                checker_data.scenario_index, child_names[name_attr]
+                            ),
+                            "duplicate_xpath": get_xpath(
+                                checker_data.scenario_index, child_node
+                            ),
                         }
                     )
                 else:
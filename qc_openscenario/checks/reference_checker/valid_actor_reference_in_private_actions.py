@@ -42,9 +42,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     """
     logging.info("Executing valid_actor_reference_in_private_actions check")
 
-    root = checker_data.input_file_xml_root
+    index = checker_data.scenario_index
 
-    maneuver_groups = root.findall(".//ManeuverGroup")
+    maneuver_groups = index.find_all("ManeuverGroup")
     if maneuver_groups is None:
         checker_data.result.set_checker_status(
             checker_bundle_name=constants.BUNDLE_NAME,
@@ -60,8 +60,8 @@ def check_rule(checker_data: models.CheckerData) -> None:
         return
 
     for maneuver_group in maneuver_groups:
-        private_actions = maneuver_group.findall(".//PrivateAction")
-        entity_refs = maneuver_group.findall(".//EntityRef")
+        private_actions = index.find_all("PrivateAction", within=maneuver_group)
+        entity_refs = index.find_all("EntityRef", within=maneuver_group)
 
         if private_actions is None or entity_refs is None:
             checker_data.result.set_checker_status(
@@ -84,7 +84,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
         has_issue = has_private_action and no_actor_provided
 
         if has_issue:
-            xpath = root.getpath(maneuver_group)
+            xpath = index.get_path(maneuver_group)
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
@@ -92,7 +92,7 @@ def check_rule(checker_data: models.CheckerData) -> None:
                 level=IssueSeverity.ERROR,
                 rule_uid=RULE_UID,
             )
-            private_actions_xpaths = [root.getpath(x) for x in private_actions]
+            private_actions_xpaths = [index.get_path(x) for x in private_actions]
             checker_data.result.add_xml_location(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
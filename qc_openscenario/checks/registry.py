@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Registry of the checkers of the bundle
+
+Each checker package declares its checker modules by checker id in
+CHECKER_MODULES, in execution order. Checker modules are only imported when a
+run needs them, so the registry reads the declarations without importing any
+checker.
+"""
+
+import importlib
+import types
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+# Checker packages below qc_openscenario.checks, in execution order
+CHECKER_PACKAGES = [
+    "basic_checker",
+    "schema_checker",
+    "reference_checker",
+    "parameters_checker",
+    "data_type_checker",
+]
+
+
+@dataclass(frozen=True)
+class CheckerSpec:
+    checker_id: str
+    # Absolute name of the checker module
+    module_name: str
+    # Whether the checker only runs from the version of its rule uid on
+    required_definition_setting: bool
+
+
+def lazy_checker_modules(
+    package_name: str, checker_modules: Dict[str, str]
+) -> Callable[[str], types.ModuleType]:
+    """Make the module __getattr__ of a checker package, importing its checker modules on first access
+
+    Args:
+        package_name (str): __name__ of the checker package
+        checker_modules (Dict[str, str]): CHECKER_MODULES of the checker package
+
+    Returns:
+        Callable[[str], types.ModuleType]: the __getattr__ function of the package
+    """
+    module_names = set(checker_modules.values())
+
+    def __getattr__(name: str) -> types.ModuleType:
+        if name in module_names:
+            return importlib.import_module(f"{package_name}.{name}")
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+def get_checker_specs() -> List[CheckerSpec]:
+    """Get the declared checkers of all the checker packages, in execution order"""
+    specs = []
+    for package_name in CHECKER_PACKAGES:
+        package = importlib.import_module(f"qc_openscenario.checks.{package_name}")
+        required_definition_setting = getattr(
+            package, "REQUIRED_DEFINITION_SETTING", True
+        )
+        for checker_id, module_name in package.CHECKER_MODULES.items():
+            specs.append(
+                CheckerSpec(
+                    checker_id=checker_id,
+                    module_name=f"{package.__name__}.{module_name}",
+                    required_definition_setting=required_definition_setting,
+                )
+            )
+
+    return specs
+
+
+def load_checkers(
+    checker_ids: Optional[Set[str]] = None,
+) -> List[types.ModuleType]:
+    """Import the checker modules of the given checker ids, in execution order
+
+    Args:
+        checker_ids (Optional[Set[str]]): ids of the checkers to load.
+            None to load all the checkers. Unknown ids are ignored
+
+    Returns:
+        List[types.ModuleType]: the checker modules
+
+    Raises:
+        ValueError: if the CHECKER_ID of a module differs from its id in CHECKER_MODULES
+    """
+    checkers = []
+    for spec in get_checker_specs():
+        if checker_ids is not None and spec.checker_id not in checker_ids:
+            continue
+        checker = importlib.import_module(spec.module_name)
+        if checker.CHECKER_ID != spec.checker_id:
+            raise ValueError(
+                f"{spec.module_name} is declared as {spec.checker_id} "
+                f"but its CHECKER_ID is {checker.CHECKER_ID}"
+            )
+        checkers.append(checker)
+
+    return checkers
+
+
+def get_execution_waves(
+    checkers: List[types.ModuleType],
+) -> List[List[types.ModuleType]]:
+    """Order checkers in waves following the DAG of their CHECKER_PRECONDITIONS
+
+    A checker is in the wave following the last wave of its preconditions, so
+    the checkers of a wave only depend on earlier waves. Preconditions on
+    checkers that are not in checkers are ignored. Within a wave, checkers keep
+    their order in checkers.
+
+    Args:
+        checkers (List[types.ModuleType]): the checker modules to run
+
+    Returns:
+        List[List[types.ModuleType]]: the waves of checkers, in execution order
+
+    Raises:
+        ValueError: if the preconditions of the checkers are circular
+    """
+    checker_ids = {checker.CHECKER_ID for checker in checkers}
+    remaining = list(checkers)
+    done = set()
+    waves = []
+    while remaining:
+        wave = [
+            checker
+            for checker in remaining
+            if (checker.CHECKER_PRECONDITIONS & checker_ids) <= done
+        ]
+        if len(wave) == 0:
+            raise ValueError(
+                "Circular checker preconditions among "
+                + ", ".join(checker.CHECKER_ID for checker in remaining)
+            )
+        waves.append(wave)
+        done |= {checker.CHECKER_ID for checker in wave}
+        remaining = [checker for checker in remaining if checker.CHECKER_ID not in done]
+
+    return waves
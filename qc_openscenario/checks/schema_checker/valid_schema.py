@@ -4,8 +4,11 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-import importlib.resources
 import logging
+import threading
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
 
 from lxml import etree
 
@@ -33,32 +36,128 @@ CHECKER_PRECONDITIONS = {
 RULE_UID = "asam.net:xosc:1.0.0:xml.valid_schema"
 
 
+# Issues registered at most by default, 0 meaning no limit
+DEFAULT_MAX_ISSUES = 0
+# Lines between an error and the line range of the previous errors with the same
+# message, above which the error starts a new issue
+MAX_LINE_GAP = 100
+
+
+@dataclass
+class _ErrorGroup:
+    """Schema errors sharing the same message, on neighbouring lines"""
+
+    message: str
+    # Location of the first occurrence
+    line: int
+    column: int
+    # Line range of the occurrences
+    first_line: int
+    last_line: int
+    count: int
+
+
 def _is_schema_compliant(
-    xml_tree: etree._ElementTree, schema_file: str
+    xml_tree: etree._ElementTree,
+    schema: etree.XMLSchema,
+    validation_lock: threading.Lock,
 ) -> tuple[bool, etree._ListErrorLog]:
-    """Check if input xml tree  is valid against the input schema file (.xsd)
+    """Check if input xml tree  is valid against the input schema
 
     Args:
-        xml_file (etree._ElementTree): XML tree to test
-        schema_file (str): XSD file path containing the schema for the validation
+        xml_tree (etree._ElementTree): XML tree to test
+        schema (etree.XMLSchema): compiled schema used for the validation
+        validation_lock (threading.Lock): lock of the schema, held while validating
 
     Returns:
         bool: True if file pointed by xml_file is valid w.r.t. input schema file. False otherwise
     """
-    with open(schema_file, "rb") as schema_f:
-        schema_doc = etree.parse(schema_f)
-        schema = etree.XMLSchema(schema_doc)
+    with validation_lock:
+        is_valid = schema.validate(xml_tree)
+        # A copy of the log, independent of the following validations
+        error_log = schema.error_log
 
-    if schema.validate(xml_tree):
+    if is_valid:
         logging.info("- XML is valid.")
         return True, None
     else:
-        logging.error("- XML is invalid!")
-        for error in schema.error_log:
-            logging.error(f"- Error: {error.message}")
-            logging.error(f"- Line: {error.line}, Column: {error.column}")
+        logging.error(f"- XML is invalid! {len(error_log)} errors found")
+        return False, error_log
+
+
+def _get_max_issues(checker_data: models.CheckerData) -> int:
+    """Read the maxIssues parameter of the checker, falling back on the one of the bundle
 
-        return False, schema.error_log
+    Returns:
+        int: the maximum number of issues to register, 0 meaning no limit
+    """
+    max_issues = checker_data.config.get_checker_param(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        checker_id=CHECKER_ID,
+        param_name="maxIssues",
+    )
+    if max_issues is None:
+        max_issues = checker_data.config.get_checker_bundle_param(
+            checker_bundle_name=constants.BUNDLE_NAME, param_name="maxIssues"
+        )
+    if max_issues is None:
+        return DEFAULT_MAX_ISSUES
+
+    try:
+        return max(int(max_issues), 0)
+    except ValueError:
+        logging.warning(f"- Invalid maxIssues value {max_issues}, using the default")
+        return DEFAULT_MAX_ISSUES
+
+
+def _group_errors(
+    errors: Iterable[etree._LogEntry], max_issues: int
+) -> tuple[List[_ErrorGroup], int]:
+    """Collapse the errors with identical messages by line range, keeping at most max_issues groups
+
+    An error joins the group of the previous errors with the same message if it
+    is at most MAX_LINE_GAP lines away from their line range, otherwise it
+    starts a new group. The errors are consumed one by one, only the kept
+    groups are held in memory.
+
+    Args:
+        errors (Iterable[etree._LogEntry]): the schema errors, in document order
+        max_issues (int): maximum number of groups to keep, 0 meaning no limit
+
+    Returns:
+        tuple[List[_ErrorGroup], int]: the kept groups in order of first occurrence
+            and the number of errors not covered by them
+    """
+    groups: List[_ErrorGroup] = []
+    # Last group of each message
+    last_groups: Dict[str, _ErrorGroup] = {}
+    suppressed_count = 0
+    for error in errors:
+        group = last_groups.get(error.message)
+        if (
+            group is not None
+            and group.first_line - MAX_LINE_GAP
+            <= error.line
+            <= group.last_line + MAX_LINE_GAP
+        ):
+            group.count += 1
+            group.first_line = min(group.first_line, error.line)
+            group.last_line = max(group.last_line, error.line)
+        elif max_issues == 0 or len(groups) < max_issues:
+            group = _ErrorGroup(
+                message=error.message,
+                line=error.line,
+                column=error.column,
+                first_line=error.line,
+                last_line=error.line,
+                count=1,
+            )
+            groups.append(group)
+            last_groups[error.message] = group
+        else:
+            suppressed_count += 1
+
+    return groups, suppressed_count
 
 
 def check_rule(checker_data: models.CheckerData) -> None:
@@ -71,9 +170,9 @@ def check_rule(checker_data: models.CheckerData) -> None:
     logging.info("Executing valid_schema check")
 
     schema_version = checker_data.schema_version
-    xsd_file = schema_files.SCHEMA_FILES.get(schema_version)
+    schema = schema_files.get_schema(schema_version)
 
-    if xsd_file is None:
+    if schema is None:
         checker_data.result.set_checker_status(
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=CHECKER_ID,
@@ -88,15 +187,27 @@ def check_rule(checker_data: models.CheckerData) -> None:
 
         return
 
-    xsd_file_path = str(
-        importlib.resources.files("qc_openscenario.schema").joinpath(xsd_file)
-    )
     schema_compliant, errors = _is_schema_compliant(
-        checker_data.input_file_xml_root, xsd_file_path
+        checker_data.input_file_xml_root,
+        schema,
+        schema_files.get_validation_lock(schema_version),
     )
 
     if not schema_compliant:
-        for error in errors:
+        error_groups, suppressed_count = _group_errors(
+            errors, _get_max_issues(checker_data)
+        )
+        for error_group in error_groups:
+            logging.error(f"- Error: {error_group.message}")
+            logging.error(f"- Line: {error_group.line}, Column: {error_group.column}")
+
+            description = error_group.message
+            if error_group.count > 1:
+                description = (
+                    f"{error_group.message} ({error_group.count} occurrences "
+                    f"from line {error_group.first_line} to line {error_group.last_line})"
+                )
+
             issue_id = checker_data.result.register_issue(
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
@@ -108,7 +219,15 @@ def check_rule(checker_data: models.CheckerData) -> None:
                 checker_bundle_name=constants.BUNDLE_NAME,
                 checker_id=CHECKER_ID,
                 issue_id=issue_id,
-                row=error.line,
-                column=error.column,
-                description=error.message,
+                row=error_group.line,
+                column=error_group.column,
+                description=description,
+            )
+
+        if suppressed_count > 0:
+            logging.error(f"- {suppressed_count} more errors suppressed")
+            checker_data.result.add_checker_summary(
+                constants.BUNDLE_NAME,
+                CHECKER_ID,
+                f"{suppressed_count} more errors suppressed",
             )
@@ -5,15 +5,60 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 from lxml import etree
-from io import BytesIO
-from typing import Union, Optional
-from qc_openscenario.checks import models
+from typing import BinaryIO, Callable, Iterator, Union, Optional
+from qc_baselib import Configuration
+from qc_openscenario import constants, resident_cache
+from qc_openscenario.checks import expressions, models, queries
 import re
 import logging
+import mmap
 import os
+import contextlib
+import gzip
+import lzma
+import bz2
+import zlib
+import dataclasses
+import hashlib
+import io
+import json
+import math
 
 EXPRESSION_PATTERN = re.compile(r"[$][{][ A-Za-z0-9_\+\-\*/%$\(\)\.,]*[\}]")
 PARAMETER_PATTERN = re.compile(r"[$][A-Za-z_][A-Za-z0-9_]*")
+# Kept by the streaming loader so that parameter references stay resolvable
+PARAMETER_DECLARATION_TAGS = {"ParameterDeclarations", "ParameterDeclaration"}
+COMPRESSED_FILE_READERS = {
+    ".gz": lambda compressed_file: gzip.GzipFile(fileobj=compressed_file, mode="rb"),
+    ".xz": lzma.LZMAFile,
+    ".bz2": bz2.BZ2File,
+}
+# Errors raised when the input file cannot be read or decompressed: truncated
+# archives raise EOFError, corrupted ones zlib.error, OSError (bz2) or LZMAError
+INPUT_FILE_ERRORS = (OSError, EOFError, zlib.error, lzma.LZMAError)
+# Elements of a xodr file read to build the road network summary,
+# junctions are only handed out to free them once read
+ROAD_NETWORK_SUMMARY_TAGS = (
+    "{*}road",
+    "{*}lane",
+    "{*}signal",
+    "{*}controller",
+    "{*}junction",
+)
+# Elements that a storyboardElementRef attribute may refer to
+STORYBOARD_ELEMENT_TAGS = {
+    "Story",
+    "Act",
+    "ManeuverGroup",
+    "Maneuver",
+    "Event",
+    "Action",
+}
+# Bumped whenever the content of models.RoadNetworkSummary changes,
+# so that the files written by former versions are not read back
+ROAD_NETWORK_CACHE_VERSION = 1
+# Rough memory taken by each id of a road network summary, set entry included
+ROAD_NETWORK_SUMMARY_ID_SIZE = 128
 
 
 def to_float(s):
@@ -23,17 +68,312 @@ def to_float(s):
         return None
 
 
-def get_root_without_default_namespace(path: str) -> Optional[etree._ElementTree]:
-    if not os.path.exists(path):
-        return None
+@contextlib.contextmanager
+def open_input_file(path: str) -> Iterator[BinaryIO]:
+    """Open the file at path as a binary stream for the xml parser
+
+    Regular files are memory-mapped, so the parser reads them straight from the
+    OS page cache, shared among the processes checking the same file, without
+    holding a copy of the whole content on the heap.
+    Files compressed with gzip, xz or bzip2 (by extension) are decompressed on
+    the fly while the parser reads them.
+
+    Args:
+        path (str): path of the file to open
+
+    Yields:
+        Iterator[BinaryIO]: the binary stream with the (decompressed) file content
+    """
+    with contextlib.ExitStack() as stack:
+        input_file = stack.enter_context(open(path, "rb"))
+        try:
+            input_file = stack.enter_context(
+                mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+        except (ValueError, OSError):
+            # Empty files and non regular files cannot be mapped
+            pass
+
+        decompressed_file_reader = COMPRESSED_FILE_READERS.get(
+            os.path.splitext(path)[1].lower()
+        )
+        if decompressed_file_reader is not None:
+            input_file = stack.enter_context(decompressed_file_reader(input_file))
+
+        yield input_file
+
+
+def strip_default_namespace(tree: etree._ElementTree) -> None:
+    """Remove default namespaces from the tags of the tree, in place
+
+    Only elements living in a default (unprefixed) namespace are renamed, so
+    prefixed namespaces such as xsi are left untouched. Declarations that
+    become unused are dropped afterwards.
+
+    Args:
+        tree (etree._ElementTree): the parsed xml document tree
+    """
+    has_namespace = False
+    # "{*}*" yields every element, with or without a namespace, but no comments
+    # or processing instructions
+    for element in tree.getroot().iter("{*}*"):
+        if element.prefix is None and element.tag.startswith("{"):
+            element.tag = etree.QName(element).localname
+            has_namespace = True
+
+    if has_namespace:
+        etree.cleanup_namespaces(tree)
+
+
+def parse_xml_file(
+    path: str,
+) -> tuple[Optional[etree._ElementTree], Optional[Exception]]:
+    """Parse the xml file at path exactly once, dropping the default namespace
+
+    The file is fed to the parser as a memory-mapped byte stream, so the encoding
+    declared in the prolog is honoured and no intermediate copy of the document is kept.
+    The outcome serves both as the xml validity verdict and as the document
+    tree used by all the checkers working on the input file.
+
+    Args:
+        path (str): path of the xml file to parse
+
+    Returns:
+        tuple[Optional[etree._ElementTree], Optional[Exception]]: the parsed tree and None on success.
+            None and the raised exception if the file cannot be read or is not well formed
+            (etree.XMLSyntaxError carries the line and column of the failure)
+    """
+    try:
+        with open_input_file(path) as input_file:
+            tree = etree.parse(input_file)
+    except (*INPUT_FILE_ERRORS, etree.XMLSyntaxError) as e:
+        return None, e
+
+    strip_default_namespace(tree)
+
+    return tree, None
+
+
+def parse_xml_bytes(
+    content: bytes,
+) -> tuple[Optional[etree._ElementTree], Optional[Exception]]:
+    """Parse an xml document held in memory, dropping the default namespace as parse_xml_file
+
+    Args:
+        content (bytes): the xml document
+
+    Returns:
+        tuple[Optional[etree._ElementTree], Optional[Exception]]: the parsed tree and None on success.
+            None and the raised exception if the document is not well formed
+    """
+    try:
+        tree = etree.parse(io.BytesIO(content))
+    except etree.XMLSyntaxError as e:
+        return None, e
+
+    strip_default_namespace(tree)
+
+    return tree, None
+
+
+def estimate_parsed_tree_size(
+    parsed: tuple[Optional[etree._ElementTree], Optional[Exception]], file_size: int
+) -> int:
+    """Estimate the memory in bytes taken by the outcome of parse_xml_file, for the resident cache"""
+    return file_size * resident_cache.PARSED_TREE_MEMORY_FACTOR
+
+
+def parse_xml_file_pruned(
+    path: str, retain: Callable[[etree._Element], bool]
+) -> tuple[Optional[etree._ElementTree], Optional[Exception]]:
+    """Stream-parse the xml file at path keeping only the elements selected by retain
+
+    Elements are handled as soon as they are closed. An element is kept if
+    retain selects it, if it is part of a parameter declaration or if one of its
+    descendants is kept. Any other element is emptied on the fly: it stays in
+    place with only its tag, so that paths computed on the pruned tree are the
+    same as on the full document. The memory needed thus still grows with the
+    number of elements of the document, but not with their attributes and text.
+    The root element is always kept and default namespaces are stripped as in
+    parse_xml_file.
+
+    Args:
+        path (str): path of the xml file to parse
+        retain (Callable[[etree._Element], bool]): predicate selecting the elements to keep.
+            It receives a complete element whose descendants are already pruned
+
+    Returns:
+        tuple[Optional[etree._ElementTree], Optional[Exception]]: the pruned tree and None on success.
+            None and the raised exception if the file cannot be read or is not well formed
+    """
+    # One flag per open element, telling whether one of its children is kept
+    keep_stack = []
+    try:
+        with open_input_file(path) as input_file:
+            context = etree.iterparse(input_file, events=("start", "end"))
+            for event, element in context:
+                if event == "start":
+                    keep_stack.append(False)
+                    continue
+
+                if element.prefix is None and element.tag.startswith("{"):
+                    element.tag = etree.QName(element).localname
+
+                keep = (
+                    keep_stack.pop()
+                    or element.tag in PARAMETER_DECLARATION_TAGS
+                    or retain(element)
+                )
+                if not keep_stack:
+                    # Root element
+                    continue
+                if keep:
+                    keep_stack[-1] = True
+                else:
+                    element.clear()
+
+            tree = context.root.getroottree()
+    except (*INPUT_FILE_ERRORS, etree.XMLSyntaxError) as e:
+        return None, e
+
+    etree.cleanup_namespaces(tree)
+
+    return tree, None
+
 
-    with open(path, "rb") as raw_file:
-        xml_string = raw_file.read().decode()
+def get_enabled_checker_ids(config: Configuration) -> Optional[set[str]]:
+    """Get the ids of the checkers listed for this checker bundle in the configuration
 
-        if "xmlns" in xml_string:
-            xml_string = re.sub(' xmlns="[^"]+"', "", xml_string)
+    Args:
+        config (Configuration): the loaded configuration
+
+    Returns:
+        Optional[set[str]]: the listed checker ids.
+                            None if no checker is listed, meaning that all the checkers are enabled
+    """
+    for bundle in config.get_all_checker_bundles():
+        if bundle.application == constants.BUNDLE_NAME and len(bundle.checkers) > 0:
+            return {checker.checker_id for checker in bundle.checkers}
+
+    return None
+
+
+def build_scenario_index(tree: etree._ElementTree) -> models.ScenarioIndex:
+    """Index the elements of the xml document in a single traversal
 
-        return etree.parse(BytesIO(xml_string.encode()))
+    The attributes whose value starts with "$" are classified and their
+    parameter references resolved along the way, see models.ScenarioIndex.get_resolved_attribute.
+
+    Args:
+        tree (etree._ElementTree): the parsed xml document tree
+
+    Returns:
+        models.ScenarioIndex: the lookup tables shared by the checkers
+    """
+    root = tree.getroot()
+    element_order = {}
+    subtree_end = []
+    elements_by_tag = {}
+    elements_by_attribute = {}
+    storyboard_elements = {}
+    parameter_declarations = {}
+    parameterized_attributes = []
+
+    # Comments and processing instructions are left out
+    elements = list(root.iter(etree.Element))
+    for position, element in enumerate(elements):
+        element_order[element] = position
+        subtree_end.append(position)
+
+        elements_by_tag.setdefault(element.tag, []).append(element)
+        for attribute_name, attribute_value in element.attrib.items():
+            elements_by_attribute.setdefault(attribute_name, []).append(element)
+            if attribute_value.startswith("$"):
+                parameterized_attributes.append(
+                    (element, attribute_name, attribute_value)
+                )
+
+        name = element.get("name")
+        if name is None:
+            continue
+        if element.tag in STORYBOARD_ELEMENT_TAGS:
+            storyboard_elements.setdefault(name, []).append(element)
+        elif element.tag == "ParameterDeclaration":
+            parent = element.getparent()
+            if parent.tag == "ParameterDeclarations" and parent is not root:
+                declaring_element = parent.getparent()
+                parameter_declarations.setdefault(declaring_element, {}).setdefault(
+                    name, element.get("value")
+                )
+
+    # Children come after their parent, so walking backwards completes every subtree first
+    for position in range(len(elements) - 1, 0, -1):
+        parent_position = element_order[elements[position].getparent()]
+        if subtree_end[position] > subtree_end[parent_position]:
+            subtree_end[parent_position] = subtree_end[position]
+
+    # Chain each scope to the one of the closest declaring ancestor
+    parameter_scopes = {
+        declaring_element: models.ParameterScope(parameters=parameters, parent=None)
+        for declaring_element, parameters in parameter_declarations.items()
+    }
+    for declaring_element, scope in parameter_scopes.items():
+        for ancestor in declaring_element.iterancestors():
+            if ancestor in parameter_scopes:
+                scope.parent = parameter_scopes[ancestor]
+                break
+
+    entities_node = root.find("Entities")
+
+    index = models.ScenarioIndex(
+        element_order=element_order,
+        subtree_end=subtree_end,
+        elements_by_tag=elements_by_tag,
+        elements_by_attribute=elements_by_attribute,
+        entities=(
+            None
+            if entities_node is None
+            else [x for x in entities_node if isinstance(x.tag, str)]
+        ),
+        storyboard_elements=storyboard_elements,
+        parameter_declarations=parameter_declarations,
+        parameter_scopes=parameter_scopes,
+    )
+
+    # Resolve once the attributes referring to parameters, for all the checkers
+    for element, attribute_name, attribute_value in parameterized_attributes:
+        attribute_type = get_attribute_type(attribute_value)
+        if attribute_type == models.AttributeType.PARAMETER:
+            value = index.get_parameter_value(element, attribute_value[1:])
+        elif attribute_type == models.AttributeType.EXPRESSION:
+            value = format_expression_value(
+                index.evaluate_expression(element, attribute_value)
+            )
+        else:
+            value = attribute_value
+        index.resolved_attributes[(element, attribute_name)] = models.ResolvedAttribute(
+            attribute_type=attribute_type, raw_value=attribute_value, value=value
+        )
+
+    return index
+
+
+def format_expression_value(value: Optional[expressions.Value]) -> Optional[str]:
+    """Write an expression value the way it would be written in an attribute
+
+    Returns:
+        Optional[str]: "true" / "false" for booleans, the number otherwise. None if value is None
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "INF" if value > 0 else "-INF"
+
+    return repr(value)
 
 
 def get_standard_schema_version(root: etree._ElementTree) -> Optional[str]:
@@ -92,11 +432,10 @@ def get_parameter_value_from_node(
     """
     # Dictionary to hold parameters
     params_dict = {}
-    parameter_xpath = "./ParameterDeclarations/ParameterDeclaration"
 
     current = node
     while current is not None:
-        for param in current.xpath(parameter_xpath):
+        for param in queries.PARAMETER_DECLARATIONS(current):
             name = param.get("name")
             value = param.get("value")
             if name not in params_dict:
@@ -111,17 +450,21 @@ def get_parameter_value_from_node(
         return None
 
 
-def get_xodr_road_network(
-    input_file_path: str, tree: etree._ElementTree
-) -> Optional[etree._ElementTree]:
-    """Get parsed xodr tree indicated in the RoadNetwork/LogicFile node of the input tree
+def get_xodr_file_path(
+    input_file_path: str,
+    tree: etree._ElementTree,
+    scenario_index: Optional[models.ScenarioIndex] = None,
+) -> Optional[str]:
+    """Get the path of the xodr file indicated in the RoadNetwork/LogicFile node of the input tree
 
     Args:
+        input_file_path (str): path of the xml document, relative file paths are resolved from its directory
         tree (etree._ElementTree): xml document tree that refers to a xodr file
+        scenario_index (Optional[models.ScenarioIndex]): index of the tree, used to resolve a parameterized filepath if given
 
     Returns:
-        Optional[etree._ElementTree]: the parsed road network tree.
-                                      None if the specified nodes in the root or the road network file are not found
+        Optional[str]: the absolute path of the road network file.
+                       None if the specified nodes in the root are not found
     """
 
     road_network = tree.find("RoadNetwork")
@@ -137,18 +480,179 @@ def get_xodr_road_network(
     # If filepath is specified using param, get all param declaration and update the filepath
     if get_attribute_type(filepath) == models.AttributeType.PARAMETER:
         filepath_param = filepath[1:]
-        filepath = get_parameter_value_from_node(tree, tree.getroot(), filepath_param)
+        if scenario_index is not None:
+            filepath = scenario_index.get_parameter_value(
+                tree.getroot(), filepath_param
+            )
+        else:
+            filepath = get_parameter_value_from_node(
+                tree, tree.getroot(), filepath_param
+            )
         if filepath is None:
             return None
 
-    previous_wd = os.getcwd()
-    os.chdir(os.path.dirname(input_file_path))
+    # Resolved by path arithmetic only, the working directory is shared by all threads.
+    # An absolute filepath is kept as is by os.path.join
+    return os.path.abspath(
+        os.path.join(os.path.dirname(os.path.abspath(input_file_path)), filepath)
+    )
+
 
-    xodr_root = get_root_without_default_namespace(filepath)
+def get_road_network_summary(
+    xodr_file_path: str,
+) -> Optional[models.RoadNetworkSummary]:
+    """Stream the xodr file at xodr_file_path and collect the ids referenced by the checkers
+
+    Only the road, lane, signal, controller and junction elements are handed out
+    by the parser, and every top level element is dropped once read, so the
+    memory needed does not grow with the size of the road network geometry.
+    Controllers referenced inside junctions are not declarations and are ignored.
+
+    Args:
+        xodr_file_path (str): path of the xodr file
 
-    os.chdir(previous_wd)
+    Returns:
+        Optional[models.RoadNetworkSummary]: the ids found in the road network.
+            None if the file does not exist or cannot be read
+    """
+    if not os.path.exists(xodr_file_path):
+        return None
+
+    summary = models.RoadNetworkSummary(
+        signal_ids=set(), controller_ids=set(), road_ids=set(), lane_ids=set()
+    )
+    try:
+        with open_input_file(xodr_file_path) as input_file:
+            for _, element in etree.iterparse(
+                input_file, events=("end",), tag=ROAD_NETWORK_SUMMARY_TAGS
+            ):
+                tag = etree.QName(element).localname
+                element_id = element.get("id")
+                parent = element.getparent()
+                is_top_level = parent is not None and parent.getparent() is None
+
+                if element_id is not None:
+                    if tag == "signal":
+                        summary.signal_ids.add(element_id)
+                    elif tag == "lane":
+                        road = next(element.iterancestors("{*}road"), None)
+                        if road is not None and road.get("id") is not None:
+                            summary.lane_ids.add((road.get("id"), element_id))
+                    elif tag == "road" and is_top_level:
+                        summary.road_ids.add(element_id)
+                    elif tag == "controller" and is_top_level:
+                        summary.controller_ids.add(element_id)
+
+                if is_top_level:
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del parent[0]
+    except (*INPUT_FILE_ERRORS, etree.XMLSyntaxError) as e:
+        logging.error(f"- Cannot read xodr file {xodr_file_path}: {e}")
+        return None
+
+    return summary
+
+
+def get_file_hash(path: str) -> str:
+    """Compute the sha256 digest of the content of the file at path
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        str: the hexadecimal digest of the file content
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as input_file:
+        for chunk in iter(lambda: input_file.read(1 << 20), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def get_cached_road_network_summary(
+    xodr_file_path: str, cache_dir: Optional[str]
+) -> Optional[models.RoadNetworkSummary]:
+    """Get the road network summary of the xodr file, reusing the one stored in cache_dir if any
+
+    Summaries are stored as json files named after the hash of the xodr file
+    content, so that the same road network is parsed only once whatever the
+    path it is referenced with. Unreadable cache entries are silently rebuilt.
+
+    Args:
+        xodr_file_path (str): path of the xodr file
+        cache_dir (Optional[str]): directory holding the cached summaries.
+            None to always read the xodr file
+
+    Returns:
+        Optional[models.RoadNetworkSummary]: the ids found in the road network.
+            None if the file does not exist or cannot be read
+    """
+    if cache_dir is None or not os.path.isfile(xodr_file_path):
+        return get_road_network_summary(xodr_file_path)
+
+    try:
+        cache_file_path = os.path.join(
+            cache_dir,
+            f"{get_file_hash(xodr_file_path)}.v{ROAD_NETWORK_CACHE_VERSION}.json",
+        )
+    except OSError as e:
+        logging.error(f"- Cannot read xodr file {xodr_file_path}: {e}")
+        return None
+
+    try:
+        with open(cache_file_path, "r", encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+        summary = models.RoadNetworkSummary(
+            signal_ids=set(cached["signal_ids"]),
+            controller_ids=set(cached["controller_ids"]),
+            road_ids=set(cached["road_ids"]),
+            lane_ids={(road_id, lane_id) for road_id, lane_id in cached["lane_ids"]},
+        )
+        logging.info(f"- Road network summary read from cache {cache_file_path}")
+        return summary
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logging.warning(f"- Ignoring invalid cache file {cache_file_path}: {e}")
+
+    summary = get_road_network_summary(xodr_file_path)
+    if summary is None:
+        return None
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Written aside then renamed, so that concurrent runs never read a partial file
+        temporary_file_path = f"{cache_file_path}.{os.getpid()}.tmp"
+        with open(temporary_file_path, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {
+                    field: sorted(values)
+                    for field, values in dataclasses.asdict(summary).items()
+                },
+                cache_file,
+            )
+        os.replace(temporary_file_path, cache_file_path)
+    except OSError as e:
+        logging.warning(f"- Cannot write cache file {cache_file_path}: {e}")
+
+    return summary
+
+
+def estimate_road_network_summary_size(
+    summary: Optional[models.RoadNetworkSummary], file_size: int
+) -> int:
+    """Estimate the memory in bytes taken by a road network summary, for the resident cache"""
+    if summary is None:
+        return 0
 
-    return xodr_root
+    return ROAD_NETWORK_SUMMARY_ID_SIZE * (
+        len(summary.signal_ids)
+        + len(summary.controller_ids)
+        + len(summary.road_ids)
+        + len(summary.lane_ids)
+    )
 
 
 def get_attribute_type(attribute_value: str) -> models.AttributeType:
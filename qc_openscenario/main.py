@@ -5,23 +5,39 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import argparse
+import dataclasses
+import hashlib
+import importlib
 import logging
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, List, Optional, Set
 import types
 
+from lxml import etree
+
 from qc_baselib import Configuration, Result, StatusType
 from qc_baselib.models.common import ParamType
 
 from qc_openscenario import constants
-from qc_openscenario.checks import schema_checker
+from qc_openscenario.resident_cache import ResidentCache
+from qc_openscenario.result_cache import ResultCache
+from qc_openscenario.result_recorder import ResultRecorder
+from qc_openscenario.schema import schema_files
 from qc_openscenario.checks import basic_checker
-from qc_openscenario.checks import reference_checker
-from qc_openscenario.checks import parameters_checker
-from qc_openscenario.checks import data_type_checker
+from qc_openscenario.checks import registry
 from qc_openscenario.checks import utils, models
 
 logging.basicConfig(format="%(asctime)s - %(message)s", level=logging.INFO)
 
+# Modules of the other modes of the command line, by subcommand name
+SUBCOMMANDS = {
+    "batch": "qc_openscenario.batch",
+    "serve": "qc_openscenario.serve",
+}
+
 
 def args_entrypoint() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -34,15 +50,53 @@ def args_entrypoint() -> argparse.Namespace:
     group.add_argument("-c", "--config_path")
 
     parser.add_argument("-g", "--generate_markdown", action="store_true")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream the input file and empty the elements the enabled checkers do not need, reducing the memory needed. Only the checkers of the configuration and the basic checkers run and appear in the report.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running, and update the report whenever the input file or its road network changes.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of threads running the checkers concurrently. The report is the same as with a single thread.",
+    )
+
+    args = parser.parse_args()
+    if args.watch and args.streaming:
+        parser.error("--watch cannot be combined with --streaming")
+
+    return args
 
-    return parser.parse_args()
+
+def preconditions_satisfied(
+    checker_data: models.CheckerData, preconditions: Set[str]
+) -> bool:
+    # Checkers that are not enabled in the current run cannot block the others
+    if checker_data.enabled_checker_ids is not None:
+        preconditions = preconditions & checker_data.enabled_checker_ids
+
+    return checker_data.result.all_checkers_completed_without_issue(preconditions)
 
 
 def execute_checker(
     checker: types.ModuleType,
     checker_data: models.CheckerData,
     required_definition_setting: bool = True,
+    preconditions_met: Optional[bool] = None,
 ) -> None:
+    if (
+        checker_data.enabled_checker_ids is not None
+        and checker.CHECKER_ID not in checker_data.enabled_checker_ids
+    ):
+        return
+
     # Register checker
     checker_data.result.register_checker(
         checker_bundle_name=constants.BUNDLE_NAME,
@@ -57,10 +111,13 @@ def execute_checker(
         rule_uid=checker.RULE_UID,
     )
 
-    # Check preconditions. If not satisfied then set status as SKIPPED and return
-    if not checker_data.result.all_checkers_completed_without_issue(
-        checker.CHECKER_PRECONDITIONS
-    ):
+    # Check preconditions, unless already evaluated by the caller.
+    # If not satisfied then set status as SKIPPED and return
+    if preconditions_met is None:
+        preconditions_met = preconditions_satisfied(
+            checker_data, checker.CHECKER_PRECONDITIONS
+        )
+    if not preconditions_met:
         checker_data.result.set_checker_status(
             checker_bundle_name=constants.BUNDLE_NAME,
             checker_id=checker.CHECKER_ID,
@@ -128,105 +185,506 @@ def execute_checker(
             constants.BUNDLE_NAME, checker.CHECKER_ID, f"Error: {str(e)}."
         )
 
-        logging.exception(f"An error occurred in {checker.CHECKER_ID}.")
-
+        if isinstance(checker_data.result, ResultRecorder):
+            # Speculative run, only logged if its outcome is committed
+            checker_data.result.log_exception(
+                f"An error occurred in {checker.CHECKER_ID}."
+            )
+        else:
+            logging.exception(f"An error occurred in {checker.CHECKER_ID}.")
+
+
+def get_preconditions_met(
+    wave: List[types.ModuleType], checker_data: models.CheckerData
+) -> Dict[frozenset, bool]:
+    # Checkers of a wave only depend on earlier waves. Each distinct set of
+    # preconditions is evaluated once, so the checkers sharing a failed
+    # precondition are all skipped together
+    preconditions_met = {}
+    for checker in wave:
+        preconditions = frozenset(checker.CHECKER_PRECONDITIONS)
+        if preconditions not in preconditions_met:
+            preconditions_met[preconditions] = preconditions_satisfied(
+                checker_data, preconditions
+            )
 
-def run_checks(config: Configuration, result: Result) -> None:
-    checker_data = models.CheckerData(
-        xml_file_path=config.get_config_param("InputFile"),
-        input_file_xml_root=None,
-        config=config,
-        result=result,
-        schema_version=None,
-        xodr_root=None,
-    )
+    return preconditions_met
 
-    # 1. Run basic checks
-    execute_checker(
-        basic_checker.valid_xml_document,
-        checker_data,
-        required_definition_setting=False,
-    )
 
-    if result.all_checkers_completed_without_issue(
-        {basic_checker.valid_xml_document.CHECKER_ID}
-    ):
-        checker_data.input_file_xml_root = utils.get_root_without_default_namespace(
-            checker_data.xml_file_path
+def execute_wave(
+    wave: List[types.ModuleType],
+    checker_data: models.CheckerData,
+    specs: Dict[str, registry.CheckerSpec],
+) -> None:
+    preconditions_met = get_preconditions_met(wave, checker_data)
+
+    for checker in wave:
+        execute_checker(
+            checker,
+            checker_data,
+            required_definition_setting=specs[
+                checker.CHECKER_ID
+            ].required_definition_setting,
+            preconditions_met=preconditions_met[
+                frozenset(checker.CHECKER_PRECONDITIONS)
+            ],
         )
 
+
+def execute_checker_speculatively(
+    checker: types.ModuleType,
+    checker_data: models.CheckerData,
+    specs: Dict[str, registry.CheckerSpec],
+    lock: threading.Lock,
+) -> ResultRecorder:
+    # Run as if the preconditions were met, the outcome is only recorded
+    recorder = ResultRecorder(checker_data.result, lock)
     execute_checker(
-        basic_checker.root_tag_is_openscenario,
-        checker_data,
-        required_definition_setting=False,
-    )
-    execute_checker(
-        basic_checker.fileheader_is_present,
-        checker_data,
-        required_definition_setting=False,
-    )
-    execute_checker(
-        basic_checker.version_is_defined,
-        checker_data,
-        required_definition_setting=False,
+        checker,
+        dataclasses.replace(checker_data, result=recorder),
+        required_definition_setting=specs[
+            checker.CHECKER_ID
+        ].required_definition_setting,
+        preconditions_met=True,
     )
 
+    return recorder
+
+
+def commit_wave(
+    wave: List[types.ModuleType],
+    recordings: List[Future],
+    checker_data: models.CheckerData,
+    specs: Dict[str, registry.CheckerSpec],
+    lock: threading.Lock,
+) -> None:
+    # Earlier waves are committed, so their outcome gives the actual preconditions
+    with lock:
+        preconditions_met = get_preconditions_met(wave, checker_data)
+
+    for checker, recording in zip(wave, recordings):
+        if preconditions_met[frozenset(checker.CHECKER_PRECONDITIONS)]:
+            recording.result().replay()
+            continue
+
+        # The speculative outcome is discarded, the checker is skipped as in a serial run
+        recording.cancel()
+        with lock:
+            execute_checker(
+                checker,
+                checker_data,
+                required_definition_setting=specs[
+                    checker.CHECKER_ID
+                ].required_definition_setting,
+                preconditions_met=False,
+            )
+
+
+def execute_waves_in_threads(
+    waves: List[List[types.ModuleType]],
+    checker_data: models.CheckerData,
+    specs: Dict[str, registry.CheckerSpec],
+    jobs: int,
+) -> None:
+    """Run the checkers of the waves concurrently on a pool of jobs threads
+
+    Checkers run speculatively, without waiting for the checkers of earlier
+    waves, e.g. the semantic checks overlap with the schema validation.
+    Their outcome is recorded, then committed wave after wave in the order of
+    a serial run, once their actual preconditions are known. The report is the
+    same as the one of a serial run.
+    """
+    lock = threading.Lock()
+    scheduled = []
+    scenario_data_loaded = False
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for wave in waves:
+            if not scenario_data_loaded and any(
+                specs[checker.CHECKER_ID].required_definition_setting
+                for checker in wave
+            ):
+                # The scenario data is only loaded if the basic checks pass
+                for scheduled_wave, recordings in scheduled:
+                    commit_wave(scheduled_wave, recordings, checker_data, specs, lock)
+                scheduled = []
+                load_scenario_data(checker_data)
+                scenario_data_loaded = True
+
+            recordings = [
+                executor.submit(
+                    execute_checker_speculatively, checker, checker_data, specs, lock
+                )
+                for checker in wave
+            ]
+            scheduled.append((wave, recordings))
+
+        for scheduled_wave, recordings in scheduled:
+            commit_wave(scheduled_wave, recordings, checker_data, specs, lock)
+
+
+def load_scenario_data(checker_data: models.CheckerData) -> None:
     # Get schema version and xodr road network if they exist
-    if result.all_checkers_completed_without_issue(
+    if not preconditions_satisfied(
+        checker_data,
         {
             basic_checker.valid_xml_document.CHECKER_ID,
             basic_checker.root_tag_is_openscenario.CHECKER_ID,
             basic_checker.fileheader_is_present.CHECKER_ID,
             basic_checker.version_is_defined.CHECKER_ID,
-        }
+        },
     ):
-        checker_data.schema_version = utils.get_standard_schema_version(
-            checker_data.input_file_xml_root
+        return
+
+    checker_data.schema_version = utils.get_standard_schema_version(
+        checker_data.input_file_xml_root
+    )
+    checker_data.scenario_index = utils.build_scenario_index(
+        checker_data.input_file_xml_root
+    )
+    checker_data.xodr_file_path = utils.get_xodr_file_path(
+        checker_data.xml_file_path,
+        checker_data.input_file_xml_root,
+        checker_data.scenario_index,
+    )
+    load_road_network(checker_data)
+
+
+def load_road_network(checker_data: models.CheckerData) -> None:
+    """Summarize the road network referenced by the input file, if any"""
+    checker_data.xodr_summary = None
+    if checker_data.xodr_file_path is None:
+        return
+
+    xodr_cache_dir = checker_data.config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        param_name="xodrCacheDir",
+    )
+    if checker_data.resident_cache is not None:
+        checker_data.xodr_summary = checker_data.resident_cache.get_or_load(
+            "road_network_summary",
+            checker_data.xodr_file_path,
+            lambda path: utils.get_cached_road_network_summary(path, xodr_cache_dir),
+            utils.estimate_road_network_summary_size,
+        )
+    else:
+        checker_data.xodr_summary = utils.get_cached_road_network_summary(
+            checker_data.xodr_file_path, xodr_cache_dir
         )
-        checker_data.xodr_root = utils.get_xodr_road_network(
-            checker_data.xml_file_path, checker_data.input_file_xml_root
+
+
+def parse_input_file_streaming(
+    checker_data: models.CheckerData,
+    checkers: List[types.ModuleType],
+) -> tuple[Optional[etree._ElementTree], Optional[Exception]]:
+    # Checkers working on the whole document get a complete tree, only if enabled
+    if checker_data.enabled_checker_ids is None or not all(
+        hasattr(checker, "retain_in_stream") for checker in checkers
+    ):
+        logging.info(
+            "Checkers needing the whole document are enabled, keep the full tree"
         )
+        return utils.parse_xml_file(checker_data.xml_file_path)
 
-    # 2. Run schema check
-    execute_checker(schema_checker.valid_schema, checker_data)
+    retainers = [checker.retain_in_stream for checker in checkers]
 
-    # 3. Run reference checks
-    execute_checker(
-        reference_checker.uniquely_resolvable_entity_references, checker_data
+    return utils.parse_xml_file_pruned(
+        checker_data.xml_file_path,
+        lambda element: any(retain(element) for retain in retainers),
     )
-    execute_checker(
-        reference_checker.resolvable_signal_id_in_traffic_signal_state_action,
-        checker_data,
+
+
+def get_run_checker_ids(config: Configuration, streaming: bool) -> Optional[Set[str]]:
+    """Get the ids of the checkers a run executes
+
+    Returns:
+        Optional[Set[str]]: the checker ids. None if every checker of the bundle runs
+    """
+    # Only streaming runs restrict the run to the checkers of the configuration
+    if not streaming:
+        return None
+
+    enabled_checker_ids = utils.get_enabled_checker_ids(config)
+    if enabled_checker_ids is None:
+        return None
+
+    return enabled_checker_ids | {
+        basic_checker.valid_xml_document.CHECKER_ID,
+        basic_checker.root_tag_is_openscenario.CHECKER_ID,
+        basic_checker.fileheader_is_present.CHECKER_ID,
+        basic_checker.version_is_defined.CHECKER_ID,
+    }
+
+
+def run_checks(
+    config: Configuration,
+    result: Result,
+    streaming: bool = False,
+    jobs: int = 1,
+    resident_cache: Optional[ResidentCache] = None,
+    input_content: Optional[bytes] = None,
+) -> models.CheckerData:
+    """Run the checkers on the input file of config, writing their outcome to result
+
+    Args:
+        config (Configuration): the configuration of the run
+        result (Result): the result receiving the outcome of the checkers
+        streaming (bool): whether to empty the elements the enabled checkers do not need
+        jobs (int): number of threads running the checkers
+        resident_cache (Optional[ResidentCache]): parsed files kept between runs.
+            None to parse every file
+        input_content (Optional[bytes]): document checked instead of the content
+            of the input file, which then only locates the files it references
+
+    Returns:
+        models.CheckerData: the data of the run, e.g. the road network file it referenced
+    """
+    checker_data = models.CheckerData(
+        xml_file_path=config.get_config_param("InputFile"),
+        input_file_xml_root=None,
+        input_file_xml_error=None,
+        config=config,
+        result=result,
+        schema_version=None,
+        scenario_index=None,
+        xodr_file_path=None,
+        xodr_summary=None,
+        enabled_checker_ids=None,
+        resident_cache=resident_cache,
     )
-    execute_checker(
-        reference_checker.resolvable_traffic_signal_controller_by_traffic_signal_controller_ref,
-        checker_data,
+
+    checker_data.enabled_checker_ids = get_run_checker_ids(config, streaming)
+
+    # Only the checkers in the scope of the run are imported
+    specs = {spec.checker_id: spec for spec in registry.get_checker_specs()}
+    checkers = registry.load_checkers(checker_data.enabled_checker_ids)
+
+    # Parse the input file once. The outcome is both the verdict of the
+    # valid_xml_document check and the tree shared by all the other checkers
+    if input_content is not None:
+        (
+            checker_data.input_file_xml_root,
+            checker_data.input_file_xml_error,
+        ) = utils.parse_xml_bytes(input_content)
+    elif streaming:
+        (
+            checker_data.input_file_xml_root,
+            checker_data.input_file_xml_error,
+        ) = parse_input_file_streaming(checker_data, checkers)
+    elif resident_cache is not None:
+        (
+            checker_data.input_file_xml_root,
+            checker_data.input_file_xml_error,
+        ) = resident_cache.get_or_load(
+            "document",
+            checker_data.xml_file_path,
+            utils.parse_xml_file,
+            utils.estimate_parsed_tree_size,
+        )
+    else:
+        (
+            checker_data.input_file_xml_root,
+            checker_data.input_file_xml_error,
+        ) = utils.parse_xml_file(checker_data.xml_file_path)
+
+    # Run the checkers in waves following their preconditions: the basic
+    # checks first, then the schema check, then all the semantic checks
+    waves = registry.get_execution_waves(checkers)
+    if jobs > 1:
+        execute_waves_in_threads(waves, checker_data, specs, jobs)
+        return checker_data
+
+    scenario_data_loaded = False
+    for wave in waves:
+        # Checkers bound to a definition setting need the schema version and
+        # the scenario index, which need the basic checks to pass
+        if not scenario_data_loaded and any(
+            specs[checker.CHECKER_ID].required_definition_setting for checker in wave
+        ):
+            load_scenario_data(checker_data)
+            scenario_data_loaded = True
+
+        execute_wave(wave, checker_data, specs)
+
+    return checker_data
+
+
+def preload_schemas(config: Configuration) -> None:
+    # Schemas are compiled once per process, optionally ahead of the checks
+    preload_schema_versions = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        param_name="preloadSchemaVersions",
     )
-    execute_checker(
-        reference_checker.valid_actor_reference_in_private_actions, checker_data
+    if preload_schema_versions is not None:
+        schema_files.warm_schemas(
+            version.strip()
+            for version in str(preload_schema_versions).split(",")
+            if version.strip()
+        )
+
+
+def with_input_file(config: Configuration, input_file: str) -> Configuration:
+    """Copy config, checking input_file instead of its own input file
+
+    Returns:
+        Configuration: a new configuration with the parameters, checker bundles
+            and checkers of config
+    """
+    input_config = Configuration()
+    input_config.set_config_param(name="InputFile", value=input_file)
+    for name, value in config.get_all_global_config_param().items():
+        if name != "InputFile":
+            input_config.set_config_param(name=name, value=value)
+
+    for bundle in config.get_all_checker_bundles():
+        input_config.register_checker_bundle(checker_bundle_name=bundle.application)
+        for param in bundle.params:
+            input_config.set_checker_bundle_param(
+                checker_bundle_name=bundle.application,
+                name=param.name,
+                value=param.value,
+            )
+        for checker in bundle.checkers:
+            input_config.register_checker(
+                checker_bundle_name=bundle.application,
+                checker_id=checker.checker_id,
+                min_level=checker.min_level,
+                max_level=checker.max_level,
+            )
+            for param in checker.params:
+                input_config.set_checker_param(
+                    checker_bundle_name=bundle.application,
+                    checker_id=checker.checker_id,
+                    name=param.name,
+                    value=param.value,
+                )
+
+    return input_config
+
+
+def create_result() -> Result:
+    """Create the result of a run, with the checker bundle registered"""
+    result = Result()
+    result.register_checker_bundle(
+        name=constants.BUNDLE_NAME,
+        description="OpenScenario checker bundle",
+        version=constants.BUNDLE_VERSION,
+        summary="",
     )
-    execute_checker(reference_checker.resolvable_entity_references, checker_data)
-    execute_checker(reference_checker.resolvable_variable_reference, checker_data)
-    execute_checker(
-        reference_checker.resolvable_storyboard_element_reference, checker_data
+    result.set_result_version(version=constants.BUNDLE_VERSION)
+
+    return result
+
+
+def _check_input_file(
+    config: Configuration,
+    streaming: bool,
+    jobs: int,
+    resident_cache: Optional[ResidentCache],
+    input_content: Optional[bytes],
+) -> tuple[Result, models.CheckerData]:
+    result = create_result()
+    checker_data = run_checks(
+        config,
+        result,
+        streaming=streaming,
+        jobs=jobs,
+        resident_cache=resident_cache,
+        input_content=input_content,
     )
-    execute_checker(reference_checker.unique_element_names_on_same_level, checker_data)
 
-    # 4. Run parameters checks
-    execute_checker(
-        parameters_checker.valid_parameter_declaration_in_catalogs, checker_data
+    result.copy_param_from_config(config)
+
+    return result, checker_data
+
+
+def check_input_file(
+    config: Configuration,
+    streaming: bool = False,
+    jobs: int = 1,
+    resident_cache: Optional[ResidentCache] = None,
+    input_content: Optional[bytes] = None,
+) -> Result:
+    """Run the checker bundle on the input file of config, see run_checks for the arguments
+
+    Returns:
+        Result: the result of the checker bundle, with the parameters of config
+    """
+    return _check_input_file(config, streaming, jobs, resident_cache, input_content)[0]
+
+
+def write_report(
+    config: Configuration,
+    report_path: str,
+    streaming: bool = False,
+    jobs: int = 1,
+    resident_cache: Optional[ResidentCache] = None,
+    input_content: Optional[bytes] = None,
+) -> tuple[int, Optional[bool]]:
+    """Check the input file of config and write the report to report_path
+
+    If the resultCacheDir parameter of the checker bundle is set, the report is
+    copied from the result cache when neither the input file, the files it
+    references, the bundle version nor the configuration changed since it was
+    stored. See run_checks for the other arguments.
+
+    Returns:
+        tuple[int, Optional[bool]]: the issue count of the report, and whether
+            it was read from the result cache. None if there is no result cache
+    """
+    input_file = config.get_config_param("InputFile")
+    result_cache_dir = config.get_checker_bundle_param(
+        checker_bundle_name=constants.BUNDLE_NAME, param_name="resultCacheDir"
     )
 
-    # 5. Run data_type checks
-    execute_checker(data_type_checker.allowed_operators, checker_data)
-    execute_checker(
-        data_type_checker.non_negative_transition_time_in_light_state_action,
-        checker_data,
+    cache = None
+    cache_key = None
+    if result_cache_dir is not None:
+        try:
+            input_hash = (
+                hashlib.sha256(input_content).hexdigest()
+                if input_content is not None
+                else utils.get_file_hash(input_file)
+            )
+        except OSError:
+            # Checked as usual, the checks report the unreadable input file
+            input_hash = None
+        if input_hash is not None:
+            cache = ResultCache(result_cache_dir)
+            cache_key = cache.get_key(
+                config,
+                input_file,
+                input_hash,
+                get_run_checker_ids(config, streaming),
+            )
+            issue_count = cache.load(cache_key, report_path)
+            if issue_count is not None:
+                logging.info(f"- Result of {input_file} read from cache")
+                return issue_count, True
+
+    result, checker_data = _check_input_file(
+        config, streaming, jobs, resident_cache, input_content
     )
-    execute_checker(data_type_checker.positive_duration_in_phase, checker_data)
+    result.write_to_file(report_path, generate_summary=True)
+
+    if cache is not None:
+        cache.store(
+            cache_key,
+            report_path,
+            result.get_issue_count(),
+            # The road network is the only file the checks read besides the input
+            [checker_data.xodr_file_path] if checker_data.xodr_file_path else [],
+        )
+
+    cached = False if result_cache_dir is not None else None
+    return result.get_issue_count(), cached
 
 
 def main():
+    # Other modes of the command line, e.g. "qc_openscenario batch ..."
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        importlib.import_module(SUBCOMMANDS[sys.argv[1]]).main(sys.argv[2:])
+        return
+
     args = args_entrypoint()
 
     logging.info("Initializing checks")
@@ -237,27 +695,34 @@ def main():
         config = Configuration()
         config.load_from_file(xml_file_path=args.config_path)
 
-        result = Result()
-        result.register_checker_bundle(
-            name=constants.BUNDLE_NAME,
-            description="OpenScenario checker bundle",
-            version=constants.BUNDLE_VERSION,
-            summary="",
+        preload_schemas(config)
+
+        report_path = config.get_checker_bundle_param(
+            checker_bundle_name=constants.BUNDLE_NAME, param_name="resultFile"
         )
-        result.set_result_version(version=constants.BUNDLE_VERSION)
 
-        run_checks(config, result)
+        if args.watch:
+            # Imported here, the watch module builds on this one
+            from qc_openscenario import watch
 
-        result.copy_param_from_config(config)
+            try:
+                watch.watch_input_file(config, report_path, jobs=args.jobs)
+            except KeyboardInterrupt:
+                pass
+            logging.info("Done")
+            return
 
-        result.write_to_file(
-            config.get_checker_bundle_param(
-                checker_bundle_name=constants.BUNDLE_NAME, param_name="resultFile"
-            ),
-            generate_summary=True,
+        _, cached = write_report(
+            config, report_path, streaming=args.streaming, jobs=args.jobs
         )
+        if cached is not None:
+            logging.info(
+                f"Result cache: {int(cached)} hit(s), {int(not cached)} miss(es)"
+            )
 
         if args.generate_markdown:
+            result = Result()
+            result.load_from_file(report_path)
             result.write_markdown_doc("generated_checker_bundle_doc.md")
 
     logging.info("Done")
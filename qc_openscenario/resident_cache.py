@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import collections
+import os
+import threading
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_MEMORY_MB = 1024
+# Rough memory taken by an lxml tree, relative to the size of its xml file
+PARSED_TREE_MEMORY_FACTOR = 8
+
+
+class ResidentCache:
+    """Least recently used cache of the data loaded from files by a long-lived process
+
+    Used for the parsed input documents and the summaries of the road networks,
+    the road network trees themselves are not kept. Entries are keyed by file
+    path along with the modification time and size of the file, so that a file
+    changed on disk is loaded again. The estimated memory of the entries is
+    kept below max_bytes by evicting the least recently used ones. Values are
+    shared by the checks of all the requests and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: collections.OrderedDict[Hashable, Tuple[Any, int]] = (
+            collections.OrderedDict()
+        )
+        # Key of the entry of the current version of each file, by kind and path
+        self._current_keys: Dict[Tuple[str, str], Hashable] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_load(
+        self,
+        kind: str,
+        path: str,
+        load: Callable[[str], T],
+        estimate_size: Callable[[T, int], int],
+    ) -> T:
+        """Get the value of kind for the file at path, loading it on a miss
+
+        Args:
+            kind (str): what is loaded from the file, e.g. "road_network_summary"
+            path (str): path of the file
+            load (Callable[[str], T]): function loading the value from the path
+            estimate_size (Callable[[T, int], int]): estimated memory in bytes
+                taken by the value, given the value and the file size
+
+        Returns:
+            T: the value, shared with the other users of the cache
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Not cached, load reports the missing file as usual
+            return load(path)
+
+        file_key = (kind, os.path.abspath(path))
+        key = (*file_key, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Loaded outside the lock, concurrent misses on the same file may both load it
+        value = load(path)
+        size = estimate_size(value, stat.st_size)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._entries:
+                # An older version of the file is no use anymore
+                self._discard(self._current_keys.get(file_key))
+                self._current_keys[file_key] = key
+                self._entries[key] = (value, size)
+                self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+
+        return value
+
+    def _discard(self, key: Optional[Hashable]) -> None:
+        if key not in self._entries:
+            return
+
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+        if self._current_keys.get(key[:2]) == key:
+            del self._current_keys[key[:2]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_keys.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
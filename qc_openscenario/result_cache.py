@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+
+from typing import Any, Dict, Iterable, Optional, Set
+
+from qc_baselib import Configuration
+
+from qc_openscenario import constants
+from qc_openscenario.checks import utils
+
+# Bumped whenever the layout of the cache entries changes,
+# so that the entries written by former versions are not read back
+RESULT_CACHE_VERSION = 1
+
+
+def get_config_fingerprint(config: Configuration) -> Dict[str, Any]:
+    """Get the parts of config that the report depends on, in a json serializable form
+
+    The global parameters, and the parameters and checkers of the checker
+    bundle, are all copied to the report or select the checkers that run.
+    """
+    fingerprint = {
+        "params": sorted(
+            [name, str(value)]
+            for name, value in config.get_all_global_config_param().items()
+        ),
+        "bundle": None,
+    }
+    for bundle in config.get_all_checker_bundles():
+        if bundle.application != constants.BUNDLE_NAME:
+            continue
+        fingerprint["bundle"] = {
+            "params": [[param.name, str(param.value)] for param in bundle.params],
+            "checkers": [
+                [
+                    checker.checker_id,
+                    str(checker.min_level),
+                    str(checker.max_level),
+                    [[param.name, str(param.value)] for param in checker.params],
+                ]
+                for checker in bundle.checkers
+            ],
+        }
+
+    return fingerprint
+
+
+def get_dependency_hash(path: str) -> Optional[str]:
+    """Hash of the file at path, None if it cannot be read"""
+    try:
+        return utils.get_file_hash(path)
+    except OSError:
+        return None
+
+
+class ResultCache:
+    """Reports stored on disk, reused when neither the input nor its dependencies changed
+
+    An entry is looked up by a key hashing the content and the path of the
+    input file, constants.BUNDLE_VERSION, the configuration and the checkers
+    that run, which are fewer in streaming mode. The entry records the hashes
+    of the files the input referenced when it was checked, e.g. its road
+    network, and is only reused if all of them are unchanged.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def get_key(
+        self,
+        config: Configuration,
+        input_file: str,
+        input_hash: str,
+        checker_ids: Optional[Set[str]],
+    ) -> str:
+        """Get the key of the entry of the input file of config
+
+        Args:
+            config (Configuration): the configuration of the check
+            input_file (str): path of the input file, relative files are resolved from it
+            input_hash (str): hash of the checked document
+            checker_ids (Optional[Set[str]]): ids of the checkers the check runs,
+                None if all of them run
+
+        Returns:
+            str: the hexadecimal key of the entry
+        """
+        key_data = {
+            "cache_version": RESULT_CACHE_VERSION,
+            "bundle_version": constants.BUNDLE_VERSION,
+            "input_file": os.path.abspath(input_file),
+            "input_hash": input_hash,
+            "config": get_config_fingerprint(config),
+            "checker_ids": None if checker_ids is None else sorted(checker_ids),
+        }
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _get_paths(self, key: str) -> tuple[str, str]:
+        # The report, and the manifest listing its issue count and dependencies
+        return (
+            os.path.join(self.cache_dir, f"{key}.xqar"),
+            os.path.join(self.cache_dir, f"{key}.json"),
+        )
+
+    def load(self, key: str, report_path: str) -> Optional[int]:
+        """Copy the report of the entry key to report_path, if the entry is still valid
+
+        Returns:
+            Optional[int]: the issue count of the report. None if there is no
+                valid entry, report_path is then left untouched
+        """
+        cached_report_path, manifest_path = self._get_paths(key)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+            dependencies = manifest["dependencies"]
+            issue_count = int(manifest["issue_count"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"- Ignoring invalid cache file {manifest_path}: {e}")
+            return None
+
+        for path, dependency_hash in dependencies.items():
+            if get_dependency_hash(path) != dependency_hash:
+                logging.info(f"- Cached result outdated, {path} changed")
+                return None
+
+        try:
+            shutil.copyfile(cached_report_path, report_path)
+        except FileNotFoundError:
+            return None
+
+        return issue_count
+
+    def store(
+        self,
+        key: str,
+        report_path: str,
+        issue_count: int,
+        dependency_paths: Iterable[str],
+    ) -> None:
+        """Store the report at report_path as the entry key
+
+        Args:
+            key (str): the key of the entry
+            report_path (str): path of the report to store
+            issue_count (int): the issue count of the report
+            dependency_paths (Iterable[str]): the files referenced by the input
+                file, missing files included
+        """
+        cached_report_path, manifest_path = self._get_paths(key)
+        manifest = {
+            "issue_count": issue_count,
+            "dependencies": {
+                os.path.abspath(path): get_dependency_hash(path)
+                for path in dependency_paths
+            },
+        }
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Written aside then renamed, so that concurrent runs never read a partial
+            # file. The manifest goes last, it makes the entry visible
+            temporary_report_path = (
+                f"{cached_report_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            shutil.copyfile(report_path, temporary_report_path)
+            os.replace(temporary_report_path, cached_report_path)
+
+            temporary_manifest_path = (
+                f"{manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(temporary_manifest_path, "w", encoding="utf-8") as manifest_file:
+                json.dump(manifest, manifest_file)
+            os.replace(temporary_manifest_path, manifest_path)
+        except OSError as e:
+            logging.warning(f"- Cannot write cache file {manifest_path}: {e}")
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import inspect
+import logging
+import sys
+import threading
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from qc_baselib import Result, StatusType
+
+# Result methods writing the outcome of a checker, recorded to be applied later
+RECORDED_METHODS = {
+    "register_checker",
+    "register_rule_by_uid",
+    "set_checker_status",
+    "add_checker_summary",
+    "add_xml_location",
+    "add_file_location",
+}
+
+
+def _as_keyword_arguments(
+    name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Name the arguments of a call to the Result method name"""
+    bound_arguments = inspect.signature(getattr(Result, name)).bind(
+        None, *args, **kwargs
+    )
+    bound_arguments.arguments.pop("self")
+    return dict(bound_arguments.arguments)
+
+
+class ResultRecorder:
+    """Stand-in for the shared qc_baselib.Result while a checker runs in a worker thread
+
+    The calls of the checker are recorded instead of being applied, then
+    replayed on the shared result in the order of a serial run. Issue ids are
+    only assigned during the replay, so that they are the same as in a serial
+    run. Errors are logged on replay too, so that a checker whose outcome is
+    discarded, e.g. because its preconditions turn out not to be met, logs
+    nothing.
+    """
+
+    def __init__(self, result: Result, lock: threading.Lock):
+        self._result = result
+        self._lock = lock
+        self._calls: List[Tuple[str, Dict[str, Any]]] = []
+        self._issue_count = 0
+        self._statuses: Dict[str, StatusType] = {}
+        self._exceptions: List[Tuple[str, Any]] = []
+
+    def __getattr__(self, name: str):
+        if name not in RECORDED_METHODS:
+            raise AttributeError(
+                f"{name} is not available to checkers running in threads"
+            )
+
+        def record(*args, **kwargs) -> None:
+            kwargs = _as_keyword_arguments(name, args, kwargs)
+            if name == "set_checker_status":
+                self._statuses[kwargs["checker_id"]] = kwargs["status"]
+            self._calls.append((name, kwargs))
+
+        return record
+
+    def register_issue(self, *args, **kwargs) -> int:
+        # Placeholder id, replaced by the id of the shared result on replay
+        issue_id = self._issue_count
+        self._issue_count += 1
+        self._calls.append(
+            ("register_issue", _as_keyword_arguments("register_issue", args, kwargs))
+        )
+        return issue_id
+
+    def get_checker_status(self, checker_id: str) -> Optional[StatusType]:
+        if checker_id in self._statuses:
+            return self._statuses[checker_id]
+        with self._lock:
+            return self._result.get_checker_status(checker_id)
+
+    def log_exception(self, message: str) -> None:
+        """Record message and the exception being handled, logged on replay"""
+        self._exceptions.append((message, sys.exc_info()))
+
+    def replay(self) -> None:
+        """Apply the recorded calls to the shared result and log the recorded errors"""
+        with self._lock:
+            replay_calls(self._result, self._calls)
+        for message, exc_info in self._exceptions:
+            logging.error(message, exc_info=exc_info)
+
+
+def replay_calls(result: Result, calls: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Apply calls to result, in order
+
+    The n-th issue registered by calls is referred to as issue id n by the
+    following calls, whatever the id it had when the calls were recorded.
+    """
+    issue_ids = []
+    for name, kwargs in calls:
+        if "issue_id" in kwargs:
+            kwargs = dict(kwargs, issue_id=issue_ids[kwargs["issue_id"]])
+        return_value = getattr(result, name)(**kwargs)
+        if name == "register_issue":
+            issue_ids.append(return_value)
+
+
+class CheckerCallLog:
+    """Pass-through to a qc_baselib.Result keeping the calls made for each checker
+
+    The calls of a checker can then be replayed on another result with
+    replay_calls, e.g. to reuse the outcome of a checker whose input did not
+    change.
+    """
+
+    def __init__(self, result: Result):
+        self._result = result
+        self.calls: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        # Position of each issue among the issues of its checker, by issue id
+        self._issue_positions: Dict[int, int] = {}
+        self._issue_counts: Dict[str, int] = {}
+
+    def __getattr__(self, name: str):
+        method = getattr(self._result, name)
+        if name not in RECORDED_METHODS and name != "register_issue":
+            return method
+
+        def record(*args, **kwargs):
+            kwargs = _as_keyword_arguments(name, args, kwargs)
+            return_value = method(**kwargs)
+
+            checker_id = kwargs["checker_id"]
+            if name == "register_issue":
+                self._issue_positions[return_value] = self._issue_counts.get(
+                    checker_id, 0
+                )
+                self._issue_counts[checker_id] = self._issue_positions[return_value] + 1
+            if "issue_id" in kwargs:
+                kwargs = dict(
+                    kwargs, issue_id=self._issue_positions[kwargs["issue_id"]]
+                )
+            self.calls.setdefault(checker_id, []).append((name, kwargs))
+
+            return return_value
+
+        return record
@@ -4,6 +4,14 @@
 # Public License, v. 2.0. If a copy of the MPL was not distributed
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import importlib.resources
+import logging
+import threading
+
+from typing import Dict, Iterable, Optional
+
+from lxml import etree
+
 SCHEMA_FILES = {
     "1.0.0": "1.0.0/OpenSCENARIO.xsd",
     "1.1.0": "1.1.0/OpenSCENARIO.xsd",
@@ -11,3 +19,66 @@ SCHEMA_FILES = {
     "1.2.0": "1.2.0/OpenSCENARIO.xsd",
     "1.3.0": "1.3.0/OpenSCENARIO.xsd",
 }
+
+_compiled_schemas: Dict[str, etree.XMLSchema] = {}
+# lxml keeps the error log of the last validation on the schema object, so
+# validations against a shared schema must hold its lock. Validations against
+# different schemas run concurrently
+_validation_locks: Dict[str, threading.Lock] = {}
+_compiled_schemas_lock = threading.Lock()
+
+
+def get_schema(schema_version: Optional[str]) -> Optional[etree.XMLSchema]:
+    """Get the compiled schema of the given OpenSCENARIO version
+
+    Each schema file is compiled at most once per process, the following calls
+    return the same object.
+
+    Args:
+        schema_version (Optional[str]): the OpenSCENARIO version, e.g. "1.2.0"
+
+    Returns:
+        Optional[etree.XMLSchema]: the compiled schema.
+                                   None if no schema file exists for this version
+    """
+    xsd_file = SCHEMA_FILES.get(schema_version)
+    if xsd_file is None:
+        return None
+
+    with _compiled_schemas_lock:
+        schema = _compiled_schemas.get(schema_version)
+        if schema is None:
+            logging.info(f"- Compiling schema for version {schema_version}")
+            xsd_file_path = importlib.resources.files(
+                "qc_openscenario.schema"
+            ).joinpath(xsd_file)
+            with xsd_file_path.open("rb") as schema_f:
+                schema = etree.XMLSchema(etree.parse(schema_f))
+            _compiled_schemas[schema_version] = schema
+            _validation_locks[schema_version] = threading.Lock()
+
+    return schema
+
+
+def get_validation_lock(schema_version: str) -> threading.Lock:
+    """Get the lock to hold while validating against the schema of the given version
+
+    Args:
+        schema_version (str): an OpenSCENARIO version whose schema was got with get_schema
+
+    Returns:
+        threading.Lock: the lock, the same for all the users of the schema
+    """
+    with _compiled_schemas_lock:
+        return _validation_locks[schema_version]
+
+
+def warm_schemas(schema_versions: Iterable[str]) -> None:
+    """Compile ahead of time the schemas of the given OpenSCENARIO versions
+
+    Args:
+        schema_versions (Iterable[str]): the versions to compile. Unknown versions are ignored
+    """
+    for schema_version in schema_versions:
+        if get_schema(schema_version) is None:
+            logging.warning(f"- No schema file for version {schema_version}")
@@ -0,0 +1,296 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Serve check requests over HTTP, from a long-lived process
+
+Usage: qc_openscenario serve (-s SOCKET_PATH | -p PORT) [--max_memory MAX_MEMORY] [-j JOBS]
+
+The server listens on a Unix domain socket or on a localhost port, so that the
+imports, the compiled schemas and the parsed road networks and documents are
+kept from one check to the next. Endpoints:
+
+    POST /check  check the document described by a JSON object:
+        input_file: path of the input file, relative paths are resolved from the
+            working directory of the server
+        content: optional text of the document, checked instead of the content
+            of input_file. input_file then only locates the files it references
+        content_base64: optional bytes of the document, encoded in base64
+        config: optional text of a configuration file
+        config_path: optional path of a configuration file
+      The response is the report of the check, its issue count is given in the
+      X-Issue-Count header.
+    GET /stats   number of checks served, hits and misses of the result cache
+        and statistics of the resident cache
+"""
+
+import argparse
+import base64
+import collections
+import http.server
+import json
+import logging
+import os
+import signal
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from qc_baselib import Configuration
+
+from qc_openscenario import constants
+from qc_openscenario import main as bundle_main
+from qc_openscenario.resident_cache import DEFAULT_MAX_MEMORY_MB, ResidentCache
+
+LOCALHOST = "127.0.0.1"
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def args_entrypoint(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="qc_openscenario serve",
+        description="Serve check requests of OpenScenario (.xosc) files over HTTP.",
+    )
+
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "-s", "--socket_path", help="Path of the Unix domain socket to listen on."
+    )
+    group.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        help=f"Port to listen on, on {LOCALHOST} only. 0 to pick a free port.",
+    )
+
+    parser.add_argument(
+        "--max_memory",
+        type=int,
+        default=DEFAULT_MAX_MEMORY_MB,
+        help="Memory in MB of the parsed files kept between checks. Least recently used files are dropped first.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of threads running the checkers of each check.",
+    )
+
+    return parser.parse_args(argv)
+
+
+def load_config(
+    request: Dict[str, Any], work_dir: str, input_file: str
+) -> Configuration:
+    """Build the configuration of a check request, checking input_file"""
+    config = Configuration()
+    if request.get("config") is not None:
+        # qc_baselib only reads configurations from files
+        config_fd, config_path = tempfile.mkstemp(suffix=".xml", dir=work_dir)
+        try:
+            with os.fdopen(config_fd, "w", encoding="utf-8") as config_file:
+                config_file.write(request["config"])
+            config.load_from_file(xml_file_path=config_path)
+        finally:
+            os.remove(config_path)
+    elif request.get("config_path") is not None:
+        config.load_from_file(xml_file_path=request["config_path"])
+    else:
+        config.register_checker_bundle(checker_bundle_name=constants.BUNDLE_NAME)
+
+    return bundle_main.with_input_file(config, input_file)
+
+
+def get_input_content(request: Dict[str, Any]) -> Optional[bytes]:
+    if request.get("content") is not None:
+        return str(request["content"]).encode("utf-8")
+    if request.get("content_base64") is not None:
+        return base64.b64decode(request["content_base64"], validate=True)
+
+    return None
+
+
+class CheckRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Handler of the check requests, working on the state held by the server
+
+    The server carries resident_cache, work_dir, jobs, and counts guarded by lock.
+    """
+
+    def address_string(self) -> str:
+        # Clients of a Unix domain socket have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        logging.info(f"- {self.address_string()} {format % args}")
+
+    def send_body(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status: int, value: Dict[str, Any]) -> None:
+        self.send_body(status, json.dumps(value).encode("utf-8"), "application/json")
+
+    def do_GET(self) -> None:
+        if self.path != "/stats":
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        self.send_json(
+            200,
+            {
+                "checks": self.server.counts["checks"],
+                "result_cache": {
+                    "hits": self.server.counts["result_cache_hits"],
+                    "misses": self.server.counts["result_cache_misses"],
+                },
+                "resident_cache": self.server.resident_cache.get_stats(),
+            },
+        )
+
+    def do_POST(self) -> None:
+        if self.path != "/check":
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        try:
+            request = json.loads(
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            )
+            if not isinstance(request, dict) or not isinstance(
+                request.get("input_file"), str
+            ):
+                raise ValueError("input_file is missing")
+            input_content = get_input_content(request)
+            config = load_config(request, self.server.work_dir, request["input_file"])
+        except Exception as e:
+            self.send_json(400, {"error": f"Invalid check request: {e}"})
+            return
+
+        try:
+            report, issue_count = self.check(config, input_content)
+        except Exception as e:
+            logging.exception(f"Check of {request['input_file']} failed.")
+            self.send_json(500, {"error": f"Check failed: {e}"})
+            return
+
+        self.send_body(
+            200,
+            report,
+            "application/xml",
+            {"X-Issue-Count": str(issue_count)},
+        )
+
+    def check(
+        self, config: Configuration, input_content: Optional[bytes]
+    ) -> Tuple[bytes, int]:
+        bundle_main.preload_schemas(config)
+
+        # qc_baselib only writes reports to files
+        report_fd, report_path = tempfile.mkstemp(
+            suffix=".xqar", dir=self.server.work_dir
+        )
+        os.close(report_fd)
+        try:
+            issue_count, cached = bundle_main.write_report(
+                config,
+                report_path,
+                jobs=self.server.jobs,
+                resident_cache=self.server.resident_cache,
+                input_content=input_content,
+            )
+            with open(report_path, "rb") as report_file:
+                report = report_file.read()
+        finally:
+            os.remove(report_path)
+
+        with self.server.lock:
+            self.server.counts["checks"] += 1
+            if cached is not None:
+                self.server.counts[
+                    "result_cache_hits" if cached else "result_cache_misses"
+                ] += 1
+
+        return report, issue_count
+
+
+def create_server(
+    socket_path: Optional[str],
+    port: Optional[int],
+    max_memory: int,
+    jobs: int,
+    work_dir: str,
+) -> socketserver.BaseServer:
+    """Create the server listening on socket_path, or on port of localhost
+
+    Args:
+        socket_path (Optional[str]): path of the Unix domain socket. None to listen on port
+        port (Optional[int]): port of localhost, 0 to pick a free port
+        max_memory (int): memory in MB of the parsed files kept between checks
+        jobs (int): number of threads running the checkers of each check
+        work_dir (str): directory of the temporary files of the checks
+
+    Returns:
+        socketserver.BaseServer: the server, not serving yet
+    """
+    if socket_path is not None:
+        # Left behind by a server that was killed
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, CheckRequestHandler)
+    else:
+        server = http.server.ThreadingHTTPServer((LOCALHOST, port), CheckRequestHandler)
+
+    server.resident_cache = ResidentCache(max_memory * 1024 * 1024)
+    server.work_dir = work_dir
+    server.jobs = jobs
+    server.counts = collections.Counter()
+    server.lock = threading.Lock()
+
+    return server
+
+
+def main(argv: List[str]) -> None:
+    args = args_entrypoint(argv)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        server = create_server(
+            args.socket_path, args.port, args.max_memory, args.jobs, work_dir
+        )
+        if args.socket_path is not None:
+            logging.info(f"Serving on {args.socket_path}")
+        else:
+            logging.info(f"Serving on http://{LOCALHOST}:{server.server_address[1]}")
+
+        # Stopped by a service manager as by Ctrl-C, removing the socket file
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if args.socket_path is not None and os.path.exists(args.socket_path):
+                os.remove(args.socket_path)
+
+    logging.info("Done")
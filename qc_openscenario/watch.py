@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Check the input file again whenever it or its road network changes
+
+Only the checkers affected by a change run again: all of them when the input
+file changes, only the checkers reading the road network when only the xodr
+file changes. The outcome of the other checkers is replayed from the previous
+run, so the report is the same as the one of a full run.
+"""
+
+import dataclasses
+import logging
+import os
+import threading
+import time
+import types
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from qc_baselib import Configuration, Result
+
+from qc_openscenario import main as bundle_main
+from qc_openscenario.checks import models, registry
+from qc_openscenario.resident_cache import DEFAULT_MAX_MEMORY_MB, ResidentCache
+from qc_openscenario.result_recorder import CheckerCallLog, replay_calls
+
+# Seconds between two looks at the modification time of the watched files
+POLL_INTERVAL = 0.05
+
+FileSignature = Optional[Tuple[int, int]]
+
+
+def get_file_signature(path: Optional[str]) -> FileSignature:
+    """Modification time and size of the file at path. None if there is no such file"""
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_road_network_checker_ids(checkers: List[types.ModuleType]) -> Set[str]:
+    """Get the ids of the checkers whose outcome depends on the road network
+
+    These are the checkers declaring READS_ROAD_NETWORK, and the checkers
+    having one of them among their preconditions, directly or not.
+    """
+    checker_ids = {
+        checker.CHECKER_ID
+        for checker in checkers
+        if getattr(checker, "READS_ROAD_NETWORK", False)
+    }
+    # Preconditions always come first in execution order
+    for checker in checkers:
+        if checker.CHECKER_PRECONDITIONS & checker_ids:
+            checker_ids.add(checker.CHECKER_ID)
+
+    return checker_ids
+
+
+class IncrementalCheck:
+    """Checker bundle runs on the input file of config, keeping the outcome of each checker
+
+    Parsed input documents and road networks are kept in a resident cache, so
+    that a file which did not change is not parsed again.
+    """
+
+    def __init__(self, config: Configuration, jobs: int = 1):
+        self.config = config
+        self.jobs = jobs
+        self.resident_cache = ResidentCache(DEFAULT_MAX_MEMORY_MB * 1024 * 1024)
+        self.input_file: str = config.get_config_param("InputFile")
+        # Data and checker calls of the last run
+        self.checker_data: Optional[models.CheckerData] = None
+        self.checker_calls: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+
+    @property
+    def xodr_file_path(self) -> Optional[str]:
+        return None if self.checker_data is None else self.checker_data.xodr_file_path
+
+    def _finish(self, result: Result, call_log: CheckerCallLog) -> Result:
+        self.checker_calls = call_log.calls
+        result.copy_param_from_config(self.config)
+        return result
+
+    def check_all(self) -> Result:
+        """Run all the checkers"""
+        result = bundle_main.create_result()
+        call_log = CheckerCallLog(result)
+        self.checker_data = bundle_main.run_checks(
+            self.config,
+            call_log,
+            jobs=self.jobs,
+            resident_cache=self.resident_cache,
+        )
+
+        return self._finish(result, call_log)
+
+    def check_road_network(self) -> Result:
+        """Run again the checkers reading the road network, reusing the outcome of the others"""
+        if self.checker_data is None:
+            return self.check_all()
+
+        result = bundle_main.create_result()
+        call_log = CheckerCallLog(result)
+        checker_data = dataclasses.replace(self.checker_data, result=call_log)
+        bundle_main.load_road_network(checker_data)
+
+        specs = {spec.checker_id: spec for spec in registry.get_checker_specs()}
+        checkers = [
+            checker
+            for wave in registry.get_execution_waves(
+                registry.load_checkers(checker_data.enabled_checker_ids)
+            )
+            for checker in wave
+        ]
+        road_network_checker_ids = get_road_network_checker_ids(checkers)
+
+        # In the order of a serial run, so that issue ids are the same as in a full run
+        for checker in checkers:
+            if checker.CHECKER_ID in road_network_checker_ids:
+                bundle_main.execute_checker(
+                    checker,
+                    checker_data,
+                    required_definition_setting=specs[
+                        checker.CHECKER_ID
+                    ].required_definition_setting,
+                )
+            else:
+                replay_calls(call_log, self.checker_calls.get(checker.CHECKER_ID, []))
+
+        self.checker_data = checker_data
+        return self._finish(result, call_log)
+
+
+def write_report_atomically(result: Result, report_path: str) -> None:
+    # Written aside then renamed, so that readers never see a partial report
+    temporary_report_path = f"{report_path}.{os.getpid()}.tmp"
+    result.write_to_file(temporary_report_path, generate_summary=True)
+    os.replace(temporary_report_path, report_path)
+
+
+def watch_input_file(
+    config: Configuration,
+    report_path: str,
+    jobs: int = 1,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Write the report of the input file of config, then update it on every change
+
+    The input file and the road network it references are polled every
+    POLL_INTERVAL seconds.
+
+    Args:
+        config (Configuration): the configuration of the checks
+        report_path (str): path of the report, rewritten after each change
+        jobs (int): number of threads running the checkers
+        stop_event (Optional[threading.Event]): event stopping the watch once set.
+            None to watch until interrupted
+    """
+    stop_event = stop_event or threading.Event()
+    check = IncrementalCheck(config, jobs=jobs)
+
+    input_signature = get_file_signature(check.input_file)
+    start = time.perf_counter()
+    write_report_atomically(check.check_all(), report_path)
+    xodr_signature = get_file_signature(check.xodr_file_path)
+    logging.info(
+        f"Report written in {(time.perf_counter() - start) * 1000:.0f} ms, watching {check.input_file}"
+        + (f" and {check.xodr_file_path}" if check.xodr_file_path else "")
+    )
+
+    while not stop_event.wait(POLL_INTERVAL):
+        new_input_signature = get_file_signature(check.input_file)
+        new_xodr_signature = get_file_signature(check.xodr_file_path)
+        if (
+            new_input_signature == input_signature
+            and new_xodr_signature == xodr_signature
+        ):
+            continue
+
+        start = time.perf_counter()
+        xodr_file_path = check.xodr_file_path
+        if new_input_signature != input_signature:
+            logging.info(f"{check.input_file} changed, running all the checks")
+            result = check.check_all()
+        else:
+            logging.info(
+                f"{check.xodr_file_path} changed, running the road network checks"
+            )
+            result = check.check_road_network()
+        write_report_atomically(result, report_path)
+
+        input_signature = new_input_signature
+        xodr_signature = new_xodr_signature
+        if check.xodr_file_path != xodr_file_path:
+            # The input file now references another road network
+            xodr_signature = get_file_signature(check.xodr_file_path)
+        logging.info(f"Report updated in {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import pytest
+import test_utils
+
+
+@pytest.fixture
+def signal_input_file(tmp_path) -> str:
+    """Copy of the negative scenario of test_utils.SIGNAL_PATH, with its road network"""
+    return test_utils.copy_signal_negative_file(tmp_path)
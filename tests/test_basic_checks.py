@@ -61,6 +61,63 @@ def test_valid_xml_document_negative(
     )
     assert len(xml_doc_issues) == 1
     assert xml_doc_issues[0].level == IssueSeverity.ERROR
+    assert xml_doc_issues[0].locations[0].file_location[0].row == 39
+    assert (
+        result.get_checker_status(basic_checker.root_tag_is_openscenario.CHECKER_ID)
+        == StatusType.SKIPPED
+    )
+    test_utils.cleanup_files()
+
+
+def test_valid_xml_document_negative_empty_file(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/valid_xml_document/"
+    target_file_name = f"xml.valid_xml_document.negative.empty.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(basic_checker.valid_xml_document.CHECKER_ID)
+        == StatusType.COMPLETED
+    )
+
+    xml_doc_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.0.0:xml.valid_xml_document"
+    )
+    assert len(xml_doc_issues) == 1
+    assert xml_doc_issues[0].level == IssueSeverity.ERROR
+    test_utils.cleanup_files()
+
+
+def test_valid_xml_document_missing_file(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/valid_xml_document/"
+    target_file_name = f"xml.valid_xml_document.missing.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(basic_checker.valid_xml_document.CHECKER_ID)
+        == StatusType.ERROR
+    )
+    assert (
+        result.get_checker_status(basic_checker.root_tag_is_openscenario.CHECKER_ID)
+        == StatusType.SKIPPED
+    )
     test_utils.cleanup_files()
 
 
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import gzip
+import os
+import shutil
+import pytest
+import test_utils
+from lxml import etree
+from qc_baselib import Result
+from qc_openscenario import batch
+
+BASE_PATH = "tests/data/positive_duration_in_phase"
+
+
+def test_find_input_files(tmp_path) -> None:
+    list_file_path = tmp_path / "inputs.txt"
+    list_file_path.write_text(
+        f"{BASE_PATH}/positive_example.xosc\n\n{BASE_PATH}/negative_example.xosc\n"
+    )
+
+    from_directory = batch.find_input_files(BASE_PATH)
+    assert len(from_directory) == 6
+    assert from_directory == batch.find_input_files(f"{BASE_PATH}/*.xosc")
+    assert batch.find_input_files(str(list_file_path)) == [
+        f"{BASE_PATH}/negative_example.xosc",
+        f"{BASE_PATH}/positive_example.xosc",
+    ]
+
+
+def test_batch_reports_per_input_file(tmp_path, monkeypatch) -> None:
+    batch.main([BASE_PATH, "-o", str(tmp_path), "--jobs", "2"])
+
+    for input_file in batch.find_input_files(BASE_PATH):
+        report_path = tmp_path / (os.path.basename(input_file) + ".xqar")
+        result = Result()
+        result.load_from_file(str(report_path))
+
+        assert result.get_issue_count() == test_utils.get_issue_count(
+            input_file, monkeypatch
+        )
+
+
+def test_batch_merged_report(tmp_path, monkeypatch) -> None:
+    merged_report_path = tmp_path / "merged.xqar"
+    batch.main([f"{BASE_PATH}/*.xosc", "-m", str(merged_report_path), "--jobs", "2"])
+
+    root = etree.parse(str(merged_report_path)).getroot()
+    bundles = root.findall("CheckerBundle")
+    input_files = batch.find_input_files(BASE_PATH)
+
+    # One checker bundle per input file, in input order
+    assert [
+        bundle.find("Param[@name='InputFile']").get("value") for bundle in bundles
+    ] == input_files
+    for bundle, input_file in zip(bundles, input_files):
+        assert len(bundle.findall(".//Issue")) == test_utils.get_issue_count(
+            input_file, monkeypatch
+        )
+
+    issue_ids = [issue.get("issueId") for issue in root.iter("Issue")]
+    assert issue_ids == [str(i) for i in range(len(issue_ids))]
+
+
+def test_batch_report_paths_of_compressed_input_files(tmp_path) -> None:
+    input_file = str(tmp_path / "inputs" / "positive_example.xosc")
+    os.makedirs(os.path.dirname(input_file))
+    shutil.copy(f"{BASE_PATH}/positive_example.xosc", input_file)
+    with open(input_file, "rb") as f, gzip.open(f"{input_file}.gz", "wb") as gz:
+        gz.write(f.read())
+
+    # Each input file gets its own report
+    output_dir = tmp_path / "reports"
+    batch.main([str(tmp_path / "inputs"), "-o", str(output_dir), "--jobs", "2"])
+    assert sorted(os.listdir(output_dir)) == [
+        "positive_example.xosc.gz.xqar",
+        "positive_example.xosc.xqar",
+    ]
+
+
+def test_batch_failed_check(tmp_path, monkeypatch) -> None:
+    # The report of the first input file cannot be written
+    input_files = batch.find_input_files(BASE_PATH)
+    os.makedirs(tmp_path / (os.path.basename(input_files[0]) + ".xqar"))
+
+    with pytest.raises(SystemExit):
+        batch.main([BASE_PATH, "-o", str(tmp_path), "--jobs", "2"])
+
+    # The other input files are checked all the same
+    for input_file in input_files[1:]:
+        result = Result()
+        result.load_from_file(str(tmp_path / (os.path.basename(input_file) + ".xqar")))
+        assert result.get_issue_count() == test_utils.get_issue_count(
+            input_file, monkeypatch
+        )
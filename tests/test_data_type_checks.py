@@ -7,8 +7,9 @@
 import os
 import pytest
 import test_utils
+from lxml import etree
 from qc_baselib import Result, IssueSeverity, StatusType
-from qc_openscenario.checks import data_type_checker
+from qc_openscenario.checks import data_type_checker, utils
 
 
 def test_positive_duration_in_phase_positive(
@@ -135,6 +136,111 @@ def test_positive_duration_in_phase_negative_parameter(
     test_utils.cleanup_files()
 
 
+def test_positive_duration_in_phase_positive_expression(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/positive_duration_in_phase/"
+    target_file_name = f"positive_example.expression.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            data_type_checker.positive_duration_in_phase.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+
+    assert (
+        len(
+            result.get_issues_by_rule_uid(
+                "asam.net:xosc:1.2.0:data_type.positive_duration_in_phase"
+            )
+        )
+        == 0
+    )
+
+    test_utils.cleanup_files()
+
+
+def test_positive_duration_in_phase_domain_error_expression(
+    monkeypatch, tmp_path
+) -> None:
+    # A math domain error makes the expression non evaluable, the run goes on
+    with open(
+        "tests/data/positive_duration_in_phase/positive_example.expression.xosc", "r"
+    ) as f:
+        content = f.read()
+    target_file_path = tmp_path / "domain_error.expression.xosc"
+    target_file_path.write_text(
+        content.replace("${pow($phase_duration, 2) - 100}", "${pow(-8, 0.5)}")
+    )
+
+    test_utils.create_test_config(str(target_file_path))
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            data_type_checker.positive_duration_in_phase.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+
+    assert (
+        len(
+            result.get_issues_by_rule_uid(
+                "asam.net:xosc:1.2.0:data_type.positive_duration_in_phase"
+            )
+        )
+        == 0
+    )
+
+    test_utils.cleanup_files()
+
+
+def test_positive_duration_in_phase_negative_expression(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/positive_duration_in_phase/"
+    target_file_name = f"negative_example.expression.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            data_type_checker.positive_duration_in_phase.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+
+    data_type_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.2.0:data_type.positive_duration_in_phase"
+    )
+    assert len(data_type_issues) == 1
+    assert data_type_issues[0].level == IssueSeverity.ERROR
+    assert (
+        data_type_issues[0].locations[0].description
+        == "Phase duration -11.0 is negative"
+    )
+    test_utils.cleanup_files()
+
+
 def test_allowed_operators_positive(
     monkeypatch,
 ) -> None:
@@ -346,6 +452,28 @@ def test_allowed_operators_negative_multiple(
     test_utils.cleanup_files()
 
 
+def test_allowed_operators_expression_attributes() -> None:
+    tree, _ = utils.parse_xml_file(
+        "tests/data/allowed_operators/negative_example_multiple.xosc"
+    )
+    index = utils.build_scenario_index(tree)
+
+    expression_attributes = (
+        data_type_checker.allowed_operators.iter_expression_attributes(index)
+    )
+    assert not isinstance(expression_attributes, list)
+
+    expected = [
+        (element, name, value)
+        for element in tree.getroot().iter(etree.Element)
+        for name, value in element.attrib.items()
+        if value.startswith("${")
+    ]
+    assert [(x.element, x.name, x.value) for x in expression_attributes] == expected
+    # No path is computed while scanning the attributes
+    assert len(index.element_paths) == 0
+
+
 def test_non_negative_transition_time_in_light_state_action_positive(
     monkeypatch,
 ) -> None:
@@ -435,3 +563,32 @@ def test_non_negative_transition_time_in_light_state_action_negative_param(
     assert len(data_type_issues) == 1
     assert data_type_issues[0].level == IssueSeverity.ERROR
     test_utils.cleanup_files()
+
+
+def test_non_negative_transition_time_in_light_state_action_negative_expression(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/transition_time_should_be_non_negative/"
+    target_file_name = f"negative_example_expression.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            data_type_checker.non_negative_transition_time_in_light_state_action.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+
+    data_type_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.2.0:data_type.non_negative_transition_time_in_light_state_action"
+    )
+    assert len(data_type_issues) == 1
+    assert data_type_issues[0].level == IssueSeverity.ERROR
+    test_utils.cleanup_files()
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import pytest
+from qc_openscenario.checks import expressions
+from qc_openscenario.checks.expressions import (
+    BinaryOperation,
+    FunctionCall,
+    Number,
+    UnaryOperation,
+    Variable,
+)
+
+
+@pytest.mark.parametrize(
+    "attribute_value,invalid_tokens",
+    [
+        ("${pow(2, 3)}", []),
+        ("${1 or 0 and not 1}", []),
+        ("${-1.0/$TrajRadius}", []),
+        ("${powerer(2, 3)}", ["powerer"]),
+        ("${2*3+4^23}", ["^"]),
+        ("${3^$foo}", ["^"]),
+        ("${2_3}", ["_3"]),
+        ("${round(1.3) % ceil(1.23) - sqrt(18.23} +7-321/65.32", ["}"]),
+        # No exponent in numbers
+        ("${1e5 * 2}", ["e5"]),
+        ("${1.5 + .5 - 2.}", []),
+        # One invalid token per operator
+        ("${$A == $B}", ["=="]),
+        ("${$A <= 1 and $B>=2}", ["<=", ">="]),
+        ("${1 && 0 || 1}", ["&&", "||"]),
+        ("${2^-3}", ["^"]),
+        ("${2^^3}", ["^^"]),
+        ("${$1 + 1}", ["$"]),
+    ],
+)
+def test_invalid_tokens(attribute_value: str, invalid_tokens: list) -> None:
+    assert (
+        expressions.parse_expression(attribute_value).invalid_tokens == invalid_tokens
+    )
+
+
+def test_syntax_tree() -> None:
+    expression = expressions.parse_expression("${not $A and -$B + pow(2, 3) * 4}")
+
+    assert expression.error is None
+    assert expression.ast == BinaryOperation(
+        "and",
+        UnaryOperation("not", Variable("A")),
+        BinaryOperation(
+            "+",
+            UnaryOperation("-", Variable("B")),
+            BinaryOperation(
+                "*", FunctionCall("pow", (Number(2.0), Number(3.0))), Number(4.0)
+            ),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "attribute_value", ["${(1 + 2}", "${1 +}", "${pow 2}", "${}", "${2^3}"]
+)
+def test_syntax_error(attribute_value: str) -> None:
+    expression = expressions.parse_expression(attribute_value)
+
+    assert expression.ast is None
+    assert expression.error is not None
+
+
+def test_parse_results_are_memoized() -> None:
+    assert expressions.parse_expression("${250/3.6}") is expressions.parse_expression(
+        "${250/3.6}"
+    )
+
+
+@pytest.mark.parametrize(
+    "attribute_value,value",
+    [
+        ("${250/3.6 * 3.6}", 250.0),
+        ("${-2 * (3 + 4) % 5}", -4.0),
+        ("${round(2.5) + round(-2.5)}", 0.0),
+        ("${floor(-1.5) + ceil(1.2) + sqrt(16) + pow(2, 3)}", 12.0),
+        ("${$Speed / 2}", 5.0),
+        ("${$Distance - 1}", 19.0),
+        ("${not $Enabled or 1 and 0}", False),
+        ("${not $Enabled and 0 or 1}", True),
+    ],
+)
+def test_evaluate_expression(attribute_value: str, value: float) -> None:
+    parameters = {
+        "Speed": "10",
+        "Distance": "${$Speed * 2}",
+        "Enabled": "true",
+    }
+
+    assert expressions.evaluate_expression(attribute_value, parameters.get) == value
+
+
+@pytest.mark.parametrize(
+    "attribute_value",
+    [
+        "${1 / 0}",
+        "${1 % (2 - 2)}",
+        "${sqrt(-1)}",
+        "${pow(2)}",
+        "${$Undeclared + 1}",
+        "${$Name + 1}",
+        "${$Loop + 1}",
+        "${2^3}",
+        "${__import__('os')}",
+        "${pow(-8, 0.5)}",
+        "${floor($NaN)}",
+        "${ceil($Infinity)}",
+    ],
+)
+def test_evaluate_expression_undefined(attribute_value: str) -> None:
+    parameters = {"Name": "Ego", "Loop": "$Loop", "NaN": "nan", "Infinity": "inf"}
+
+    assert expressions.evaluate_expression(attribute_value, parameters.get) is None
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import bz2
+import gzip
+import lzma
+import pytest
+import test_utils
+from lxml import etree
+from qc_baselib import Result, IssueSeverity, StatusType
+from qc_openscenario.checks import (
+    basic_checker,
+    data_type_checker,
+    reference_checker,
+    utils,
+)
+
+
+def test_strip_default_namespace(monkeypatch) -> None:
+    tree = etree.ElementTree(
+        etree.fromstring(
+            '<OpenSCENARIO xmlns="http://example.com/xosc" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            '<!-- comment --><FileHeader xsi:noNamespaceSchemaLocation="a.xsd"/>'
+            "<xsi:Other/></OpenSCENARIO>"
+        )
+    )
+    utils.strip_default_namespace(tree)
+    assert [x.tag for x in tree.getroot().iter(etree.Element)] == [
+        "OpenSCENARIO",
+        "FileHeader",
+        "{http://www.w3.org/2001/XMLSchema-instance}Other",
+    ]
+
+    # Nothing to strip, the tree is left as it is
+    def fail(*args, **kwargs):
+        raise AssertionError("namespaces cleaned up")
+
+    monkeypatch.setattr(utils.etree, "cleanup_namespaces", fail)
+    tree = etree.ElementTree(
+        etree.fromstring("<OpenSCENARIO><FileHeader/></OpenSCENARIO>")
+    )
+    utils.strip_default_namespace(tree)
+    assert [x.tag for x in tree.getroot().iter()] == ["OpenSCENARIO", "FileHeader"]
+
+
+@pytest.mark.parametrize(
+    "compress",
+    [
+        ("gz", gzip.compress),
+        ("xz", lzma.compress),
+        ("bz2", bz2.compress),
+    ],
+)
+def test_compressed_input_file(
+    monkeypatch,
+    tmp_path,
+    compress,
+) -> None:
+    extension, compress_function = compress
+    base_path = "tests/data/positive_duration_in_phase/"
+    target_file_name = f"negative_example.xosc"
+    with open(os.path.join(base_path, target_file_name), "rb") as input_file:
+        compressed_content = compress_function(input_file.read())
+
+    target_file_path = tmp_path / f"{target_file_name}.{extension}"
+    target_file_path.write_bytes(compressed_content)
+
+    test_utils.create_test_config(str(target_file_path))
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            data_type_checker.positive_duration_in_phase.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+    data_type_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.2.0:data_type.positive_duration_in_phase"
+    )
+    assert len(data_type_issues) == 1
+    assert data_type_issues[0].level == IssueSeverity.ERROR
+
+    test_utils.cleanup_files()
+
+
+@pytest.mark.parametrize(
+    "compress",
+    [
+        ("gz", gzip.compress),
+        ("xz", lzma.compress),
+        ("bz2", bz2.compress),
+    ],
+)
+@pytest.mark.parametrize(
+    "damage",
+    [
+        # Truncated archive
+        lambda content: content[: len(content) // 2],
+        # Corrupted archive, the header is kept so that the format is recognized
+        lambda content: content[:20]
+        + bytes(b ^ 0xFF for b in content[20:60])
+        + content[60:],
+    ],
+)
+def test_damaged_compressed_input_file(
+    monkeypatch,
+    tmp_path,
+    compress,
+    damage,
+) -> None:
+    extension, compress_function = compress
+    base_path = "tests/data/positive_duration_in_phase/"
+    target_file_name = f"negative_example.xosc"
+    with open(os.path.join(base_path, target_file_name), "rb") as input_file:
+        compressed_content = damage(compress_function(input_file.read()))
+
+    target_file_path = tmp_path / f"{target_file_name}.{extension}"
+    target_file_path.write_bytes(compressed_content)
+
+    test_utils.create_test_config(str(target_file_path))
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    # Reported as an unreadable file, the other checkers are skipped
+    assert (
+        result.get_checker_status(basic_checker.valid_xml_document.CHECKER_ID)
+        == StatusType.ERROR
+    )
+    assert (
+        result.get_checker_status(
+            data_type_checker.positive_duration_in_phase.CHECKER_ID
+        )
+        == StatusType.SKIPPED
+    )
+
+    test_utils.cleanup_files()
+
+
+def test_compressed_road_network_file(
+    monkeypatch,
+    tmp_path,
+) -> None:
+    base_path = "tests/data/resolvable_signal_id_in_traffic_signal_state_action/"
+    target_file_name = f"reference_control.resolvable_signal_id_in_traffic_signal_state_action.positive.xosc"
+    with open(os.path.join(base_path, target_file_name), "rb") as input_file:
+        xosc_content = input_file.read()
+    with open(os.path.join(base_path, "test.xodr"), "rb") as input_file:
+        xodr_content = input_file.read()
+
+    target_file_path = tmp_path / target_file_name
+    target_file_path.write_bytes(
+        xosc_content.replace(b'filepath="test.xodr"', b'filepath="test.xodr.gz"')
+    )
+    (tmp_path / "test.xodr.gz").write_bytes(gzip.compress(xodr_content))
+
+    test_utils.create_test_config(str(target_file_path))
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            reference_checker.resolvable_signal_id_in_traffic_signal_state_action.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+    assert (
+        len(
+            result.get_issues_by_rule_uid(
+                "asam.net:xosc:1.2.0:reference_control.resolvable_signal_id_in_traffic_signal_state_action"
+            )
+        )
+        == 0
+    )
+
+    test_utils.cleanup_files()
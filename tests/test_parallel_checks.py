@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import pytest
+import test_utils
+from qc_openscenario.checks import data_type_checker, models
+
+
+@pytest.mark.parametrize(
+    "target_file_path",
+    [
+        "tests/data/allowed_operators/negative_example_multiple.xosc",
+        "tests/data/unique_element_names_on_same_level/unique_element_names_on_same_level.negative.multiple.xosc",
+        "tests/data/valid_schema/xml.valid_schema.negative.many_errors.xosc",
+        "tests/data/valid_xml_document/xml.valid_xml_document.negative.xosc",
+    ],
+)
+def test_parallel_checks_match_serial_checks(
+    monkeypatch,
+    target_file_path: str,
+) -> None:
+    test_utils.create_test_config(target_file_path)
+    test_utils.launch_main(monkeypatch)
+    with open(test_utils.REPORT_FILE_PATH, "rb") as report_file:
+        serial_report = report_file.read()
+
+    test_utils.launch_main(monkeypatch, ["--jobs", "4"])
+    with open(test_utils.REPORT_FILE_PATH, "rb") as report_file:
+        parallel_report = report_file.read()
+
+    assert parallel_report == serial_report
+
+    test_utils.cleanup_files()
+
+
+def test_parallel_checks_log_committed_errors_only(monkeypatch, caplog) -> None:
+    # The checkers running ahead of a failed basic check are skipped silently
+    test_utils.create_test_config(
+        "tests/data/valid_xml_document/xml.valid_xml_document.negative.xosc"
+    )
+    test_utils.launch_main(monkeypatch, ["--jobs", "4"])
+    test_utils.cleanup_files()
+
+    assert not [
+        record for record in caplog.records if "An error occurred" in record.message
+    ]
+
+
+def test_parallel_checks_log_committed_errors(monkeypatch, caplog) -> None:
+    def check_rule(checker_data: models.CheckerData) -> None:
+        raise RuntimeError("broken checker")
+
+    monkeypatch.setattr(
+        data_type_checker.positive_duration_in_phase, "check_rule", check_rule
+    )
+    test_utils.create_test_config(
+        "tests/data/positive_duration_in_phase/positive_example.xosc"
+    )
+    test_utils.launch_main(monkeypatch, ["--jobs", "4"])
+    test_utils.cleanup_files()
+
+    assert [
+        record.message
+        for record in caplog.records
+        if "An error occurred" in record.message
+    ] == [
+        f"An error occurred in {data_type_checker.positive_duration_in_phase.CHECKER_ID}."
+    ]
@@ -8,7 +8,7 @@ import os
 import pytest
 import test_utils
 from qc_baselib import Result, IssueSeverity, StatusType
-from qc_openscenario.checks import reference_checker
+from qc_openscenario.checks import reference_checker, utils
 
 
 def test_uniquely_resolvable_positive1(
@@ -230,6 +230,38 @@ def test_traffic_signal_state_positive(
     )
 
 
+def test_traffic_signal_state_positive_default_namespace_xodr(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/resolvable_signal_id_in_traffic_signal_state_action/"
+    target_file_name = f"reference_control.resolvable_signal_id_in_traffic_signal_state_action.positive.default_namespace.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            reference_checker.resolvable_signal_id_in_traffic_signal_state_action.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+
+    assert (
+        len(
+            result.get_issues_by_rule_uid(
+                "asam.net:xosc:1.2.0:reference_control.resolvable_signal_id_in_traffic_signal_state_action"
+            )
+        )
+        == 0
+    )
+    test_utils.cleanup_files()
+
+
 def test_traffic_signal_state_negative(
     monkeypatch,
 ) -> None:
@@ -259,6 +291,46 @@ def test_traffic_signal_state_negative(
     test_utils.cleanup_files()
 
 
+def test_traffic_signal_state_negative_road_network_cache(
+    monkeypatch,
+    tmp_path,
+) -> None:
+    base_path = "tests/data/resolvable_signal_id_in_traffic_signal_state_action/"
+    target_file_name = f"reference_control.resolvable_signal_id_in_traffic_signal_state_action.negative.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+    cache_dir = tmp_path / "xodr_cache"
+
+    test_utils.create_test_config(
+        target_file_path, bundle_params={"xodrCacheDir": str(cache_dir)}
+    )
+
+    test_utils.launch_main(monkeypatch)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # The second run must not read the xodr file anymore
+    def fail(*args, **kwargs):
+        raise AssertionError("xodr file parsed despite the cache")
+
+    monkeypatch.setattr(utils, "get_road_network_summary", fail)
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(
+            reference_checker.resolvable_signal_id_in_traffic_signal_state_action.CHECKER_ID
+        )
+        == StatusType.COMPLETED
+    )
+
+    reference_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.2.0:reference_control.resolvable_signal_id_in_traffic_signal_state_action"
+    )
+    assert len(reference_issues) == 1
+    test_utils.cleanup_files()
+
+
 def test_traffic_signal_controller_positive(
     monkeypatch,
 ) -> None:
@@ -541,6 +613,40 @@ def test_resolvable_entity_reference_negative_multiple(
     test_utils.cleanup_files()
 
 
+@pytest.mark.parametrize(
+    "entity_ref",
+    ["${powerer(2, 3)}", "${1 or 0 and not 1}"],
+)
+def test_resolvable_entity_reference_negative_expression(
+    monkeypatch, tmp_path, entity_ref: str
+) -> None:
+    # Expressions are reported as written, whether they can be evaluated or not
+    target_file_path = str(tmp_path / "entity_reference.xosc")
+    with open(
+        "tests/data/resolvable_entity_references/reference_control.resolvable_entity_references.negative.xosc"
+    ) as f:
+        content = f.read()
+    with open(target_file_path, "w") as f:
+        f.write(content.replace('entityRef="Vehicle 2"', f'entityRef="{entity_ref}"'))
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    reference_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.2.0:reference_control.resolvable_entity_references"
+    )
+    assert len(reference_issues) == 1
+    assert (
+        f"with id {entity_ref} not found"
+        in reference_issues[0].locations[0].description
+    )
+    test_utils.cleanup_files()
+
+
 def test_resolvable_variable_reference_positive(
     monkeypatch,
 ) -> None:
@@ -765,6 +871,39 @@ def test_resolvable_storyboard_element_reference_negative_parameter(
     test_utils.cleanup_files()
 
 
+def test_resolvable_storyboard_element_reference_negative_expression(
+    monkeypatch, tmp_path
+) -> None:
+    target_file_path = str(tmp_path / "storyboard_element_reference.xosc")
+    with open(
+        "tests/data/resolvable_storyboard_element_reference/resolvable_storyboard_element_reference.negative.xosc"
+    ) as f:
+        content = f.read()
+    with open(target_file_path, "w") as f:
+        f.write(
+            content.replace(
+                'storyboardElementRef="Act2"', 'storyboardElementRef="${powerer(2, 3)}"'
+            )
+        )
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    reference_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.2.0:reference_control.resolvable_storyboard_element_reference"
+    )
+    assert len(reference_issues) == 2
+    assert (
+        "reference ${powerer(2, 3)} not found"
+        in reference_issues[0].locations[0].description
+    )
+    test_utils.cleanup_files()
+
+
 def test_unique_element_names_on_same_level_positive(
     monkeypatch,
 ) -> None:
@@ -889,3 +1028,22 @@ def test_unique_element_names_on_same_level_negative_multiple(
     assert "Event222" in reference_issues[1].locations[0].description
     assert "Event1" in reference_issues[2].locations[0].description
     test_utils.cleanup_files()
+
+
+def test_unique_element_names_on_same_level_paths() -> None:
+    tree, _ = utils.parse_xml_file(
+        "tests/data/unique_element_names_on_same_level/unique_element_names_on_same_level.negative.multiple.xosc"
+    )
+    index = utils.build_scenario_index(tree)
+
+    duplicates = reference_checker.unique_element_names_on_same_level.are_names_unique_at_each_level(
+        index, tree.getroot()
+    )
+
+    # Second occurrences of Story1, Event222 and Event1, in breadth-first order
+    elements_by_line = {x.sourceline: x for x in tree.getroot().iter()}
+    assert [x.xpath for x in duplicates] == [
+        tree.getpath(elements_by_line[line]) for line in (104, 64, 128)
+    ]
+    # Paths are only computed for the duplicates, not for every element
+    assert len(index.element_paths) < sum(1 for _ in tree.getroot().iter())
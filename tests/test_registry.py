@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import importlib
+import subprocess
+import sys
+import pytest
+import test_utils
+from qc_baselib import Result, StatusType
+from qc_openscenario import constants
+from qc_openscenario.checks import (
+    basic_checker,
+    registry,
+    schema_checker,
+)
+
+
+def test_checker_registry() -> None:
+    specs = registry.get_checker_specs()
+    checkers = registry.load_checkers()
+
+    assert [x.CHECKER_ID for x in checkers] == [x.checker_id for x in specs]
+    assert [x.__name__ for x in checkers] == [x.module_name for x in specs]
+
+    waves = registry.get_execution_waves(checkers)
+    assert [[x.CHECKER_ID for x in wave] for wave in waves[:5]] == [
+        [basic_checker.valid_xml_document.CHECKER_ID],
+        [basic_checker.root_tag_is_openscenario.CHECKER_ID],
+        [basic_checker.fileheader_is_present.CHECKER_ID],
+        [basic_checker.version_is_defined.CHECKER_ID],
+        [schema_checker.valid_schema.CHECKER_ID],
+    ]
+    # All the semantic checkers only depend on the basic and schema checks
+    assert len(waves) == 6
+    assert len(waves[5]) == len(checkers) - 5
+
+
+def test_checker_registry_declared_ids() -> None:
+    # The ids of CHECKER_MODULES are the CHECKER_ID of their modules
+    for package_name in registry.CHECKER_PACKAGES:
+        package = importlib.import_module(f"qc_openscenario.checks.{package_name}")
+        for checker_id, module_name in package.CHECKER_MODULES.items():
+            assert getattr(package, module_name).CHECKER_ID == checker_id
+
+
+def test_checker_registry_mismatched_id(monkeypatch) -> None:
+    monkeypatch.setitem(
+        basic_checker.CHECKER_MODULES,
+        "check_asam_xosc_xml_valid_xml_document",
+        "root_tag_is_openscenario",
+    )
+
+    with pytest.raises(ValueError, match="check_asam_xosc_xml_valid_xml_document"):
+        registry.load_checkers()
+
+
+def test_checker_registry_imports_checkers_in_scope_only() -> None:
+    # In a new interpreter, as this one already imported all the checkers
+    code = (
+        "import sys\n"
+        "from qc_openscenario.checks import registry\n"
+        "registry.load_checkers({'check_asam_xosc_data_type_allowed_operators'})\n"
+        "print(sorted(x for x in sys.modules if 'checker.' in x))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert "data_type_checker.allowed_operators" in output
+    assert "reference_checker" not in output
+    assert "data_type_checker.positive_duration_in_phase" not in output
+
+
+def test_failed_precondition_skips_dependent_checkers(
+    monkeypatch,
+) -> None:
+    test_utils.create_test_config(
+        "tests/data/valid_schema/xml.valid_schema.negative.xosc"
+    )
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    semantic_checkers = registry.get_execution_waves(registry.load_checkers())[5]
+    for checker in semantic_checkers:
+        assert result.get_checker_status(checker.CHECKER_ID) == StatusType.SKIPPED
+        assert result.get_checker_result(
+            constants.BUNDLE_NAME, checker.CHECKER_ID
+        ).summary.startswith("Preconditions are not satisfied. Skip the check.")
+
+    test_utils.cleanup_files()
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from qc_openscenario.resident_cache import ResidentCache
+
+
+def test_resident_cache_eviction(tmp_path) -> None:
+    paths = []
+    for i in range(3):
+        paths.append(tmp_path / f"{i}.xml")
+        paths[-1].write_text("x" * 10)
+
+    cache = ResidentCache(max_bytes=25)
+    load_count = 0
+
+    def load(path):
+        nonlocal load_count
+        load_count += 1
+        return path
+
+    for path in paths + paths[2:]:
+        cache.get_or_load("file", str(path), load, lambda _, size: size)
+
+    # Only the two most recently used files fit
+    assert load_count == 3
+    assert cache.get_stats() == {
+        "entries": 2,
+        "bytes": 20,
+        "max_bytes": 25,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+    }
+
+    # A changed file is loaded again, replacing its former version
+    paths[2].write_text("x" * 12)
+    cache.get_or_load("file", str(paths[2]), load, lambda _, size: size)
+    assert load_count == 4
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get_stats()["bytes"] == 22
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import logging
+import os
+import test_utils
+from typing import List, Optional
+from qc_baselib import Configuration, Result
+from qc_openscenario import constants
+from qc_openscenario import main
+
+
+def write_report(
+    input_file: str,
+    tmp_path,
+    checker_ids: Optional[List[str]] = None,
+    streaming: bool = False,
+) -> tuple[int, Optional[bool], bytes]:
+    test_utils.create_test_config(
+        input_file,
+        checker_ids=checker_ids,
+        bundle_params={"resultCacheDir": str(tmp_path / "cache")},
+    )
+    config = Configuration()
+    config.load_from_file(test_utils.CONFIG_FILE_PATH)
+    os.remove(test_utils.CONFIG_FILE_PATH)
+
+    report_path = tmp_path / "report.xqar"
+    issue_count, cached = main.write_report(
+        config, str(report_path), streaming=streaming
+    )
+    with open(report_path, "rb") as report_file:
+        return issue_count, cached, report_file.read()
+
+
+def test_result_cache_hit(signal_input_file, tmp_path, monkeypatch) -> None:
+    issue_count, cached, report = write_report(signal_input_file, tmp_path)
+    assert cached is False
+
+    # The stored report is emitted without running the checks
+    monkeypatch.setattr(main, "run_checks", None)
+    assert write_report(signal_input_file, tmp_path) == (issue_count, True, report)
+
+
+def test_result_cache_invalidation(signal_input_file, tmp_path, monkeypatch) -> None:
+    issue_count, _, _ = write_report(signal_input_file, tmp_path)
+    xodr_file = os.path.join(os.path.dirname(signal_input_file), "test.xodr")
+
+    # Road network referenced by the input file
+    test_utils.replace_in_file(xodr_file, 'id="12345"', 'id="12346"')
+    xodr_issue_count, cached, _ = write_report(signal_input_file, tmp_path)
+    assert cached is False
+    assert xodr_issue_count == issue_count - 1
+    assert write_report(signal_input_file, tmp_path)[:2] == (xodr_issue_count, True)
+
+    # Input file
+    test_utils.replace_in_file(signal_input_file, 'name="12346"', 'name="12347"')
+    input_issue_count, cached, _ = write_report(signal_input_file, tmp_path)
+    assert cached is False
+    assert input_issue_count == issue_count
+
+    # Checker configuration
+    assert (
+        write_report(
+            signal_input_file,
+            tmp_path,
+            checker_ids=["check_asam_xosc_xml_valid_xml_document"],
+        )[1]
+        is False
+    )
+
+    # Bundle version
+    monkeypatch.setattr(constants, "BUNDLE_VERSION", "0.0.0")
+    assert write_report(signal_input_file, tmp_path)[1] is False
+
+
+def test_result_cache_streaming(signal_input_file, tmp_path) -> None:
+    checker_ids = [
+        "check_asam_xosc_reference_control_resolvable_signal_id_in_traffic_signal_state_action"
+    ]
+
+    # Streaming runs only the configured checkers, their reports are kept apart
+    _, cached, streaming_report = write_report(
+        signal_input_file, tmp_path, checker_ids=checker_ids, streaming=True
+    )
+    assert cached is False
+    _, cached, report = write_report(
+        signal_input_file, tmp_path, checker_ids=checker_ids
+    )
+    assert cached is False
+    assert report != streaming_report
+
+    for _ in range(2):
+        assert write_report(
+            signal_input_file, tmp_path, checker_ids=checker_ids, streaming=True
+        )[1:] == (True, streaming_report)
+        assert write_report(signal_input_file, tmp_path, checker_ids=checker_ids)[
+            1:
+        ] == (
+            True,
+            report,
+        )
+
+
+def test_result_cache_statistics(
+    signal_input_file, tmp_path, monkeypatch, caplog
+) -> None:
+    caplog.set_level(logging.INFO)
+    test_utils.create_test_config(
+        signal_input_file, bundle_params={"resultCacheDir": str(tmp_path / "cache")}
+    )
+    test_utils.launch_main(monkeypatch)
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+    test_utils.cleanup_files()
+
+    assert result.get_issue_count() > 0
+    assert [
+        record.message for record in caplog.records if "Result cache" in record.message
+    ] == [
+        "Result cache: 0 hit(s), 1 miss(es)",
+        "Result cache: 1 hit(s), 0 miss(es)",
+    ]
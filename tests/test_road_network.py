@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from qc_baselib import Configuration, Result, StatusType
+from qc_openscenario import constants, main
+from qc_openscenario.checks import reference_checker, utils
+
+
+def test_road_network_summary() -> None:
+    xodr_file_path = "tests/data/parametric_input_xodr/Databases/fabriksgatan.xodr"
+    full_tree, _ = utils.parse_xml_file(xodr_file_path)
+    summary = utils.get_road_network_summary(xodr_file_path)
+
+    assert summary.signal_ids == {x.get("id") for x in full_tree.iter("signal")}
+    assert summary.road_ids == {x.get("id") for x in full_tree.iter("road")}
+    assert summary.controller_ids == {
+        x.get("id") for x in full_tree.getroot().findall("controller")
+    }
+    assert summary.lane_ids == {
+        (road.get("id"), lane.get("id"))
+        for road in full_tree.iter("road")
+        for lane in road.iter("lane")
+    }
+    assert len(summary.lane_ids) > 0
+
+    summary = utils.get_road_network_summary(
+        "tests/data/resolvable_signal_id_in_traffic_signal_state_action/test.xodr"
+    )
+    assert summary.signal_ids == {"12345"}
+    assert summary.lane_ids == {("1", "3"), ("1", "2"), ("1", "1"), ("1", "0")}
+
+    assert utils.get_road_network_summary("tests/data/not_existing.xodr") is None
+
+
+def test_xodr_file_path_resolution() -> None:
+    tree, _ = utils.parse_xml_file(
+        "tests/data/parametric_input_xodr/CloseVehicleCrossing.xosc"
+    )
+    previous_wd = os.getcwd()
+
+    xodr_file_path = utils.get_xodr_file_path(
+        "tests/data/parametric_input_xodr/CloseVehicleCrossing.xosc", tree
+    )
+
+    assert os.getcwd() == previous_wd
+    assert xodr_file_path == os.path.abspath(
+        "tests/data/parametric_input_xodr/Databases/fabriksgatan.xodr"
+    )
+
+
+def test_concurrent_checks_in_different_directories() -> None:
+    target_file_paths = [
+        "tests/data/parametric_input_xodr/CloseVehicleCrossing.xosc",
+        "tests/data/resolvable_signal_id_in_traffic_signal_state_action/reference_control.resolvable_signal_id_in_traffic_signal_state_action.positive.xosc",
+    ] * 8
+
+    def check(target_file_path: str) -> Result:
+        config = Configuration()
+        config.set_config_param(name="InputFile", value=target_file_path)
+        config.register_checker_bundle(checker_bundle_name=constants.BUNDLE_NAME)
+        result = Result()
+        result.register_checker_bundle(
+            name=constants.BUNDLE_NAME,
+            description="OpenScenario checker bundle",
+            version=constants.BUNDLE_VERSION,
+            summary="",
+        )
+        main.run_checks(config, result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(check, target_file_paths))
+
+    for result in results:
+        assert result.all_checkers_completed()
+        assert result.get_issue_count() == 0
+        assert (
+            result.get_checker_status(
+                reference_checker.resolvable_signal_id_in_traffic_signal_state_action.CHECKER_ID
+            )
+            == StatusType.COMPLETED
+        )
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import pytest
+from lxml import etree
+from qc_openscenario.checks import models, utils
+
+
+@pytest.mark.parametrize(
+    "target_file_path",
+    [
+        "tests/data/resolvable_storyboard_element_reference/resolvable_storyboard_element_reference.positive.parameter.xosc",
+        "tests/data/valid_actor_reference_in_private_actions/reference_control.valid_actor_reference_in_private_actions.negative.xosc",
+        "tests/data/parametric_input_xodr/CloseVehicleCrossing.xosc",
+    ],
+)
+def test_scenario_index(target_file_path: str) -> None:
+    tree, _ = utils.parse_xml_file(target_file_path)
+    root = tree.getroot()
+    index = utils.build_scenario_index(tree)
+
+    assert index.find_all("ManeuverGroup") == root.findall(".//ManeuverGroup")
+    assert index.find_all("NotATag") == []
+    for maneuver_group in root.iter("ManeuverGroup"):
+        assert index.find_all(
+            "PrivateAction", within=maneuver_group
+        ) == maneuver_group.findall(".//PrivateAction")
+
+    storyboard = root.find("Storyboard")
+    assert index.find_all_with_attribute(
+        "entityRef", within=storyboard
+    ) == storyboard.xpath(".//*[@entityRef]")
+    assert index.entities == list(root.find("Entities"))
+
+    storyboard_elements = root.xpath(
+        "//Story|//Act|//ManeuverGroup|//Maneuver|//Event|//Action"
+    )
+    assert sum(len(x) for x in index.storyboard_elements.values()) == len(
+        [x for x in storyboard_elements if x.get("name") is not None]
+    )
+
+    for parameter_declaration in root.iter("ParameterDeclaration"):
+        declaring_element = parameter_declaration.getparent().getparent()
+        assert parameter_declaration.get("name") in (
+            index.parameter_declarations[declaring_element]
+        )
+
+
+def test_scenario_index_paths() -> None:
+    tree, _ = utils.parse_xml_file(
+        "tests/data/unique_element_names_on_same_level/unique_element_names_on_same_level.negative.multiple.xosc"
+    )
+    index = utils.build_scenario_index(tree)
+
+    # Leaves first, so that paths are computed before the ones of their ancestors
+    for element in reversed(list(tree.getroot().iter(etree.Element))):
+        assert index.get_path(element) == tree.getpath(element)
+
+
+@pytest.mark.parametrize(
+    "target_file_path",
+    [
+        "tests/data/parametric_operator_in_expression/TrailerConnect.xosc",
+        "tests/data/valid_parameter_declaration_in_catalogs/parameters.valid_parameter_declaration_in_catalogs.negative.multiple.xosc",
+        "tests/data/resolvable_storyboard_element_reference/resolvable_storyboard_element_reference.positive.parameter.xosc",
+        "tests/data/parametric_input_xodr/CloseVehicleCrossing.xosc",
+    ],
+)
+def test_scenario_index_parameter_scopes(target_file_path: str) -> None:
+    tree, _ = utils.parse_xml_file(target_file_path)
+    index = utils.build_scenario_index(tree)
+
+    parameter_names = {x.get("name") for x in tree.iter("ParameterDeclaration")}
+    assert len(parameter_names) > 0
+    for element in tree.getroot().iter(etree.Element):
+        for parameter_name in parameter_names:
+            assert index.get_parameter_value(
+                element, parameter_name
+            ) == utils.get_parameter_value_from_node(tree, element, parameter_name)
+
+
+def test_scenario_index_resolved_attributes() -> None:
+    tree, _ = utils.parse_xml_file(
+        "tests/data/parametric_operator_in_expression/TrailerConnect.xosc"
+    )
+    index = utils.build_scenario_index(tree)
+
+    attribute_types = set()
+    for element in tree.getroot().iter(etree.Element):
+        for attribute_name, attribute_value in element.attrib.items():
+            resolved_attribute = index.get_resolved_attribute(element, attribute_name)
+            attribute_types.add(resolved_attribute.attribute_type)
+
+            assert resolved_attribute.raw_value == attribute_value
+            if resolved_attribute.attribute_type == models.AttributeType.PARAMETER:
+                assert resolved_attribute.value == utils.get_parameter_value_from_node(
+                    tree, element, attribute_value[1:]
+                )
+            elif resolved_attribute.attribute_type == models.AttributeType.VALUE:
+                assert resolved_attribute.value == attribute_value
+
+    assert attribute_types == set(models.AttributeType)
+    assert index.get_resolved_attribute(tree.getroot(), "notAnAttribute") is None
+
+
+def test_scenario_index_expression_values() -> None:
+    tree, _ = utils.parse_xml_file(
+        "tests/data/positive_duration_in_phase/negative_example.expression.xosc"
+    )
+    index = utils.build_scenario_index(tree)
+
+    phase = index.find_all("Phase")[0]
+    duration = index.get_resolved_attribute(phase, "duration")
+    assert duration.attribute_type == models.AttributeType.EXPRESSION
+    assert duration.value == "-11.0"
+
+    # Same expression seen from the same scope, the memoized value is reused
+    assert len(index.expression_values) == 1
+    index.evaluate_expression(phase.getparent(), duration.raw_value)
+    assert len(index.expression_values) == 1
@@ -5,9 +5,11 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import os
+import types
 import pytest
 import test_utils
-from qc_baselib import Result, IssueSeverity, StatusType
+from qc_baselib import Configuration, Result, IssueSeverity, StatusType
+from qc_openscenario import constants
 from qc_openscenario.checks import schema_checker
 
 
@@ -112,3 +114,123 @@ def test_invalid_schema(
     assert len(xml_schema_issues) == 1
     assert xml_schema_issues[0].level == IssueSeverity.ERROR
     test_utils.cleanup_files()
+
+
+def test_valid_schema_positive_default_namespace(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/valid_schema/"
+    target_file_name = f"xml.valid_schema.positive.default_namespace.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(schema_checker.valid_schema.CHECKER_ID)
+        == StatusType.COMPLETED
+    )
+
+    assert (
+        len(result.get_issues_by_rule_uid("asam.net:xosc:1.0.0:xml.valid_schema")) == 0
+    )
+
+    test_utils.cleanup_files()
+
+
+def test_valid_schema_negative_identical_errors_collapsed(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/valid_schema/"
+    target_file_name = f"xml.valid_schema.negative.many_errors.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(target_file_path)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    xml_schema_issues = result.get_issues_by_rule_uid(
+        "asam.net:xosc:1.0.0:xml.valid_schema"
+    )
+    # 6 identical errors on Center plus 6 distinct errors on Dimensions
+    assert len(xml_schema_issues) == 7
+    center_location = xml_schema_issues[0].locations[0].file_location[0]
+    assert center_location.row == 11
+    assert "6 occurrences from line 11 to line 76" in (
+        xml_schema_issues[0].locations[0].description
+    )
+    test_utils.cleanup_files()
+
+
+def test_valid_schema_negative_max_issues(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/valid_schema/"
+    target_file_name = f"xml.valid_schema.negative.many_errors.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(
+        target_file_path, checker_ids=[schema_checker.valid_schema.CHECKER_ID]
+    )
+    config = Configuration()
+    config.load_from_file(test_utils.CONFIG_FILE_PATH)
+    config.set_checker_param(
+        checker_bundle_name=constants.BUNDLE_NAME,
+        checker_id=schema_checker.valid_schema.CHECKER_ID,
+        name="maxIssues",
+        value=3,
+    )
+    config.write_to_file(test_utils.CONFIG_FILE_PATH)
+
+    test_utils.launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(schema_checker.valid_schema.CHECKER_ID)
+        == StatusType.COMPLETED
+    )
+    assert (
+        len(result.get_issues_by_rule_uid("asam.net:xosc:1.0.0:xml.valid_schema")) == 3
+    )
+    # The errors on the 4 last Dimensions elements are not reported
+    assert "4 more errors suppressed" in (
+        result.get_checker_result(
+            constants.BUNDLE_NAME, schema_checker.valid_schema.CHECKER_ID
+        ).summary
+    )
+    test_utils.cleanup_files()
+
+
+def test_valid_schema_errors_grouped_by_line_range() -> None:
+    errors = [
+        types.SimpleNamespace(message=message, line=line, column=1)
+        for message, line in [
+            ("a", 10),
+            ("b", 12),
+            ("a", 20),
+            ("a", 5000),
+            ("a", 5050),
+        ]
+    ]
+
+    # Clusters of the same error far apart are reported separately
+    groups, suppressed_count = schema_checker.valid_schema._group_errors(errors, 0)
+    assert [(x.message, x.first_line, x.last_line, x.count) for x in groups] == [
+        ("a", 10, 20, 2),
+        ("b", 12, 12, 1),
+        ("a", 5000, 5050, 2),
+    ]
+    assert suppressed_count == 0
+
+    groups, suppressed_count = schema_checker.valid_schema._group_errors(errors, 2)
+    assert [x.message for x in groups] == ["a", "b"]
+    assert suppressed_count == 2
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import test_utils
+from qc_baselib import Result, StatusType
+from qc_openscenario.checks import schema_checker
+from qc_openscenario.schema import schema_files
+
+
+def test_schema_compiled_once_per_process(
+    monkeypatch,
+) -> None:
+    base_path = "tests/data/valid_schema/"
+    target_file_name = f"xml.valid_schema.negative.xosc"
+    target_file_path = os.path.join(base_path, target_file_name)
+
+    test_utils.create_test_config(
+        target_file_path, bundle_params={"preloadSchemaVersions": "1.2.0, 1.3.0"}
+    )
+    test_utils.launch_main(monkeypatch)
+
+    assert schema_files.get_schema("1.2.0") is schema_files.get_schema("1.2.0")
+    assert schema_files.get_schema("0.9.0") is None
+    # One validation lock per schema, validations against different schemas do not wait
+    assert schema_files.get_validation_lock(
+        "1.2.0"
+    ) is schema_files.get_validation_lock("1.2.0")
+    assert schema_files.get_validation_lock(
+        "1.2.0"
+    ) is not schema_files.get_validation_lock("1.3.0")
+
+    # Every schema is already compiled, the following runs must not compile again
+    def fail(*args, **kwargs):
+        raise AssertionError("schema compiled twice")
+
+    monkeypatch.setattr(schema_files.etree, "XMLSchema", fail)
+    for _ in range(2):
+        test_utils.launch_main(monkeypatch)
+
+        result = Result()
+        result.load_from_file(test_utils.REPORT_FILE_PATH)
+        assert (
+            result.get_checker_status(schema_checker.valid_schema.CHECKER_ID)
+            == StatusType.COMPLETED
+        )
+        assert (
+            len(result.get_issues_by_rule_uid("asam.net:xosc:1.0.0:xml.valid_schema"))
+            > 0
+        )
+
+    test_utils.cleanup_files()
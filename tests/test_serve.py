@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import http.client
+import json
+import os
+import socket
+import threading
+import pytest
+import test_utils
+from lxml import etree
+from qc_openscenario import serve
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str):
+        super().__init__("localhost")
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = serve.create_server(None, 0, 64, 1, str(tmp_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post_check(connection: http.client.HTTPConnection, request: dict):
+    connection.request("POST", "/check", body=json.dumps(request))
+    response = connection.getresponse()
+    return response.status, response.getheader("X-Issue-Count"), response.read()
+
+
+def get_stats(server) -> dict:
+    connection = http.client.HTTPConnection(*server.server_address)
+    connection.request("GET", "/stats")
+    return json.loads(connection.getresponse().read())
+
+
+def test_serve_check(server, monkeypatch) -> None:
+    input_file = os.path.abspath(
+        os.path.join(test_utils.SIGNAL_PATH, test_utils.SIGNAL_NEGATIVE_FILE_NAME)
+    )
+    connection = http.client.HTTPConnection(*server.server_address)
+
+    status, issue_count, report = post_check(connection, {"input_file": input_file})
+    assert status == 200
+    assert int(issue_count) == test_utils.get_issue_count(input_file, monkeypatch) > 0
+    assert etree.fromstring(report).tag == "CheckerResults"
+
+    # The document and the road network are kept for the following checks
+    assert post_check(connection, {"input_file": input_file})[1] == issue_count
+    stats = get_stats(server)
+    assert stats["checks"] == 2
+    assert stats["resident_cache"]["misses"] == 2
+    assert stats["resident_cache"]["hits"] == 2
+
+
+def test_serve_check_content(server, signal_input_file) -> None:
+    input_file = signal_input_file
+    with open(input_file, "r") as f:
+        content = f.read()
+    connection = http.client.HTTPConnection(*server.server_address)
+
+    _, issue_count, _ = post_check(connection, {"input_file": input_file})
+    assert int(issue_count) > 0
+
+    # The content is checked instead of the file, the road network is found next to it
+    fixed_content = content
+    for signal_id in etree.fromstring(content.encode()).xpath(
+        "//TrafficSignalStateAction/@name"
+    ):
+        fixed_content = fixed_content.replace(f'name="{signal_id}"', 'name="12345"')
+    status, fixed_issue_count, _ = post_check(
+        connection, {"input_file": input_file, "content": fixed_content}
+    )
+    assert status == 200
+    assert int(fixed_issue_count) == int(issue_count) - 1
+
+    # Checking again the file does not reuse the checked content
+    assert post_check(connection, {"input_file": input_file})[1] == issue_count
+
+
+def test_serve_invalid_request(server) -> None:
+    connection = http.client.HTTPConnection(*server.server_address)
+
+    status, _, body = post_check(connection, {"content": "<OpenSCENARIO/>"})
+    assert status == 400
+    assert "input_file" in json.loads(body)["error"]
+
+
+def test_serve_unix_socket(tmp_path) -> None:
+    socket_path = str(tmp_path / "qc_openscenario.sock")
+    server = serve.create_server(socket_path, None, 64, 1, str(tmp_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        status, issue_count, _ = post_check(
+            UnixHTTPConnection(socket_path),
+            {
+                "input_file": os.path.join(
+                    test_utils.SIGNAL_PATH, test_utils.SIGNAL_NEGATIVE_FILE_NAME
+                )
+            },
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert status == 200
+    assert int(issue_count) > 0
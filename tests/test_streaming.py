@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import pytest
+import test_utils
+from typing import List
+from qc_baselib import Result, StatusType
+from qc_openscenario.checks import (
+    basic_checker,
+    data_type_checker,
+    schema_checker,
+    utils,
+)
+
+
+STREAMING_RULE_UIDS = [
+    "asam.net:xosc:1.2.0:data_type.allowed_operators",
+    "asam.net:xosc:1.2.0:data_type.non_negative_transition_time_in_light_state_action",
+    "asam.net:xosc:1.2.0:data_type.positive_duration_in_phase",
+]
+
+
+def get_issue_locations(result: Result, rule_uid: str) -> List[tuple[str, str]]:
+    return [
+        (location.description, xml_location.xpath)
+        for issue in result.get_issues_by_rule_uid(rule_uid)
+        for location in issue.locations
+        for xml_location in location.xml_location
+    ]
+
+
+@pytest.mark.parametrize(
+    "target_file_path",
+    [
+        "tests/data/positive_duration_in_phase/negative_example.parameter.xosc",
+        "tests/data/transition_time_should_be_non_negative/negative_example_param.xosc",
+        "tests/data/allowed_operators/negative_example_multiple.xosc",
+    ],
+)
+def test_streaming_matches_full_tree(
+    monkeypatch,
+    target_file_path: str,
+) -> None:
+    test_utils.create_test_config(target_file_path)
+    test_utils.launch_main(monkeypatch)
+
+    full_tree_result = Result()
+    full_tree_result.load_from_file(test_utils.REPORT_FILE_PATH)
+    test_utils.cleanup_files()
+
+    test_utils.create_test_config(
+        target_file_path,
+        checker_ids=[
+            data_type_checker.allowed_operators.CHECKER_ID,
+            data_type_checker.non_negative_transition_time_in_light_state_action.CHECKER_ID,
+            data_type_checker.positive_duration_in_phase.CHECKER_ID,
+        ],
+    )
+    test_utils.launch_main(monkeypatch, ["--streaming"])
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    # Checkers needing the whole tree are not enabled and do not run
+    assert result.get_checker_status(schema_checker.valid_schema.CHECKER_ID) is None
+    assert (
+        result.get_checker_status(basic_checker.version_is_defined.CHECKER_ID)
+        == StatusType.COMPLETED
+    )
+
+    assert result.get_issue_count() > 0
+    for rule_uid in STREAMING_RULE_UIDS:
+        assert get_issue_locations(result, rule_uid) == get_issue_locations(
+            full_tree_result, rule_uid
+        )
+
+    test_utils.cleanup_files()
+
+
+def test_streaming_keeps_full_tree_for_whole_tree_checkers(
+    monkeypatch,
+) -> None:
+    target_file_path = "tests/data/valid_schema/xml.valid_schema.negative.xosc"
+
+    test_utils.create_test_config(target_file_path)
+    test_utils.launch_main(monkeypatch, ["--streaming"])
+
+    result = Result()
+    result.load_from_file(test_utils.REPORT_FILE_PATH)
+
+    assert (
+        result.get_checker_status(schema_checker.valid_schema.CHECKER_ID)
+        == StatusType.COMPLETED
+    )
+    assert (
+        len(result.get_issues_by_rule_uid("asam.net:xosc:1.0.0:xml.valid_schema")) == 1
+    )
+
+    test_utils.cleanup_files()
+
+
+def test_parse_xml_file_pruned() -> None:
+    target_file_path = (
+        "tests/data/positive_duration_in_phase/negative_example.parameter.xosc"
+    )
+    full_tree, _ = utils.parse_xml_file(target_file_path)
+    pruned_tree, error = utils.parse_xml_file_pruned(
+        target_file_path, lambda element: element.tag == "Phase"
+    )
+
+    assert error is None
+    assert len(list(pruned_tree.iter())) < len(list(full_tree.iter()))
+    assert [pruned_tree.getpath(x) for x in pruned_tree.iter("Phase")] == [
+        full_tree.getpath(x) for x in full_tree.iter("Phase")
+    ]
+    assert [x.attrib for x in pruned_tree.iter("ParameterDeclaration")] == [
+        x.attrib for x in full_tree.iter("ParameterDeclaration")
+    ]
@@ -5,19 +5,28 @@
 # with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import os
+import shutil
 import sys
 import pytest
-from typing import List
+from typing import Dict, List, Optional
 import qc_openscenario.main as main
 from qc_openscenario import constants, checks
-from qc_baselib import Configuration, Result
+from qc_baselib import Configuration, Result, IssueSeverity
 
 
 CONFIG_FILE_PATH = "bundle_config.xml"
 REPORT_FILE_PATH = "xosc_bundle_report.xqar"
 
+# Scenario referencing a road network, with issues depending on both files
+SIGNAL_PATH = "tests/data/resolvable_signal_id_in_traffic_signal_state_action"
+SIGNAL_NEGATIVE_FILE_NAME = "reference_control.resolvable_signal_id_in_traffic_signal_state_action.negative.xosc"
 
-def create_test_config(target_file_path: str):
+
+def create_test_config(
+    target_file_path: str,
+    checker_ids: Optional[List[str]] = None,
+    bundle_params: Optional[Dict[str, str]] = None,
+):
     test_config = Configuration()
     test_config.set_config_param(name="InputFile", value=target_file_path)
     test_config.register_checker_bundle(checker_bundle_name=constants.BUNDLE_NAME)
@@ -26,15 +35,26 @@ def create_test_config(target_file_path: str):
         name="resultFile",
         value=REPORT_FILE_PATH,
     )
+    for name, value in (bundle_params or {}).items():
+        test_config.set_checker_bundle_param(
+            checker_bundle_name=constants.BUNDLE_NAME, name=name, value=value
+        )
+    for checker_id in checker_ids or []:
+        test_config.register_checker(
+            checker_bundle_name=constants.BUNDLE_NAME,
+            checker_id=checker_id,
+            min_level=IssueSeverity.INFORMATION,
+            max_level=IssueSeverity.ERROR,
+        )
 
     test_config.write_to_file(CONFIG_FILE_PATH)
 
 
-def launch_main(monkeypatch):
+def launch_main(monkeypatch, extra_args: Optional[List[str]] = None):
     monkeypatch.setattr(
         sys,
         "argv",
-        ["main.py", "-c", CONFIG_FILE_PATH, "--generate_markdown"],
+        ["main.py", "-c", CONFIG_FILE_PATH, "--generate_markdown"] + (extra_args or []),
     )
     main.main()
 
@@ -42,3 +62,32 @@ def launch_main(monkeypatch):
 def cleanup_files():
     os.remove(REPORT_FILE_PATH)
     os.remove(CONFIG_FILE_PATH)
+
+
+def copy_signal_negative_file(tmp_path) -> str:
+    """Copy the files of SIGNAL_PATH to tmp_path, so that tests can change them
+
+    Returns:
+        str: the path of the copy of the negative scenario
+    """
+    shutil.copytree(SIGNAL_PATH, tmp_path / "data")
+    return str(tmp_path / "data" / SIGNAL_NEGATIVE_FILE_NAME)
+
+
+def replace_in_file(path: str, old: str, new: str) -> None:
+    with open(path, "r") as f:
+        content = f.read()
+    with open(path, "w") as f:
+        f.write(content.replace(old, new))
+
+
+def get_issue_count(target_file_path: str, monkeypatch) -> int:
+    """Number of issues of a default run of the bundle on target_file_path"""
+    create_test_config(target_file_path)
+    launch_main(monkeypatch)
+
+    result = Result()
+    result.load_from_file(REPORT_FILE_PATH)
+    cleanup_files()
+
+    return result.get_issue_count()
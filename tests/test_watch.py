@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2024, ASAM e.V.
+# This Source Code Form is subject to the terms of the Mozilla
+# Public License, v. 2.0. If a copy of the MPL was not distributed
+# with this file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import os
+import threading
+import time
+import test_utils
+from qc_baselib import Configuration, Result
+from qc_openscenario import constants
+from qc_openscenario import main
+from qc_openscenario import watch
+from qc_openscenario.checks import registry
+from qc_openscenario.checks.reference_checker import (
+    uniquely_resolvable_entity_references,
+)
+
+
+def create_config(input_file: str) -> Configuration:
+    config = Configuration()
+    config.set_config_param(name="InputFile", value=input_file)
+    config.register_checker_bundle(checker_bundle_name=constants.BUNDLE_NAME)
+    return config
+
+
+def read_report(result: Result, report_path: str) -> bytes:
+    result.write_to_file(report_path, generate_summary=True)
+    with open(report_path, "rb") as report_file:
+        return report_file.read()
+
+
+def wait_for_issue_count(report_path: str, issue_count: int) -> None:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if os.path.exists(report_path):
+            result = Result()
+            result.load_from_file(report_path)
+            if result.get_issue_count() == issue_count:
+                return
+        time.sleep(0.01)
+
+    raise AssertionError(f"The report never got {issue_count} issue(s)")
+
+
+def test_road_network_checker_ids() -> None:
+    checkers = registry.load_checkers()
+
+    assert watch.get_road_network_checker_ids(checkers) == {
+        "check_asam_xosc_reference_control_resolvable_signal_id_in_traffic_signal_state_action"
+    }
+
+
+def test_incremental_road_network_check(
+    signal_input_file, tmp_path, monkeypatch
+) -> None:
+    xodr_file = os.path.join(os.path.dirname(signal_input_file), "test.xodr")
+    config = create_config(signal_input_file)
+    check = watch.IncrementalCheck(config)
+    issue_count = check.check_all().get_issue_count()
+
+    # Only the checkers reading the road network run again
+    test_utils.replace_in_file(xodr_file, 'id="12345"', 'id="12346"')
+    monkeypatch.setattr(uniquely_resolvable_entity_references, "check_rule", None)
+    result = check.check_road_network()
+    assert result.get_issue_count() == issue_count - 1
+    report = read_report(result, str(tmp_path / "incremental.xqar"))
+    monkeypatch.undo()
+
+    # Same report as a full run
+    assert report == read_report(
+        main.check_input_file(create_config(signal_input_file)),
+        str(tmp_path / "full.xqar"),
+    )
+
+
+def test_watch_input_file(signal_input_file, tmp_path) -> None:
+    xodr_file = os.path.join(os.path.dirname(signal_input_file), "test.xodr")
+    report_path = str(tmp_path / "report.xqar")
+    issue_count = main.check_input_file(
+        create_config(signal_input_file)
+    ).get_issue_count()
+
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=watch.watch_input_file,
+        args=(create_config(signal_input_file), report_path),
+        kwargs={"stop_event": stop_event},
+    )
+    thread.start()
+    try:
+        wait_for_issue_count(report_path, issue_count)
+
+        test_utils.replace_in_file(xodr_file, 'id="12345"', 'id="12346"')
+        wait_for_issue_count(report_path, issue_count - 1)
+
+        test_utils.replace_in_file(signal_input_file, 'name="12346"', 'name="12347"')
+        wait_for_issue_count(report_path, issue_count)
+    finally:
+        stop_event.set()
+        thread.join()